@@ -1,8 +1,17 @@
 import os
+import time
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, g, jsonify, request
 from flask_cors import CORS
 
+from app.services.vintage_service import data_version, pin_snapshot, start_reloader, unpin_snapshot
+from app.services.warmup import WarmupState, start_warmup
+from app.utils import metrics
+from app.utils.profiler import install_profiler
+from app.utils.response_cache import BoundedResponseCache, ResponseCache
+from app.utils.server_timing import header_value, is_warmup_request, phase
+from app.utils.static_assets import build_static_manifest, send_static_asset
+
 
 def _read_cors_origins():
     raw = os.environ.get("CORS_ORIGINS", "*")
@@ -10,15 +19,25 @@ def _read_cors_origins():
     return origins if origins else ["*"]
 
 
-def _compute_data_version():
-    data_root = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-    paths = [
-        os.path.join(data_root, "vintage", "vintage_data.json"),
-        os.path.join(data_root, "geojson", "wine_regions.geojson"),
-    ]
-    mtimes = [os.path.getmtime(path) for path in paths if os.path.exists(path)]
-    latest = max(mtimes, default=0)
-    return str(int(latest))
+def _read_reload_interval():
+    try:
+        return float(os.environ.get("DATA_RELOAD_INTERVAL", "0"))
+    except ValueError:
+        return 0.0
+
+
+def _read_geometry_cache_bytes():
+    try:
+        return int(float(os.environ.get("GEOMETRY_CACHE_MB", "128")) * 1024 * 1024)
+    except ValueError:
+        return 128 * 1024 * 1024
+
+
+def _read_warmup_mode():
+    """`background` (default) warms on a thread at startup, `manual` leaves it to the
+    caller (gunicorn.conf.py warms in the master), `off` skips it."""
+    mode = os.environ.get("WARMUP", "background").strip().lower()
+    return mode if mode in ("background", "manual", "off") else "background"
 
 
 def create_app():
@@ -26,52 +45,106 @@ def create_app():
     app = Flask(__name__, static_folder=static_dir)
     cors_origins = _read_cors_origins()
     CORS(app, resources={r"/api/*": {"origins": cors_origins if cors_origins != ["*"] else "*"}})
-    data_version = _compute_data_version()
+    app.extensions["response_cache"] = ResponseCache()
+    app.extensions["geometry_cache"] = BoundedResponseCache(_read_geometry_cache_bytes())
+    app.extensions["warmup"] = WarmupState()
+    static_manifest = build_static_manifest(static_dir)
+
+    reload_interval = _read_reload_interval()
+    if reload_interval > 0:
+        start_reloader(reload_interval)
 
     from app.routes.vintage import vintage_bp
     from app.routes.regions import regions_bp
     from app.routes.recommend import recommend_bp
+    from app.routes.tiles import tiles_bp
 
     app.register_blueprint(vintage_bp, url_prefix="/api")
     app.register_blueprint(regions_bp, url_prefix="/api")
     app.register_blueprint(recommend_bp, url_prefix="/api")
+    app.register_blueprint(tiles_bp, url_prefix="/api")
 
     @app.route("/api/health")
     def health():
         return jsonify({"status": "ok"})
 
+    @app.route("/api/ready")
+    def ready():
+        """200 once the data is loaded and the hot caches are primed, 503 until then."""
+        warmup = app.extensions["warmup"]
+        if warmup.ready.is_set():
+            return jsonify({
+                "status": "ready", "data_version": warmup.data_version, "warmup_ms": warmup.duration_ms,
+            })
+        if warmup.error is not None:
+            return jsonify({"status": "error", "error": warmup.error}), 503
+        return jsonify({"status": "warming"}), 503
+
+    @app.route("/api/metrics")
+    def prometheus_metrics():
+        """Request, cache and reload metrics summed across all workers."""
+        return app.response_class(metrics.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+    profile_dir = os.environ.get("PROFILE_DIR")
+    if profile_dir:
+        install_profiler(app, profile_dir)
+
+    # Endpoints that never touch the data and are never cached.
+    uncached_paths = ("/api/health", "/api/ready", "/api/metrics")
+
     @app.before_request
-    def maybe_return_not_modified():
-        if request.method != "GET":
-            return None
-        if not request.path.startswith("/api/") or request.path == "/api/health":
-            return None
-        if request.if_none_match.contains(data_version):
-            response = app.response_class(status=304)
-            response.set_etag(data_version)
-            response.headers["Cache-Control"] = "public, max-age=300, stale-while-revalidate=3600"
-            return response
-        return None
+    def pin_data_snapshot():
+        g.request_start = time.perf_counter()
+        if request.path.startswith("/api/") and request.path not in uncached_paths:
+            with phase("data"):
+                token = pin_snapshot()
+            if token is not None:
+                g.snapshot_token = token
+                g.data_version = data_version()
+
+    @app.teardown_request
+    def release_data_snapshot(exc):
+        unpin_snapshot(g.pop("snapshot_token", None))
 
     @app.after_request
     def add_api_cache_headers(response):
-        if request.path == "/api/health":
+        if request.path in uncached_paths:
             response.headers["Cache-Control"] = "no-store"
             return response
         if request.path.startswith("/api/") and request.method == "GET":
-            response.set_etag(data_version)
-            response.headers["Cache-Control"] = "public, max-age=300, stale-while-revalidate=3600"
-            response.headers["X-Data-Version"] = data_version
+            # ETags are per-resource content hashes set by cached_json.
+            response.headers.setdefault("Cache-Control", "public, max-age=300, stale-while-revalidate=3600")
+            if "data_version" in g:
+                response.headers["X-Data-Version"] = g.data_version
         return response
 
+    @app.after_request
+    def record_request_timing(response):
+        if not request.path.startswith("/api/") or "request_start" not in g:
+            return response
+        if is_warmup_request():
+            return response
+        elapsed = time.perf_counter() - g.request_start
+        response.headers["Server-Timing"] = header_value(elapsed)
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.observe("vintage_http_request_duration_seconds", elapsed, {"route": route})
+        metrics.inc("vintage_http_requests_total", {
+            "route": route, "method": request.method, "status": str(response.status_code),
+        })
+        return response
+
+    warmup_mode = _read_warmup_mode()
+    if warmup_mode == "background":
+        start_warmup(app)
+    elif warmup_mode == "off":
+        app.extensions["warmup"].ready.set()
+
     @app.route("/", defaults={"path": ""})
     @app.route("/<path:path>")
     def serve_frontend(path):
         # Don't catch unmatched /api/* routes — return JSON 404 instead of the SPA.
         if path.startswith("api/"):
             return jsonify({"error": f"Not found: /{path}"}), 404
-        if path and os.path.exists(os.path.join(static_dir, path)):
-            return send_from_directory(static_dir, path)
-        return send_from_directory(static_dir, "index.html")
+        return send_static_asset(static_manifest, path)
 
     return app
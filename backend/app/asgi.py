@@ -0,0 +1,168 @@
+"""ASGI adapter for the Flask app, for running under an async server (uvicorn).
+
+The event loop owns the sockets: request bodies are read and responses written
+asynchronously, so a slow client costs an idle coroutine instead of a whole
+worker. Only the route handler runs in a bounded thread pool, where it shares the
+process's data snapshot, response cache and tile cache with every other request.
+Each chunk the WSGI app yields is sent as soon as it is produced, with the pool
+thread waiting for the send (so a slow reader applies backpressure rather than
+being buffered for), and a client that disconnects stops the iteration and frees
+the thread; a handler that hasn't started by then is skipped.
+Routes are not duplicated: both entry points serve the same blueprints, so the
+/api/* contract cannot drift between them.
+"""
+import asyncio
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app import create_app
+
+
+def _read_threads():
+    try:
+        return max(1, int(os.environ.get("ASGI_THREADS", "")))
+    except ValueError:
+        return min(32, (os.cpu_count() or 1) + 4)
+
+
+def create_asgi_app(wsgi_app=None, threads=None):
+    wsgi_app = wsgi_app or create_app()
+    executor = ThreadPoolExecutor(max_workers=threads or _read_threads(), thread_name_prefix="asgi-handler")
+
+    async def app(scope, receive, send):
+        if scope["type"] == "lifespan":
+            await _lifespan(receive, send, executor)
+            return
+        if scope["type"] != "http":
+            return
+        disconnected = threading.Event()
+        body = await _read_body(receive, disconnected)
+        loop = asyncio.get_running_loop()
+
+        def send_from_thread(message):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        watcher = asyncio.ensure_future(_watch_disconnect(receive, disconnected))
+        try:
+            await loop.run_in_executor(
+                executor, _call_wsgi, wsgi_app, _environ(scope, body), send_from_thread, disconnected
+            )
+        finally:
+            watcher.cancel()
+
+    app.wsgi_app = wsgi_app
+    return app
+
+
+async def _lifespan(receive, send, executor):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            executor.shutdown(wait=False)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def _read_body(receive, disconnected):
+    parts = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            disconnected.set()
+            break
+        parts.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    return b"".join(parts)
+
+
+async def _watch_disconnect(receive, disconnected):
+    if disconnected.is_set():
+        return
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            disconnected.set()
+            return
+
+
+def _environ(scope, body):
+    """PEP 3333 environ for an ASGI HTTP scope."""
+    root_path = scope.get("root_path", "")
+    path = scope["path"]
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": root_path.encode("utf-8").decode("latin-1"),
+        "PATH_INFO": path.encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "REMOTE_PORT": str(client[1]),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        key = name if name in ("CONTENT_TYPE", "CONTENT_LENGTH") else f"HTTP_{name}"
+        value = raw_value.decode("latin-1")
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+def _call_wsgi(wsgi_app, environ, send, disconnected):
+    """Run the WSGI app on a pool thread, passing each ASGI message to `send` (which
+    blocks until the event loop has sent it). Stops early once `disconnected` is set."""
+    if disconnected.is_set():
+        return
+    started = {}
+
+    def send_start():
+        if not started.pop("pending", False):
+            return
+        send({"type": "http.response.start", "status": started["status"], "headers": started["headers"]})
+
+    def write(chunk):
+        send_start()
+        if chunk and not disconnected.is_set():
+            send({"type": "http.response.body", "body": chunk, "more_body": True})
+
+    def start_response(status, headers, exc_info=None):
+        if exc_info and started and not started.get("pending"):
+            raise exc_info[1].with_traceback(exc_info[2])
+        started["status"] = int(status.split(" ", 1)[0])
+        started["headers"] = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers]
+        started["pending"] = True
+        return write
+
+    result = wsgi_app(environ, start_response)
+    last = b""
+    try:
+        # Hold back one chunk so the final one goes out with more_body=False.
+        for chunk in result:
+            if disconnected.is_set():
+                return
+            if chunk:
+                write(last)
+                last = chunk
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+    send_start()
+    if not disconnected.is_set():
+        send({"type": "http.response.body", "body": last, "more_body": False})
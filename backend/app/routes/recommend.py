@@ -1,10 +1,13 @@
 from flask import Blueprint, jsonify, request
 
-from app.services.recommendation import recommend
+from app.services.recommendation import recommend, recommend_range
 from app.services.vintage_service import get_year_range, DataUnavailableError
+from app.utils.response_cache import cached_json, json_with_etag
 
 recommend_bp = Blueprint("recommend", __name__)
 
+MAX_RANGE_RESULTS = 50
+
 VALID_SIGNIFICANCES = [
     "birthday", "anniversary", "wedding",
     "graduation", "retirement", "memorial", "other", "gift",
@@ -29,6 +32,35 @@ def get_recommendation():
         significance = "other"
 
     try:
-        return jsonify(recommend(year, significance))
+        return cached_json(("recommend", year, significance), lambda: recommend(year, significance))
+    except DataUnavailableError as e:
+        return jsonify({"error": str(e)}), 503
+
+
+@recommend_bp.route("/recommend/range")
+def get_range_recommendation():
+    """Top-k region-years for an occasion across a span of years."""
+    start = request.args.get("from", type=int)
+    end = request.args.get("to", type=int)
+    significance = request.args.get("significance", "other")
+    k = request.args.get("k", 5, type=int)
+
+    if not start or not end:
+        return jsonify({"error": "from and to parameters are required."}), 400
+    if start > end:
+        return jsonify({"error": "from must not be after to."}), 400
+    if not 1 <= k <= MAX_RANGE_RESULTS:
+        return jsonify({"error": f"k must be between 1 and {MAX_RANGE_RESULTS}."}), 400
+
+    if significance not in VALID_SIGNIFICANCES:
+        significance = "other"
+
+    try:
+        yr = get_year_range()
+        if start < yr["min_year"] or end > yr["max_year"]:
+            return jsonify({
+                "error": f"Years must be between {yr['min_year']} and {yr['max_year']}."
+            }), 400
+        return json_with_etag(recommend_range(start, end, significance, k))
     except DataUnavailableError as e:
         return jsonify({"error": str(e)}), 503
@@ -1,18 +1,127 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 
-from app.services.vintage_service import get_regions_geojson_with_vintage, get_year_range, DataUnavailableError
+from app.services.geometry import resolve_level
+from app.services.vintage_service import (
+    get_geometry_version, get_region_geometry, get_region_scores, get_region_series, get_regions_at,
+    get_regions_geojson_with_vintage, get_year_range, DataUnavailableError,
+)
+from app.utils.response_cache import cached_json, json_with_etag
 
 regions_bp = Blueprint("regions", __name__)
 
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _parse_bbox(raw):
+    """`min_lng,min_lat,max_lng,max_lat` -> tuple, or None if malformed."""
+    try:
+        bbox = tuple(float(part) for part in raw.split(","))
+    except ValueError:
+        return None
+    if len(bbox) != 4 or not (-90 <= bbox[1] <= bbox[3] <= 90):
+        return None
+    return bbox
+
+
+def _requested_zoom():
+    return resolve_level(
+        zoom=request.args.get("zoom", type=int),
+        tolerance=request.args.get("tolerance", type=float),
+    )
+
 
 @regions_bp.route("/regions/<int:year>")
 def regions_with_vintage(year):
+    """Regions GeoJSON for a year. Optional `zoom` (0-12) or `tolerance` (degrees)
+    selects simplified, coordinate-quantized geometry sized for that map scale, and
+    `bbox=min_lng,min_lat,max_lng,max_lat` keeps only regions in that viewport."""
+    zoom = _requested_zoom()
+    bbox = None
+    if "bbox" in request.args:
+        bbox = _parse_bbox(request.args["bbox"])
+        if bbox is None:
+            return jsonify({"error": "bbox must be min_lng,min_lat,max_lng,max_lat."}), 400
     try:
         yr = get_year_range()
         if year < yr["min_year"] or year > yr["max_year"]:
             return jsonify({
                 "error": f"Year must be between {yr['min_year']} and {yr['max_year']}."
             }), 400
-        return jsonify(get_regions_geojson_with_vintage(year))
+        if bbox is not None:
+            return json_with_etag(get_regions_geojson_with_vintage(year, zoom, bbox))
+        return cached_json(
+            ("regions", year, zoom), lambda: get_regions_geojson_with_vintage(year, zoom), cache="geometry",
+        )
+    except DataUnavailableError as e:
+        return jsonify({"error": str(e)}), 503
+
+
+@regions_bp.route("/regions/geometry")
+def region_geometry():
+    """Static region shapes and properties. The body's `version` can be used with
+    /regions/geometry/<version> for an immutable, long-cached copy."""
+    zoom = _requested_zoom()
+    try:
+        return cached_json(("geometry", zoom), lambda: get_region_geometry(zoom), cache="geometry")
+    except DataUnavailableError as e:
+        return jsonify({"error": str(e)}), 503
+
+
+@regions_bp.route("/regions/geometry/<version>")
+def region_geometry_versioned(version):
+    zoom = _requested_zoom()
+    try:
+        if version != get_geometry_version():
+            return jsonify({"error": "Geometry version is no longer current."}), 404
+        response = cached_json(("geometry", zoom), lambda: get_region_geometry(zoom), cache="geometry")
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+    except DataUnavailableError as e:
+        return jsonify({"error": str(e)}), 503
+
+
+@regions_bp.route("/regions/<int:year>/scores")
+def region_scores(year):
+    """Score and tier-code arrays for a year, in /regions/geometry feature order."""
+    try:
+        yr = get_year_range()
+        if year < yr["min_year"] or year > yr["max_year"]:
+            return jsonify({
+                "error": f"Year must be between {yr['min_year']} and {yr['max_year']}."
+            }), 400
+        return cached_json(("scores", year), lambda: get_region_scores(year))
+    except DataUnavailableError as e:
+        return jsonify({"error": str(e)}), 503
+
+
+@regions_bp.route("/regions/at")
+def regions_at():
+    """Regions containing the point `lat`/`lng`, with the vintage for `year`."""
+    lat = request.args.get("lat", type=float)
+    lng = request.args.get("lng", type=float)
+    year = request.args.get("year", type=int)
+    if lat is None or lng is None or not year:
+        return jsonify({"error": "lat, lng and year parameters are required."}), 400
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        return jsonify({"error": "lat must be within [-90, 90] and lng within [-180, 180]."}), 400
+    try:
+        yr = get_year_range()
+        if year < yr["min_year"] or year > yr["max_year"]:
+            return jsonify({
+                "error": f"Year must be between {yr['min_year']} and {yr['max_year']}."
+            }), 400
+        return json_with_etag(get_regions_at(lng, lat, year))
+    except DataUnavailableError as e:
+        return jsonify({"error": str(e)}), 503
+
+
+@regions_bp.route("/region/<region_key>/series")
+def region_series(region_key):
+    """A region's full score history with percentile ranks, rolling 5- and 10-year
+    averages, and its best and worst years."""
+    try:
+        if get_region_series(region_key) is None:
+            return jsonify({"error": f"Unknown region: {region_key}"}), 404
+        return cached_json(("series", region_key), lambda: get_region_series(region_key))
     except DataUnavailableError as e:
         return jsonify({"error": str(e)}), 503
@@ -0,0 +1,29 @@
+from flask import Blueprint, jsonify
+
+from app.services.vector_tiles import MAX_ZOOM, render_tile
+from app.services.vintage_service import get_year_range, DataUnavailableError
+from app.utils.response_cache import negotiated_response
+
+tiles_bp = Blueprint("tiles", __name__)
+
+MVT_MIMETYPE = "application/vnd.mapbox-vector-tile"
+
+
+@tiles_bp.route("/tiles/<int:year>/<int:z>/<int:x>/<int:y>.mvt")
+def vector_tile(year, z, x, y):
+    """One Mapbox Vector Tile with a `regions` layer carrying that year's score and tier."""
+    if z > MAX_ZOOM:
+        return jsonify({"error": f"Zoom must be between 0 and {MAX_ZOOM}."}), 400
+    if x >= 2 ** z or y >= 2 ** z:
+        return jsonify({"error": f"Tile {z}/{x}/{y} does not exist."}), 404
+    try:
+        yr = get_year_range()
+        if year < yr["min_year"] or year > yr["max_year"]:
+            return jsonify({
+                "error": f"Year must be between {yr['min_year']} and {yr['max_year']}."
+            }), 400
+        tile = render_tile(year, z, x, y)
+    except DataUnavailableError as e:
+        return jsonify({"error": str(e)}), 503
+
+    return negotiated_response(tile, MVT_MIMETYPE)
@@ -1,10 +1,62 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 
-from app.services.vintage_service import get_vintage_by_year, get_year_range, get_year_report, DataUnavailableError
+from app.services.vintage_service import (
+    get_vintage_by_year, get_vintage_matrix, get_year_range, get_year_report, DataUnavailableError,
+)
+from app.utils.response_cache import cached_json, json_with_etag
 
 vintage_bp = Blueprint("vintage", __name__)
 
 
+MAX_BATCH_YEARS = 200
+
+
+def _parse_years(raw):
+    """`1990-2000`, `1982,1990,2000` or a mix -> ordered unique years, or None if
+    malformed or longer than MAX_BATCH_YEARS."""
+    years = []
+    seen = set()
+    try:
+        for part in raw.split(","):
+            start, sep, end = part.strip().partition("-")
+            start = int(start)
+            end = int(end) if sep else start
+            if end - start >= MAX_BATCH_YEARS:
+                return None
+            for y in range(start, end + 1):
+                if y not in seen:
+                    seen.add(y)
+                    years.append(y)
+            if len(years) > MAX_BATCH_YEARS:
+                return None
+    except ValueError:
+        return None
+    return years or None
+
+
+@vintage_bp.route("/vintage")
+def vintage_batch():
+    """Region x year score and tier matrix for `years` (a range like 1990-2000
+    and/or a comma-separated list), for timelines and year sliders."""
+    years = _parse_years(request.args.get("years", ""))
+    if years is None:
+        return jsonify({
+            "error": f"years must be a range like 1990-2000 or a list like 1982,1990,2000 (at most {MAX_BATCH_YEARS} years)."
+        }), 400
+    try:
+        yr = get_year_range()
+        if min(years) < yr["min_year"] or max(years) > yr["max_year"]:
+            return jsonify({
+                "error": f"Years must be between {yr['min_year']} and {yr['max_year']}."
+            }), 400
+        # A contiguous ascending range has a small, fixed key space; arbitrary lists do not.
+        if years == list(range(years[0], years[-1] + 1)):
+            return cached_json(("vintage-matrix", years[0], years[-1]), lambda: get_vintage_matrix(years))
+        return json_with_etag(get_vintage_matrix(years))
+    except DataUnavailableError as e:
+        return jsonify({"error": str(e)}), 503
+
+
 @vintage_bp.route("/vintage/<int:year>")
 def vintage(year):
     try:
@@ -13,7 +65,7 @@ def vintage(year):
             return jsonify({
                 "error": f"Year must be between {yr['min_year']} and {yr['max_year']}."
             }), 400
-        return jsonify(get_vintage_by_year(year))
+        return cached_json(("vintage", year), lambda: get_vintage_by_year(year))
     except DataUnavailableError as e:
         return jsonify({"error": str(e)}), 503
 
@@ -31,7 +83,7 @@ def vintage_report(year):
             return jsonify({
                 "error": f"Year must be between {yr['min_year']} and {yr['max_year']}."
             }), 400
-        return jsonify(get_year_report(year))
+        return cached_json(("report", year), lambda: get_year_report(year))
     except DataUnavailableError as e:
         return jsonify({"error": str(e)}), 503
 
@@ -39,6 +91,6 @@ def vintage_report(year):
 @vintage_bp.route("/year-range")
 def year_range():
     try:
-        return jsonify(get_year_range())
+        return cached_json(("year-range",), get_year_range)
     except DataUnavailableError as e:
         return jsonify({"error": str(e)}), 503
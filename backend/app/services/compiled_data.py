@@ -0,0 +1,174 @@
+"""Compiled runtime artifact of the vintage and GeoJSON data.
+
+The build step validates both datasets (see data_schema.py), then builds
+everything the service derives from them: the per-year index, score matrix,
+region series, simplified geometry levels and spatial index. All of it is
+pickled as one payload behind a fixed header:
+
+    magic (8s) | format (H) | source version (8s) | builder version (8s) |
+    payload checksum (16s) | payload length (Q)
+
+Loading it is a checksum and an unpickle, with no per-record work. The
+source version is the same content hash the service uses as its data version,
+and the builder version hashes the source of the modules that build and define
+the payload, so a snapshot built from older JSON or by older code is detected
+as stale and ignored (the service then validates and derives in-process, as the
+build does). A payload that still fails to unpickle is treated the same way.
+
+Rebuild it with `python data/vintage/compile_snapshot.py`.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import struct
+
+from app.services import data_schema, geometry, region_series, score_matrix, spatial_index
+from app.services.data_schema import validate_geojson, validate_vintage_data
+from app.services.geometry import build_geometry_levels
+from app.services.region_series import build_region_series
+from app.services.score_matrix import build_score_matrix
+from app.services.spatial_index import build_spatial_index
+
+log = logging.getLogger(__name__)
+
+# VINTAGE_DATA_DIR points the app at another dataset with the same layout, e.g.
+# one written by data/vintage/generate_synthetic_data.py.
+DATA_DIR = os.environ.get("VINTAGE_DATA_DIR") or os.path.join(os.path.dirname(__file__), "..", "..", "data")
+VINTAGE_PATH = os.path.join(DATA_DIR, "vintage", "vintage_data.json")
+GEOJSON_PATH = os.path.join(DATA_DIR, "geojson", "wine_regions.geojson")
+COMPILED_PATH = os.path.join(DATA_DIR, "vintage_map.snapshot")
+
+MAGIC = b"VMAPSNAP"
+FORMAT_VERSION = 3
+_HEADER = struct.Struct(">8sH8s8s16sQ")
+
+
+def source_version(vintage_raw, geojson_raw=None):
+    """Content hash of the raw source files; doubles as the public data version."""
+    digest = hashlib.blake2b(vintage_raw, digest_size=8)
+    if geojson_raw is not None:
+        digest.update(geojson_raw)
+    return digest.hexdigest()
+
+
+def _builder_version():
+    """Hash of the source of every module that builds or defines the pickled payload."""
+    digest = hashlib.blake2b(digest_size=8)
+    for path in (__file__, *(m.__file__ for m in (data_schema, geometry, region_series, score_matrix, spatial_index))):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+BUILDER_VERSION = _builder_version()
+
+
+def _build_year_index(data):
+    """Group merged region rows by year, preserving region order within each year."""
+    index = {}
+    for region_key, region in data["regions"].items():
+        for year_str, vintage in region["vintages"].items():
+            index.setdefault(int(year_str), []).append({
+                "region_key": region_key,
+                "display_name": region["display_name"],
+                "country": region["country"],
+                "wine_style": region["wine_style"],
+                "primary_grapes": region["primary_grapes"],
+                **vintage,
+            })
+    return index
+
+
+def build_runtime_data(vintage_data, geojson_data, eager_geometry=False):
+    """Everything the service derives from validated data, keyed by DataSnapshot field.
+    Geometry levels are simplified on first use unless `eager_geometry`."""
+    score_matrix = build_score_matrix(vintage_data)
+    has_geojson = geojson_data is not None
+    return {
+        "vintage_data": vintage_data,
+        "year_index": _build_year_index(vintage_data),
+        "score_matrix": score_matrix,
+        "region_series": build_region_series(vintage_data, score_matrix),
+        "geojson_data": geojson_data,
+        "geometry_levels": build_geometry_levels(geojson_data, eager_geometry) if has_geojson else None,
+        "feature_rows": score_matrix.rows_for(
+            [f["properties"]["region_key"] for f in geojson_data["features"]]
+        ) if has_geojson else None,
+        "spatial_index": build_spatial_index(geojson_data) if has_geojson else None,
+    }
+
+
+def write_compiled(runtime_data, version, path=COMPILED_PATH):
+    payload = pickle.dumps(runtime_data, protocol=5)
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        bytes.fromhex(version),
+        bytes.fromhex(BUILDER_VERSION),
+        hashlib.blake2b(payload, digest_size=16).digest(),
+        len(payload),
+    )
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def read_compiled(expected_version, path=COMPILED_PATH):
+    """Return the build_runtime_data dict from the snapshot, or None if it is
+    missing, corrupt, from another format version, or built from other sources or
+    by other code."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return None
+
+    if len(raw) < _HEADER.size:
+        log.warning(f"Compiled data snapshot is truncated: {path}")
+        return None
+    magic, fmt, version, builder, checksum, length = _HEADER.unpack_from(raw)
+    if magic != MAGIC or fmt != FORMAT_VERSION:
+        log.warning(f"Compiled data snapshot has an unknown format: {path}")
+        return None
+    if version.hex() != expected_version:
+        log.info("Compiled data snapshot is stale; falling back to JSON")
+        return None
+    if builder.hex() != BUILDER_VERSION:
+        log.info("Compiled data snapshot was built by other code; falling back to JSON")
+        return None
+
+    payload = memoryview(raw)[_HEADER.size:]
+    if len(payload) != length or hashlib.blake2b(payload, digest_size=16).digest() != checksum:
+        log.warning(f"Compiled data snapshot failed its checksum: {path}")
+        return None
+    try:
+        return pickle.loads(payload)
+    except Exception:
+        log.exception(f"Compiled data snapshot failed to load; falling back to JSON: {path}")
+        return None
+
+
+def compile_from_sources(vintage_path=VINTAGE_PATH, geojson_path=GEOJSON_PATH, path=COMPILED_PATH):
+    """Validate the source files and write the snapshot. Returns the data version;
+    raises DataValidationError (writing nothing) when either file breaks the schema."""
+    with open(vintage_path, "rb") as f:
+        vintage_raw = f.read()
+    geojson_raw = None
+    if os.path.exists(geojson_path):
+        with open(geojson_path, "rb") as f:
+            geojson_raw = f.read()
+
+    version = source_version(vintage_raw, geojson_raw)
+    vintage_data = json.loads(vintage_raw)
+    validate_vintage_data(vintage_data)
+    geojson_data = None
+    if geojson_raw is not None:
+        geojson_data = json.loads(geojson_raw)
+        validate_geojson(geojson_data)
+    write_compiled(build_runtime_data(vintage_data, geojson_data, eager_geometry=True), version, path)
+    return version
+
@@ -0,0 +1,186 @@
+"""Schema of vintage_data.json and the rules for its derived fields.
+
+`quality_tier` and `drinking_window` are derived, never authored: the region
+sources hold a score per vintage and a longevity per region, and
+data/vintage/build.py fills both fields in from the rules below (drinking windows
+as of the dataset's `drinking_window_as_of` year). Compiling the snapshot
+validates the built file against the same rules, so data the API can't serve
+correctly fails the build rather than a request.
+"""
+import re
+
+from app.services.score_matrix import TIERS
+
+# (minimum score, tier), best first; anything below the last floor is "poor".
+TIER_FLOORS = ((90, "outstanding"), (80, "excellent"), (70, "good"), (60, "average"))
+# Each window needs a label in recommendation._build_detail and the frontend's drinking-window maps.
+DRINKING_WINDOWS = ("young", "ready", "at_peak", "mature", "past_peak")
+# Age at which a vintage moves out of each window but the last, by region longevity.
+LONGEVITY_AGES = {
+    "short": (2, 5, 10, 20),
+    "medium": (3, 10, 20, 35),
+    "long": (5, 15, 30, 50),
+}
+DERIVED_FIELDS = ("quality_tier", "drinking_window")
+
+_REGION_TYPES = {
+    "display_name": str, "country": str, "primary_grapes": list, "wine_style": str, "longevity": str, "vintages": dict,
+}
+_SOURCE_VINTAGE_TYPES = {"score": int, "description": str, "notable_wines": list}
+_VINTAGE_TYPES = {**_SOURCE_VINTAGE_TYPES, "quality_tier": str, "drinking_window": str}
+_REGION_KEY = re.compile(r"^[a-z0-9_]+$")
+_YEAR = re.compile(r"^[12][0-9]{3}$")
+_MAX_REPORTED = 25
+
+
+class DataValidationError(ValueError):
+    """The data breaks the schema; `problems` lists every violation found."""
+
+    def __init__(self, problems):
+        self.problems = problems
+        shown = "\n  ".join(problems[:_MAX_REPORTED])
+        more = f"\n  ... and {len(problems) - _MAX_REPORTED} more" if len(problems) > _MAX_REPORTED else ""
+        super().__init__(f"{len(problems)} problem(s):\n  {shown}{more}")
+
+
+def quality_tier(score):
+    for floor, tier in TIER_FLOORS:
+        if score >= floor:
+            return tier
+    return "poor"
+
+
+def drinking_window(year, longevity, as_of):
+    age = as_of - year
+    for limit, window in zip(LONGEVITY_AGES[longevity], DRINKING_WINDOWS):
+        if age < limit:
+            return window
+    return DRINKING_WINDOWS[-1]
+
+
+def derive_region(region, as_of):
+    """Copy of a source region with the derived vintage fields filled in."""
+    longevity = region["longevity"]
+    return {
+        **region,
+        "vintages": {
+            year: {
+                **vintage,
+                "quality_tier": quality_tier(vintage["score"]),
+                "drinking_window": drinking_window(int(year), longevity, as_of),
+            }
+            for year, vintage in region["vintages"].items()
+        },
+    }
+
+
+def _check_fields(where, obj, types, problems):
+    if not isinstance(obj, dict):
+        problems.append(f"{where}: expected an object")
+        return False
+    for field, kind in types.items():
+        value = obj.get(field)
+        if value is None:
+            problems.append(f"{where}: missing `{field}`")
+        elif not isinstance(value, kind) or isinstance(value, bool):
+            problems.append(f"{where}: `{field}` must be {kind.__name__}, got {type(value).__name__}")
+        elif kind is str and not value.strip():
+            problems.append(f"{where}: `{field}` is empty")
+        elif kind is list and not all(isinstance(item, str) and item.strip() for item in value):
+            problems.append(f"{where}: `{field}` must be a list of non-empty strings")
+    for field in sorted(set(obj) - set(types)):
+        reason = "derived by the build; remove it" if field in DERIVED_FIELDS else "unknown field"
+        problems.append(f"{where}: `{field}` is {reason}")
+    return True
+
+
+def region_problems(key, region, as_of=None):
+    """Schema violations in one region. With `as_of`, the region is in built form and
+    its derived fields must match the rules; without, it is a source and must not
+    carry them."""
+    problems = []
+    if not _REGION_KEY.match(key):
+        problems.append(f"{key}: region keys are lowercase letters, digits and underscores")
+    if not _check_fields(key, region, _REGION_TYPES, problems):
+        return problems
+    longevity = region.get("longevity")
+    if isinstance(longevity, str) and longevity not in LONGEVITY_AGES:
+        problems.append(f"{key}: `longevity` must be one of {', '.join(LONGEVITY_AGES)}")
+        longevity = None
+    vintages = region.get("vintages")
+    if not isinstance(vintages, dict):
+        return problems
+    if not vintages:
+        problems.append(f"{key}: no vintages")
+
+    previous = None
+    for year, vintage in vintages.items():
+        where = f"{key} {year}"
+        if not _YEAR.match(year):
+            problems.append(f"{where}: vintage keys must be four-digit years")
+            continue
+        if as_of is not None and previous is not None and int(year) <= previous:
+            problems.append(f"{where}: vintages are not in ascending year order")
+        previous = int(year)
+        if not _check_fields(where, vintage, _VINTAGE_TYPES if as_of is not None else _SOURCE_VINTAGE_TYPES, problems):
+            continue
+        score = vintage.get("score")
+        if not isinstance(score, int) or isinstance(score, bool):
+            continue
+        if not 0 < score <= 100:
+            problems.append(f"{where}: score {score} is outside 1-100")
+        if as_of is None:
+            continue
+        tier = vintage.get("quality_tier")
+        if tier not in TIERS[1:]:
+            problems.append(f"{where}: unknown quality_tier {tier!r}")
+        elif tier != quality_tier(score):
+            problems.append(f"{where}: quality_tier {tier!r} disagrees with score {score} ({quality_tier(score)})")
+        if longevity is not None and vintage.get("drinking_window") != drinking_window(int(year), longevity, as_of):
+            problems.append(
+                f"{where}: drinking_window {vintage.get('drinking_window')!r} should be "
+                f"{drinking_window(int(year), longevity, as_of)!r} for a {longevity}-lived region as of {as_of}"
+            )
+    return problems
+
+
+def validate_vintage_data(data):
+    """Raise DataValidationError unless `data` is a well-formed, fully derived vintage_data.json."""
+    if not isinstance(data, dict) or not isinstance(data.get("metadata"), dict) or not isinstance(data.get("regions"), dict):
+        raise DataValidationError(["expected an object with `metadata` and `regions` objects"])
+    metadata, regions = data["metadata"], data["regions"]
+    problems = []
+    as_of = metadata.get("drinking_window_as_of")
+    if not isinstance(as_of, int) or isinstance(as_of, bool):
+        problems.append("metadata: `drinking_window_as_of` must be a year")
+        as_of = 0
+    if not regions:
+        problems.append("no regions")
+    for key, region in regions.items():
+        problems.extend(region_problems(key, region, as_of))
+
+    years = [int(y) for region in regions.values()
+             if isinstance(region, dict) and isinstance(region.get("vintages"), dict)
+             for y in region["vintages"] if _YEAR.match(y)]
+    if years and metadata.get("year_range") != [min(years), max(years)]:
+        problems.append(f"metadata: year_range {metadata.get('year_range')} should be {[min(years), max(years)]}")
+    if problems:
+        raise DataValidationError(problems)
+
+
+def validate_geojson(geojson):
+    """Raise DataValidationError unless every feature is a (Multi)Polygon with a region_key."""
+    if not isinstance(geojson, dict) or geojson.get("type") != "FeatureCollection" \
+            or not isinstance(geojson.get("features"), list):
+        raise DataValidationError(["GeoJSON: expected a FeatureCollection"])
+    problems = []
+    for i, feature in enumerate(geojson["features"]):
+        properties = feature.get("properties") if isinstance(feature, dict) else None
+        geometry = feature.get("geometry") if isinstance(feature, dict) else None
+        if not isinstance(properties, dict) or not isinstance(properties.get("region_key"), str):
+            problems.append(f"GeoJSON feature {i}: missing properties.region_key")
+        if not isinstance(geometry, dict) or geometry.get("type") not in ("Polygon", "MultiPolygon") \
+                or not isinstance(geometry.get("coordinates"), list):
+            problems.append(f"GeoJSON feature {i}: geometry must be a Polygon or MultiPolygon")
+    if problems:
+        raise DataValidationError(problems)
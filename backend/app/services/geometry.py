@@ -0,0 +1,155 @@
+import math
+import threading
+
+import numpy as np
+
+# Precomputed simplification levels, one per web-map zoom. Above the last level
+# the map is close enough that the source geometry is served unchanged.
+ZOOM_LEVELS = tuple(range(0, 13))
+_TILE_SIZE = 256
+_MAX_DECIMALS = 6
+
+
+def tolerance_for_zoom(zoom):
+    """Degrees spanned by one screen pixel at `zoom` (web mercator, at the equator)."""
+    return 360.0 / (_TILE_SIZE * 2 ** zoom)
+
+
+def decimals_for_zoom(zoom):
+    """Fewest decimal places that still resolve one pixel at `zoom`."""
+    return min(_MAX_DECIMALS, max(0, math.ceil(-math.log10(tolerance_for_zoom(zoom)))))
+
+
+def zoom_for_tolerance(tolerance):
+    """Coarsest precomputed zoom whose pixel size does not exceed `tolerance` degrees."""
+    for zoom in ZOOM_LEVELS:
+        if tolerance_for_zoom(zoom) <= tolerance:
+            return zoom
+    return None
+
+
+def resolve_level(zoom=None, tolerance=None):
+    """Map a requested zoom or tolerance to a precomputed level, or None for full detail."""
+    if zoom is not None:
+        zoom = max(zoom, ZOOM_LEVELS[0])
+        return zoom if zoom <= ZOOM_LEVELS[-1] else None
+    if tolerance is not None and tolerance > 0:
+        return zoom_for_tolerance(tolerance)
+    return None
+
+
+def _douglas_peucker(points, tolerance):
+    """Indices of `points` (an open polyline, shape (n, 2)) kept by Douglas-Peucker."""
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a, b = points[start], points[end]
+        segment = points[start + 1:end]
+        ab = b - a
+        length = math.hypot(ab[0], ab[1])
+        if length == 0:
+            dist = np.hypot(segment[:, 0] - a[0], segment[:, 1] - a[1])
+        else:
+            dist = np.abs(ab[0] * (segment[:, 1] - a[1]) - ab[1] * (segment[:, 0] - a[0])) / length
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            mid = start + 1 + i
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+    return keep
+
+
+def _simplify_ring(ring, tolerance):
+    points = np.asarray(ring, dtype=float)
+    if len(points) <= 4:
+        return points
+    # Split the closed ring at the vertex farthest from its start so both halves
+    # are open polylines with distinct endpoints.
+    far = int(np.argmax(np.hypot(points[:, 0] - points[0, 0], points[:, 1] - points[0, 1])))
+    keep = np.concatenate([
+        _douglas_peucker(points[:far + 1], tolerance)[:-1],
+        _douglas_peucker(points[far:], tolerance),
+    ])
+    simplified = points[keep]
+    return simplified if len(simplified) >= 4 else points
+
+
+def _quantize_ring(points, decimals):
+    """Round to `decimals`, dropping repeated vertices. Adds precision rather than
+    letting a small ring collapse below a valid polygon."""
+    for places in range(decimals, _MAX_DECIMALS + 1):
+        rounded = np.round(points, places)
+        changed = np.any(rounded[1:] != rounded[:-1], axis=1)
+        ring = rounded[np.concatenate([[True], changed])]
+        if len(ring) >= 4:
+            return [[_clean(x), _clean(y)] for x, y in ring.tolist()]
+    return [[_clean(x), _clean(y)] for x, y in points.tolist()]
+
+
+def _clean(value):
+    # Serialize whole-degree coordinates as ints ("4" rather than "4.0").
+    return int(value) if value.is_integer() else value
+
+
+def simplify_geometry(geometry, zoom):
+    tolerance = tolerance_for_zoom(zoom)
+    decimals = decimals_for_zoom(zoom)
+
+    def polygon(rings):
+        return [_quantize_ring(_simplify_ring(ring, tolerance), decimals) for ring in rings]
+
+    if geometry["type"] == "Polygon":
+        return {"type": "Polygon", "coordinates": polygon(geometry["coordinates"])}
+    if geometry["type"] == "MultiPolygon":
+        return {"type": "MultiPolygon", "coordinates": [polygon(p) for p in geometry["coordinates"]]}
+    return geometry
+
+
+class GeometryLevels:
+    """Simplified, quantized geometry for every feature at each zoom in ZOOM_LEVELS,
+    as `levels[zoom] -> [geometry, ...]` in feature order.
+
+    Levels are simplified on first use, so building a snapshot from JSON (at
+    startup without a compiled snapshot, or on a reload) doesn't pay for every zoom
+    up front. The compiled snapshot calls `build_all` and pickles the finished
+    levels.
+    """
+
+    def __init__(self, geojson):
+        self._geometries = [feature["geometry"] for feature in geojson["features"]]
+        self._levels = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, zoom):
+        level = self._levels.get(zoom)
+        if level is None:
+            if zoom not in ZOOM_LEVELS:
+                raise KeyError(zoom)
+            with self._lock:
+                level = self._levels.get(zoom)
+                if level is None:
+                    level = self._levels[zoom] = [simplify_geometry(g, zoom) for g in self._geometries]
+        return level
+
+    def build_all(self):
+        for zoom in ZOOM_LEVELS:
+            self[zoom]
+        return self
+
+    def __getstate__(self):
+        return {"_geometries": self._geometries, "_levels": self._levels}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+def build_geometry_levels(geojson, eager=False):
+    """GeometryLevels for `geojson`; with `eager`, every level is simplified now."""
+    levels = GeometryLevels(geojson)
+    return levels.build_all() if eager else levels
@@ -1,4 +1,8 @@
-from app.services.vintage_service import _load_vintage_data
+from functools import lru_cache
+
+import numpy as np
+
+from app.services.vintage_service import _load_score_matrix, _load_vintage_data, _rows_for_year, data_version
 
 # ── Rich Vintage Notes for key region+year combos ────────────────
 VINTAGE_NOTES = {
@@ -95,31 +99,39 @@ WINE_STYLE_LABELS = {
 }
 
 
+# Preference bonuses as dict lookups, precomputed from the ranked lists above.
+STYLE_BONUS = {
+    significance: {style: 6 - rank * 2 for rank, style in enumerate(prefs["style_preference"])}  # 6, 4, 2
+    for significance, prefs in SIGNIFICANCE_PREFERENCES.items()
+}
+REGION_BONUS = {
+    significance: {region: max(5 - rank, 1) for rank, region in enumerate(prefs["prefer_regions"])}  # 5, 4, 3, 2, 1
+    for significance, prefs in SIGNIFICANCE_PREFERENCES.items()
+}
+
+
 def recommend(year, significance):
+    """Recommendation for (year, significance). The input space is small (years x
+    significances), so results are memoized per data version; treat them as read-only."""
+    return _recommend_cached(data_version(), year, significance)
+
+
+@lru_cache(maxsize=2048)
+def _recommend_cached(version, year, significance):
+    # `version` only keys the cache so a data reload never serves stale results.
+    return _build_recommendation(year, significance)
+
+
+def _build_recommendation(year, significance):
     data = _load_vintage_data()
     prefs = SIGNIFICANCE_PREFERENCES.get(significance, SIGNIFICANCE_PREFERENCES["other"])
-    year_str = str(year)
-
-    candidates = []
-    for region_key, region in data["regions"].items():
-        vintage = region["vintages"].get(year_str)
-        if not vintage:
-            continue
-        candidates.append({
-            "region_key": region_key,
-            "region_name": region["display_name"],
-            "country": region["country"],
-            "wine_style": region["wine_style"],
-            "grapes": region["primary_grapes"],
-            "score": vintage["score"],
-            "quality_tier": vintage["quality_tier"],
-            "description": vintage["description"],
-            "drinking_window": vintage.get("drinking_window", "unknown"),
-            "notable_wines": vintage.get("notable_wines", []),
-        })
 
+    candidates = [_candidate(row) for row in _rows_for_year(year)]
+
+    style_bonus = STYLE_BONUS.get(significance, STYLE_BONUS["other"])
+    region_bonus = REGION_BONUS.get(significance, REGION_BONUS["other"])
     for c in candidates:
-        c["rec_score"] = _compute_score(c, prefs)
+        c["rec_score"] = _compute_score(c, style_bonus, region_bonus)
 
     candidates.sort(key=lambda c: c["rec_score"], reverse=True)
 
@@ -143,19 +155,88 @@ def recommend(year, significance):
     }
 
 
-def _compute_score(candidate, prefs):
-    score = 0.0
-    score += candidate["score"] * 0.88  # Vintage quality dominates
+def recommend_range(start, end, significance, k=5):
+    """Best region-years across [start, end] for an occasion.
+
+    Scores every region-year in the span at once with the same weighting as
+    _compute_score, then formats only the global top-k: the best as the primary
+    recommendation, the rest as alternatives. Memoized per data version.
+    """
+    return _recommend_range_cached(data_version(), start, end, significance, k)
+
 
-    style = candidate["wine_style"]
-    if style in prefs["style_preference"]:
-        rank = prefs["style_preference"].index(style)
-        score += (6 - rank * 2)  # Style: minor tiebreaker (6, 4, 2)
+@lru_cache(maxsize=256)
+def _recommend_range_cached(version, start, end, significance, k):
+    data = _load_vintage_data()
+    matrix = _load_score_matrix()
+    prefs = SIGNIFICANCE_PREFERENCES.get(significance, SIGNIFICANCE_PREFERENCES["other"])
+    style_bonus, region_bonus = _bonus_vectors(version, significance)
+
+    first = max(start, matrix.first_year) - matrix.first_year
+    last = min(end, matrix.first_year + matrix.scores.shape[1] - 1) - matrix.first_year
+    result = {"from": start, "to": end, "significance": significance, "primary": None, "alternatives": []}
+    if last < first:
+        return result
+
+    scores = matrix.scores[:, first:last + 1]
+    rec_scores = scores * 0.88 + style_bonus[:, None] + region_bonus[:, None]
+    rows, cols = np.nonzero(matrix.present[:, first:last + 1])
+    # Best first; ties go to the earlier year, then region order, as in recommend().
+    order = np.lexsort((rows, cols, -rec_scores[rows, cols]))[:k]
+
+    picks = []
+    for row, col in zip(rows[order], cols[order]):
+        region_key = matrix.region_keys[row]
+        year = int(matrix.first_year + first + col)
+        region = data["regions"][region_key]
+        candidate = _candidate({
+            "region_key": region_key,
+            "display_name": region["display_name"],
+            "country": region["country"],
+            "wine_style": region["wine_style"],
+            "primary_grapes": region["primary_grapes"],
+            **region["vintages"][str(year)],
+        })
+        picks.append({"year": year, **_format(candidate, prefs, year, is_primary=not picks)})
+
+    if picks:
+        result["primary"], result["alternatives"] = picks[0], picks[1:]
+    return result
 
-    if candidate["region_key"] in prefs["prefer_regions"]:
-        rank = prefs["prefer_regions"].index(candidate["region_key"])
-        score += max(5 - rank, 1)  # Region: minimal nudge (5, 4, 3, 2, 1)
 
+@lru_cache(maxsize=32)
+def _bonus_vectors(version, significance):
+    """Per-matrix-row style and region bonuses for a significance."""
+    data = _load_vintage_data()
+    matrix = _load_score_matrix()
+    style_bonus = STYLE_BONUS.get(significance, STYLE_BONUS["other"])
+    region_bonus = REGION_BONUS.get(significance, REGION_BONUS["other"])
+    return (
+        np.array([style_bonus.get(data["regions"][key]["wine_style"], 0) for key in matrix.region_keys], dtype=float),
+        np.array([region_bonus.get(key, 0) for key in matrix.region_keys], dtype=float),
+    )
+
+
+def _candidate(row):
+    return {
+        "region_key": row["region_key"],
+        "region_name": row["display_name"],
+        "country": row["country"],
+        "wine_style": row["wine_style"],
+        "grapes": row["primary_grapes"],
+        "score": row["score"],
+        "quality_tier": row["quality_tier"],
+        "description": row["description"],
+        "drinking_window": row.get("drinking_window", "unknown"),
+        "notable_wines": row.get("notable_wines", []),
+    }
+
+
+def _compute_score(candidate, style_bonus, region_bonus):
+    score = 0.0
+    score += candidate["score"] * 0.88  # Vintage quality dominates
+    score += style_bonus.get(candidate["wine_style"], 0)  # Style: minor tiebreaker (6, 4, 2)
+    score += region_bonus.get(candidate["region_key"], 0)  # Region: minimal nudge (5, 4, 3, 2, 1)
     return score
 
 
@@ -175,10 +256,10 @@ def _build_detail(candidate, year):
     # Drinking window context
     dw_text = {
         "young": "Still youthful with primary fruit character.",
+        "ready": "Drinking well now, with room to develop further.",
         "at_peak": "Now at its peak drinking window.",
         "mature": "Fully mature, showing developed secondary aromas.",
         "past_peak": "Past its prime, though well-stored bottles may still show character.",
-        "cellaring": "Still needs time in the cellar to reach its potential.",
     }.get(dw, "")
 
     if score >= 95:
@@ -0,0 +1,66 @@
+import numpy as np
+
+from app.services.score_matrix import TIERS
+
+ROLLING_WINDOWS = (5, 10)
+
+
+def _rolling_mean(values, window):
+    """Trailing mean over `window` vintages; None until the window is full."""
+    if len(values) < window:
+        return [None] * len(values)
+    sums = np.cumsum(np.concatenate([[0.0], values]))
+    means = (sums[window:] - sums[:-window]) / window
+    return [None] * (window - 1) + [round(float(m), 1) for m in means]
+
+
+def _percentile_ranks(values):
+    """Mid-rank percentile of each value among all of the region's vintages."""
+    ordered = np.sort(values)
+    below = np.searchsorted(ordered, values, side="left")
+    at_or_below = np.searchsorted(ordered, values, side="right")
+    ranks = (below + at_or_below) / 2 / len(values) * 100
+    return [round(float(r), 1) for r in ranks]
+
+
+def _as_number(value):
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def build_region_series(data, matrix):
+    """Full score history plus derived statistics for every region, keyed by region_key.
+
+    Built once per data snapshot so /region/<key>/series is a dict lookup.
+    """
+    years = matrix.years
+    series = {}
+    for row, region_key in enumerate(matrix.region_keys):
+        region = data["regions"][region_key]
+        present = matrix.present[row]
+        region_years = years[present]
+        scores = matrix.scores[row, present]
+        entry = {
+            "region_key": region_key,
+            "display_name": region["display_name"],
+            "country": region["country"],
+            "wine_style": region["wine_style"],
+            "primary_grapes": region["primary_grapes"],
+            "years": region_years.tolist(),
+            "scores": [_as_number(s) for s in scores],
+            "quality_tiers": [TIERS[t] for t in matrix.tiers[row, present]],
+            "average_score": None,
+            "best": None,
+            "worst": None,
+            "percentile_ranks": [],
+        }
+        for window in ROLLING_WINDOWS:
+            entry[f"rolling_avg_{window}"] = _rolling_mean(scores, window)
+        if scores.size:
+            best, worst = int(np.argmax(scores)), int(np.argmin(scores))
+            entry["average_score"] = round(float(scores.mean()), 1)
+            entry["best"] = {"year": int(region_years[best]), "score": _as_number(scores[best])}
+            entry["worst"] = {"year": int(region_years[worst]), "score": _as_number(scores[worst])}
+            entry["percentile_ranks"] = _percentile_ranks(scores)
+        series[region_key] = entry
+    return series
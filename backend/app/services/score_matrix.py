@@ -0,0 +1,78 @@
+from typing import NamedTuple
+
+import numpy as np
+
+# Tier codes stored in ScoreMatrix.tiers; index 0 doubles as "missing".
+TIERS = ("no_data", "poor", "average", "good", "excellent", "outstanding")
+_TIER_CODES = {tier: code for code, tier in enumerate(TIERS)}
+
+
+class ScoreMatrix(NamedTuple):
+    """Dense regions x years view of the vintage scores.
+
+    Rows follow the region order of vintage_data.json (the same order the year
+    index uses), columns run from `first_year` to the last year with data.
+    """
+    region_keys: tuple
+    first_year: int
+    scores: np.ndarray   # float64, 0 where missing
+    present: np.ndarray  # bool, True where the region has a vintage entry
+    tiers: np.ndarray    # int8 codes into TIERS
+
+    @property
+    def years(self):
+        return np.arange(self.first_year, self.first_year + self.scores.shape[1])
+
+    def column(self, year):
+        """Scores for `year`, restricted to regions with an entry, in region order."""
+        col = year - self.first_year
+        if col < 0 or col >= self.scores.shape[1]:
+            return np.empty(0)
+        return self.scores[self.present[:, col], col]
+
+    def select(self, years):
+        """(scores, tiers) sub-matrices of shape (regions, len(years)); 0 where missing."""
+        cols = np.asarray(years, dtype=np.intp) - self.first_year
+        valid = (cols >= 0) & (cols < self.scores.shape[1])
+        scores = np.zeros((len(self.region_keys), len(cols)))
+        tiers = np.zeros((len(self.region_keys), len(cols)), dtype=np.int8)
+        scores[:, valid] = self.scores[:, cols[valid]]
+        tiers[:, valid] = self.tiers[:, cols[valid]]
+        return scores, tiers
+
+    def rows_for(self, region_keys):
+        """Matrix row for each key, -1 for keys with no vintage data."""
+        positions = {key: row for row, key in enumerate(self.region_keys)}
+        return np.array([positions.get(key, -1) for key in region_keys], dtype=np.intp)
+
+    def lookup(self, rows, year):
+        """Scores and tier codes at `rows` (from rows_for) for `year`; 0 where missing."""
+        scores = np.zeros(len(rows))
+        tiers = np.zeros(len(rows), dtype=np.int8)
+        col = year - self.first_year
+        if 0 <= col < self.scores.shape[1]:
+            known = np.flatnonzero(rows >= 0)
+            hit = known[self.present[rows[known], col]]
+            scores[hit] = self.scores[rows[hit], col]
+            tiers[hit] = self.tiers[rows[hit], col]
+        return scores, tiers
+
+
+def build_score_matrix(data):
+    regions = data["regions"]
+    region_keys = tuple(regions)
+    years = [int(y) for region in regions.values() for y in region["vintages"]]
+    first_year = min(years, default=0)
+    width = max(years, default=-1) - first_year + 1
+
+    scores = np.zeros((len(region_keys), width))
+    present = np.zeros((len(region_keys), width), dtype=bool)
+    tiers = np.zeros((len(region_keys), width), dtype=np.int8)
+    for row, region in enumerate(regions.values()):
+        for year_str, vintage in region["vintages"].items():
+            col = int(year_str) - first_year
+            scores[row, col] = vintage.get("score", 0)
+            present[row, col] = True
+            tiers[row, col] = _TIER_CODES.get(vintage.get("quality_tier"), 0)
+
+    return ScoreMatrix(region_keys, first_year, scores, present, tiers)
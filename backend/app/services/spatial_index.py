@@ -0,0 +1,80 @@
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+_CELL_SIZE = 1.0  # degrees
+
+
+class SpatialIndex(NamedTuple):
+    """Grid index over region polygons, in GeoJSON feature order.
+
+    Point lookups hash into a fixed-size degree grid and only test the polygons
+    registered in that cell; bbox queries are a vectorized overlap test against
+    per-feature bounds.
+    """
+    polygons: tuple      # per feature: list of polygons, each a list of rings
+    bounds: np.ndarray   # (n, 4): min_lng, min_lat, max_lng, max_lat
+    cells: dict          # (col, row) -> tuple of feature indices
+
+    def at(self, lng, lat):
+        """Indices of features containing the point."""
+        candidates = self.cells.get(_cell(lng, lat), ())
+        return [i for i in candidates if any(_in_polygon(lng, lat, p) for p in self.polygons[i])]
+
+    def within(self, min_lng, min_lat, max_lng, max_lat):
+        """Indices of features whose bounds intersect the bbox. A bbox with
+        min_lng > max_lng is treated as crossing the antimeridian."""
+        b = self.bounds
+        lat_hit = (b[:, 3] >= min_lat) & (b[:, 1] <= max_lat)
+        if min_lng <= max_lng:
+            lng_hit = (b[:, 2] >= min_lng) & (b[:, 0] <= max_lng)
+        else:
+            lng_hit = (b[:, 2] >= min_lng) | (b[:, 0] <= max_lng)
+        return np.flatnonzero(lat_hit & lng_hit).tolist()
+
+
+def _cell(lng, lat):
+    return math.floor(lng / _CELL_SIZE), math.floor(lat / _CELL_SIZE)
+
+
+def _polygons(geometry):
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    return []
+
+
+def _in_ring(x, y, ring):
+    inside = False
+    x1, y1 = ring[-1][0], ring[-1][1]
+    for point in ring:
+        x2, y2 = point[0], point[1]
+        if (y2 > y) != (y1 > y) and x < (x1 - x2) * (y - y2) / (y1 - y2) + x2:
+            inside = not inside
+        x1, y1 = x2, y2
+    return inside
+
+
+def _in_polygon(x, y, rings):
+    return bool(rings) and _in_ring(x, y, rings[0]) and not any(_in_ring(x, y, hole) for hole in rings[1:])
+
+
+def build_spatial_index(geojson):
+    polygons = tuple(_polygons(feature["geometry"]) for feature in geojson["features"])
+    bounds = np.full((len(polygons), 4), np.nan)
+    cells = {}
+    for i, feature_polygons in enumerate(polygons):
+        coords = [pt for polygon in feature_polygons for pt in polygon[0]] if feature_polygons else []
+        if not coords:
+            continue
+        lngs = [pt[0] for pt in coords]
+        lats = [pt[1] for pt in coords]
+        bounds[i] = (min(lngs), min(lats), max(lngs), max(lats))
+        col0, row0 = _cell(bounds[i, 0], bounds[i, 1])
+        col1, row1 = _cell(bounds[i, 2], bounds[i, 3])
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                cells.setdefault((col, row), []).append(i)
+    return SpatialIndex(polygons, bounds, {cell: tuple(ids) for cell, ids in cells.items()})
@@ -0,0 +1,264 @@
+"""Mapbox Vector Tile (spec v2) rendering of the wine regions for a given year.
+
+Tiles are encoded here directly (the protobuf schema needed is tiny) so the
+backend takes on no protobuf/geometry dependencies. Rendered tiles are kept in a
+bounded LRU keyed by data version, so a reload naturally stops hitting old tiles.
+"""
+import hashlib
+import math
+import os
+import struct
+import threading
+from functools import lru_cache
+from typing import NamedTuple
+
+from app.services.geometry import ZOOM_LEVELS
+from app.services.score_matrix import TIERS
+from app.services.vintage_service import _current_snapshot, _load_geojson
+from app.utils.compression import compress_variants
+from app.utils.server_timing import phase, record_cache
+
+EXTENT = 4096
+BUFFER = 64
+MAX_ZOOM = 16
+LAYER_NAME = "regions"
+_MAX_LAT = 85.0511287798
+_CACHE_SIZE = int(os.environ.get("TILE_CACHE_SIZE", "2048"))
+_render_state = threading.local()
+
+
+class EncodedTile(NamedTuple):
+    body: bytes     # MVT bytes; empty if nothing intersects the tile
+    etag: str
+    variants: dict  # Content-Encoding -> precompressed body
+
+
+def render_tile(year, z, x, y):
+    """One tile of the current snapshot, with its ETag and compressed variants."""
+    _load_geojson()
+    _render_state.missed = False
+    tile = _render_cached(_current_snapshot().version, year, z, x, y)
+    record_cache("tile", hit=not _render_state.missed)
+    return tile
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _render_cached(version, year, z, x, y):
+    # `version` is part of the cache key only; the pinned snapshot supplies the data.
+    _render_state.missed = True
+    with phase("compute"):
+        tile = _render(year, z, x, y)
+    with phase("serialize"):
+        return EncodedTile(tile, hashlib.blake2b(tile, digest_size=16).hexdigest(), compress_variants(tile))
+
+
+def _render(year, z, x, y):
+    snapshot = _current_snapshot()
+    geojson = snapshot.geojson_data
+    if z <= ZOOM_LEVELS[-1]:
+        geometries = snapshot.geometry_levels[z]
+    else:
+        geometries = [feature["geometry"] for feature in geojson["features"]]
+    scores, tiers = snapshot.score_matrix.lookup(snapshot.feature_rows, year)
+
+    layer = _LayerBuilder()
+    for index in snapshot.spatial_index.within(*_tile_bounds(z, x, y)):
+        feature, geometry = geojson["features"][index], geometries[index]
+        commands = _encode_polygons(_polygons(geometry), z, x, y)
+        if not commands:
+            continue
+        props = feature["properties"]
+        score = scores[index]
+        layer.add_feature(index + 1, commands, {
+            "region_key": props["region_key"],
+            "display_name": props["display_name"],
+            "country": props["country"],
+            "wine_style": props["wine_style"],
+            "score": int(score) if float(score).is_integer() else float(score),
+            "quality_tier": TIERS[tiers[index]],
+        })
+    return layer.encode()
+
+
+# ── Geometry ─────────────────────────────────────────────────────
+
+def _polygons(geometry):
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    return []
+
+
+def _tile_bounds(z, x, y):
+    """(min_lng, min_lat, max_lng, max_lat) of the tile including its buffer."""
+    n = 2 ** z
+    pad = BUFFER / EXTENT
+
+    def lng(tx):
+        return max(-180.0, min(180.0, tx / n * 360.0 - 180.0))
+
+    def lat(ty):
+        ty = max(0.0, min(float(n), ty))
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * ty / n))))
+
+    return lng(x - pad), lat(y + 1 + pad), lng(x + 1 + pad), lat(y - pad)
+
+
+def _to_tile(lon, lat, z, x, y):
+    lat = max(-_MAX_LAT, min(_MAX_LAT, lat))
+    n = 2 ** z
+    mx = (lon + 180.0) / 360.0 * n
+    my = (1.0 - math.log(math.tan(math.radians(lat)) + 1.0 / math.cos(math.radians(lat))) / math.pi) / 2.0 * n
+    return (mx - x) * EXTENT, (my - y) * EXTENT
+
+
+def _clip(ring, lo, hi):
+    """Sutherland-Hodgman clip of a ring against the square [lo, hi]^2."""
+    edges = (
+        lambda p: p[0] >= lo, lambda p: p[0] <= hi,
+        lambda p: p[1] >= lo, lambda p: p[1] <= hi,
+    )
+    bounds = (lo, hi, lo, hi)
+    for axis_edge, (inside, bound) in enumerate(zip(edges, bounds)):
+        if not ring:
+            break
+        axis = axis_edge // 2
+        clipped = []
+        prev = ring[-1]
+        for point in ring:
+            if inside(point):
+                if not inside(prev):
+                    clipped.append(_intersect(prev, point, axis, bound))
+                clipped.append(point)
+            elif inside(prev):
+                clipped.append(_intersect(prev, point, axis, bound))
+            prev = point
+        ring = clipped
+    return ring
+
+
+def _intersect(a, b, axis, bound):
+    t = (bound - a[axis]) / (b[axis] - a[axis])
+    return (a[0] + t * (b[0] - a[0]), a[1] + t * (b[1] - a[1]))
+
+
+def _area(ring):
+    return sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(ring, ring[1:] + ring[:1])) / 2.0
+
+
+def _encode_polygons(polygons, z, x, y):
+    commands = []
+    cursor = [0, 0]
+    for polygon in polygons:
+        for ring_index, ring in enumerate(polygon):
+            points = [_to_tile(lon, lat, z, x, y) for lon, lat in ring[:-1]]
+            points = _clip(points, -BUFFER, EXTENT + BUFFER)
+            snapped = []
+            for px, py in points:
+                point = (round(px), round(py))
+                if not snapped or snapped[-1] != point:
+                    snapped.append(point)
+            if len(snapped) > 1 and snapped[0] == snapped[-1]:
+                snapped.pop()
+            if len(snapped) < 3 or _area(snapped) == 0:
+                if ring_index == 0:
+                    break  # exterior clipped away; skip its holes too
+                continue
+            # Spec v2: exterior rings have positive area in tile space, holes negative.
+            if (_area(snapped) > 0) != (ring_index == 0):
+                snapped.reverse()
+            commands.extend(_ring_commands(snapped, cursor))
+    return commands
+
+
+def _ring_commands(ring, cursor):
+    out = [_command(1, 1)]
+    for i, (px, py) in enumerate(ring):
+        if i == 1:
+            out.append(_command(2, len(ring) - 1))
+        out.append(_zigzag(px - cursor[0]))
+        out.append(_zigzag(py - cursor[1]))
+        cursor[0], cursor[1] = px, py
+    out.append(_command(7, 1))
+    return out
+
+
+def _command(command_id, count):
+    return (command_id & 0x7) | (count << 3)
+
+
+def _zigzag(n):
+    return (n << 1) ^ (n >> 31)
+
+
+# ── Protobuf encoding ────────────────────────────────────────────
+
+def _varint(n):
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _field(number, wire_type):
+    return _varint((number << 3) | wire_type)
+
+
+def _bytes_field(number, payload):
+    return _field(number, 2) + _varint(len(payload)) + payload
+
+
+def _packed(number, values):
+    return _bytes_field(number, b"".join(_varint(v) for v in values))
+
+
+def _encode_value(value):
+    if isinstance(value, str):
+        return _bytes_field(1, value.encode("utf-8"))
+    if isinstance(value, bool):
+        return _field(7, 0) + _varint(int(value))
+    if isinstance(value, int):
+        if value >= 0:
+            return _field(5, 0) + _varint(value)
+        return _field(6, 0) + _varint((value << 1) ^ (value >> 63))
+    return _field(3, 1) + struct.pack("<d", value)
+
+
+class _LayerBuilder:
+    def __init__(self):
+        self._keys = {}
+        self._values = {}
+        self._features = []
+
+    def _index(self, table, item):
+        if item not in table:
+            table[item] = len(table)
+        return table[item]
+
+    def add_feature(self, feature_id, commands, properties):
+        tags = []
+        for key, value in properties.items():
+            tags.append(self._index(self._keys, key))
+            tags.append(self._index(self._values, (type(value).__name__, value)))
+        self._features.append(
+            _field(1, 0) + _varint(feature_id)
+            + _packed(2, tags)
+            + _field(3, 0) + _varint(3)  # GeomType.POLYGON
+            + _packed(4, commands)
+        )
+
+    def encode(self):
+        if not self._features:
+            return b""
+        layer = _field(15, 0) + _varint(2) + _bytes_field(1, LAYER_NAME.encode("utf-8"))
+        layer += b"".join(_bytes_field(2, feature) for feature in self._features)
+        layer += b"".join(_bytes_field(3, key.encode("utf-8")) for key in self._keys)
+        layer += b"".join(_bytes_field(4, _encode_value(value)) for _, value in self._values)
+        layer += _field(5, 0) + _varint(EXTENT)
+        return _bytes_field(3, layer)
@@ -1,48 +1,236 @@
 import json
 import logging
 import os
+import threading
+from contextvars import ContextVar
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from app.services.compiled_data import GEOJSON_PATH as _GEOJSON_PATH
+from app.services.compiled_data import VINTAGE_PATH as _VINTAGE_PATH
+from app.services.compiled_data import build_runtime_data, read_compiled, source_version
+from app.services.data_schema import DataValidationError, validate_geojson, validate_vintage_data
+from app.services.geometry import GeometryLevels
+from app.services.score_matrix import TIERS, ScoreMatrix
+from app.services.spatial_index import SpatialIndex
+from app.utils import metrics
 
 log = logging.getLogger(__name__)
 
-_DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data")
-_vintage_data = None
-_geojson_data = None
+_snapshot = None
+_failed_stamps = None
+_snapshot_lock = threading.Lock()
+_pinned_snapshot = ContextVar("pinned_snapshot", default=None)
 
 
 class DataUnavailableError(Exception):
     pass
 
 
-def _load_vintage_data():
-    global _vintage_data
-    if _vintage_data is None:
-        path = os.path.join(_DATA_DIR, "vintage", "vintage_data.json")
+class DataSnapshot(NamedTuple):
+    """Everything derived from one read of the data files. Never mutated once built;
+    a reload builds a new snapshot and swaps the module reference."""
+    version: str
+    stamps: tuple
+    vintage_data: dict
+    year_index: dict
+    score_matrix: ScoreMatrix
+    region_series: dict
+    geojson_data: Optional[dict]
+    geojson_error: Optional[str]
+    geometry_levels: Optional[GeometryLevels]
+    geometry_version: Optional[str]
+    feature_rows: Optional[np.ndarray]
+    spatial_index: Optional[SpatialIndex]
+
+
+def _file_stamps():
+    stamps = []
+    for path in (_VINTAGE_PATH, _GEOJSON_PATH):
         try:
-            with open(path) as f:
-                _vintage_data = json.load(f)
+            st = os.stat(path)
+            stamps.append((st.st_mtime_ns, st.st_size))
         except FileNotFoundError:
-            log.error(f"Vintage data file not found: {path}")
-            raise DataUnavailableError("Vintage data file not found.")
-        except json.JSONDecodeError as e:
-            log.error(f"Vintage data file is malformed: {e}")
-            raise DataUnavailableError("Vintage data file is malformed.")
-    return _vintage_data
+            stamps.append(None)
+    return tuple(stamps)
+
+
+def _read_bytes(path, label):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        log.error(f"{label} file not found: {path}")
+        raise DataUnavailableError(f"{label} file not found.")
+
+
+def _parse_json(raw, label):
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError as e:
+        log.error(f"{label} file is malformed: {e}")
+        raise DataUnavailableError(f"{label} file is malformed.")
+
+
+def _validate(check, data, label):
+    try:
+        check(data)
+    except DataValidationError as e:
+        log.error(f"{label} file is invalid: {e}")
+        raise DataUnavailableError(f"{label} file is invalid.")
+
+
+def _build_snapshot():
+    stamps = _file_stamps()
+    vintage_raw = _read_bytes(_VINTAGE_PATH, "Vintage data")
+    geojson_raw = None
+    geojson_error = None
+    try:
+        geojson_raw = _read_bytes(_GEOJSON_PATH, "GeoJSON regions")
+    except DataUnavailableError as e:
+        geojson_error = str(e)
+    version = source_version(vintage_raw, geojson_raw)
+
+    # Hashing the raw bytes is cheap; parsing and indexing them is not. Prefer the
+    # compiled snapshot when it was built from exactly these sources.
+    runtime_data = read_compiled(version)
+    if runtime_data is None:
+        vintage_data = _parse_json(vintage_raw, "Vintage data")
+        _validate(validate_vintage_data, vintage_data, "Vintage data")
+        geojson_data = None
+        if geojson_raw is not None:
+            try:
+                geojson_data = _parse_json(geojson_raw, "GeoJSON regions")
+                _validate(validate_geojson, geojson_data, "GeoJSON regions")
+            except DataUnavailableError as e:
+                geojson_data = None
+                geojson_error = str(e)
+        runtime_data = build_runtime_data(vintage_data, geojson_data)
+
+    has_geojson = runtime_data["geojson_data"] is not None
+    return DataSnapshot(
+        version=version,
+        stamps=stamps,
+        geojson_error=geojson_error,
+        # Geometry only changes with the GeoJSON file, independent of vintage edits.
+        geometry_version=source_version(geojson_raw) if has_geojson else None,
+        **runtime_data,
+    )
+
+
+def _current_snapshot():
+    pinned = _pinned_snapshot.get()
+    if pinned is not None:
+        return pinned
+    snapshot = _snapshot
+    if snapshot is None:
+        with _snapshot_lock:
+            snapshot = _snapshot
+            if snapshot is None:
+                snapshot = _swap_in(_build_snapshot())
+    return snapshot
+
+
+def _swap_in(snapshot):
+    global _snapshot
+    _snapshot = snapshot
+    return snapshot
+
+
+def pin_snapshot():
+    """Pin the current snapshot to this context so a request sees one consistent
+    dataset even if a reload swaps in a new one mid-flight. Returns a token for
+    `unpin_snapshot`, or None when no data could be loaded."""
+    try:
+        return _pinned_snapshot.set(_current_snapshot())
+    except DataUnavailableError:
+        return None
+
+
+def unpin_snapshot(token):
+    if token is not None:
+        _pinned_snapshot.reset(token)
+
+
+def load_data():
+    """Build the snapshot now rather than on the first request, e.g. in a preforking
+    server's master so every worker inherits it. Returns the data version, or None
+    when the data files can't be loaded (requests will then retry and report it)."""
+    try:
+        return _current_snapshot().version
+    except DataUnavailableError as e:
+        log.warning(f"Eager data load failed: {e}")
+        return None
+
+
+def data_version():
+    return _current_snapshot().version
+
+
+def reload_if_changed():
+    """Rebuild and swap the snapshot if either data file changed on disk.
+
+    A failed rebuild (e.g. a half-written file) keeps serving the previous snapshot
+    and is retried once the files change again.
+    """
+    global _failed_stamps
+    current = _snapshot
+    stamps = _file_stamps()
+    if stamps == _failed_stamps or (current is not None and current.stamps == stamps):
+        return False
+    try:
+        fresh = _build_snapshot()
+    except DataUnavailableError:
+        _failed_stamps = stamps
+        log.warning("Data reload failed; keeping previous snapshot")
+        metrics.inc("vintage_data_reloads_total", {"result": "failure"})
+        return False
+    with _snapshot_lock:
+        _swap_in(fresh)
+    metrics.inc("vintage_data_reloads_total", {"result": "success"})
+    if current is not None and current.version != fresh.version:
+        log.info(f"Reloaded data snapshot {current.version} -> {fresh.version}")
+    return True
+
+
+def start_reloader(interval):
+    """Poll the data files every `interval` seconds on a daemon thread."""
+    def run():
+        while not stop.wait(interval):
+            try:
+                reload_if_changed()
+            except Exception:
+                # Keep polling: an unexpected failure must not silently end reloads.
+                log.exception("Data reload raised; keeping previous snapshot")
+
+    stop = threading.Event()
+    threading.Thread(target=run, name="data-reloader", daemon=True).start()
+    return stop
+
+
+def _load_vintage_data():
+    return _current_snapshot().vintage_data
+
+
+def _load_year_index():
+    return _current_snapshot().year_index
+
+
+def _load_score_matrix():
+    return _current_snapshot().score_matrix
+
+
+def _rows_for_year(year):
+    """Merged region rows for a year. Shared across requests — do not mutate."""
+    return _load_year_index().get(year, [])
 
 
 def _load_geojson():
-    global _geojson_data
-    if _geojson_data is None:
-        path = os.path.join(_DATA_DIR, "geojson", "wine_regions.geojson")
-        try:
-            with open(path) as f:
-                _geojson_data = json.load(f)
-        except FileNotFoundError:
-            log.error(f"GeoJSON file not found: {path}")
-            raise DataUnavailableError("GeoJSON regions file not found.")
-        except json.JSONDecodeError as e:
-            log.error(f"GeoJSON file is malformed: {e}")
-            raise DataUnavailableError("GeoJSON regions file is malformed.")
-    return _geojson_data
+    snapshot = _current_snapshot()
+    if snapshot.geojson_data is None:
+        raise DataUnavailableError(snapshot.geojson_error)
+    return snapshot.geojson_data
 
 
 def get_year_range():
@@ -55,44 +243,32 @@ def get_year_range():
 
 def get_year_report(year: int) -> dict:
     """Return a harvest report: winners, strugglers, best pick, and a summary narrative."""
-    data = _load_vintage_data()
-    year_str = str(year)
-
-    regions = []
-    for region_key, region in data["regions"].items():
-        vintage = region["vintages"].get(year_str)
-        if vintage:
-            regions.append({
-                "region_key": region_key,
-                "display_name": region["display_name"],
-                "country": region["country"],
-                "wine_style": region["wine_style"],
-                "primary_grapes": region["primary_grapes"],
-                **vintage,
-            })
+    snapshot = _current_snapshot()
+    regions = snapshot.year_index.get(year, [])
 
     if not regions:
         return {"year": year, "winners": [], "strugglers": [], "best_pick": None, "summary": "No vintage data available for this year."}
 
-    # Sort by score
-    regions.sort(key=lambda r: r.get("score", 0), reverse=True)
+    # Scores line up with `regions` (both follow region order), so every
+    # aggregate below is an array operation over one matrix column.
+    scores = snapshot.score_matrix.column(year)
+
+    # Best first; stable so ties keep region order
+    by_score = np.argsort(-scores, kind="stable")
 
     # Winners: score >= 90 — return ALL qualifying regions, sorted best first
-    all_winners = [r for r in regions if r.get("score", 0) >= 90]
+    all_winners = [regions[i] for i in by_score[scores[by_score] >= 90]]
 
     # Strugglers: score < 75 — return ALL qualifying regions, sorted worst first
-    all_strugglers = sorted(
-        [r for r in regions if 0 < r.get("score", 0) < 75],
-        key=lambda r: r.get("score", 0)
-    )
+    struggling = np.flatnonzero((scores > 0) & (scores < 75))
+    all_strugglers = [regions[i] for i in struggling[np.argsort(scores[struggling], kind="stable")]]
 
     # Best pick: highest scoring region
-    best_pick = regions[0] if regions else None
+    best_pick = regions[by_score[0]]
 
     # Build a short narrative summary
-    avg_score = sum(r.get("score", 0) for r in regions if r.get("score", 0) > 0)
-    scored = [r for r in regions if r.get("score", 0) > 0]
-    avg = avg_score / len(scored) if scored else 0
+    scored = scores[scores > 0]
+    avg = float(scored.mean()) if scored.size else 0
 
     if avg >= 90:
         market_tone = f"{year} was an exceptional year across the board — rare conditions aligned in multiple regions simultaneously."
@@ -124,57 +300,145 @@ def get_year_report(year: int) -> dict:
         "strugglers": all_strugglers,
         "total_strugglers": len(all_strugglers),
         "best_pick": best_pick,
-        "total_regions": len(scored),
+        "total_regions": int(scored.size),
     }
 
 
 def get_vintage_by_year(year):
-    data = _load_vintage_data()
-    year_str = str(year)
-    results = []
+    return {"year": year, "regions": list(_rows_for_year(year))}
 
-    for region_key, region in data["regions"].items():
-        vintage = region["vintages"].get(year_str)
-        if vintage:
-            results.append({
-                "region_key": region_key,
-                "display_name": region["display_name"],
-                "country": region["country"],
-                "wine_style": region["wine_style"],
-                "primary_grapes": region["primary_grapes"],
-                **vintage,
-            })
 
-    return {"year": year, "regions": results}
+def get_vintage_matrix(years):
+    """Scores and tier codes for every region across `years`, as region x year
+    arrays (0 / "no_data" where a region has no entry for a year)."""
+    matrix = _load_score_matrix()
+    scores, tiers = matrix.select(years)
+    return {
+        "years": list(years),
+        "regions": list(matrix.region_keys),
+        "tier_names": list(TIERS),
+        "scores": [_compact_numbers(row) for row in scores],
+        "tiers": tiers.tolist(),
+    }
+
 
+def get_region_series(region_key):
+    """Precomputed score history and statistics for a region, or None if unknown."""
+    return _current_snapshot().region_series.get(region_key)
 
-def get_regions_geojson_with_vintage(year):
+
+def get_regions_geojson_with_vintage(year, zoom=None, bbox=None):
+    """Regions with that year's vintage merged into properties.
+
+    `zoom` selects a precomputed simplified geometry level (see geometry.ZOOM_LEVELS);
+    None serves the source geometry. `bbox` (min_lng, min_lat, max_lng, max_lat)
+    keeps only features whose bounds intersect it.
+    """
     geojson = _load_geojson()
-    data = _load_vintage_data()
-    year_str = str(year)
+    snapshot = _current_snapshot()
+    if zoom is None:
+        geometries = [feature["geometry"] for feature in geojson["features"]]
+    else:
+        geometries = snapshot.geometry_levels[zoom]
+    if bbox is None:
+        indices = range(len(geojson["features"]))
+    else:
+        indices = snapshot.spatial_index.within(*bbox)
 
     features = []
-    for feature in geojson["features"]:
-        region_key = feature["properties"]["region_key"]
-        new_feature = {
+    for i in indices:
+        feature = geojson["features"][i]
+        features.append({
             "type": "Feature",
-            "geometry": feature["geometry"],
-            "properties": {**feature["properties"]},
-        }
-
-        region = data["regions"].get(region_key)
-        if region:
-            vintage = region["vintages"].get(year_str)
-            if vintage:
-                new_feature["properties"].update(vintage)
-            else:
-                new_feature["properties"]["score"] = 0
-                new_feature["properties"]["quality_tier"] = "no_data"
-                new_feature["properties"]["description"] = "No vintage data available for this year."
+            "geometry": geometries[i],
+            "properties": _properties_with_vintage(feature, snapshot.vintage_data, str(year)),
+        })
+
+    return {"type": "FeatureCollection", "features": features}
+
+
+def get_regions_at(lng, lat, year):
+    """Regions whose polygon contains the point, each with that year's vintage."""
+    geojson = _load_geojson()
+    snapshot = _current_snapshot()
+    return {
+        "lat": lat,
+        "lng": lng,
+        "year": year,
+        "regions": [
+            _properties_with_vintage(geojson["features"][i], snapshot.vintage_data, str(year))
+            for i in snapshot.spatial_index.at(lng, lat)
+        ],
+    }
+
+
+def _properties_with_vintage(feature, data, year_str):
+    properties = {**feature["properties"]}
+    region = data["regions"].get(properties["region_key"])
+    if region:
+        vintage = region["vintages"].get(year_str)
+        if vintage:
+            properties.update(vintage)
         else:
-            new_feature["properties"]["score"] = 0
-            new_feature["properties"]["quality_tier"] = "no_data"
+            properties["score"] = 0
+            properties["quality_tier"] = "no_data"
+            properties["description"] = "No vintage data available for this year."
+    else:
+        properties["score"] = 0
+        properties["quality_tier"] = "no_data"
+    return properties
 
-        features.append(new_feature)
 
-    return {"type": "FeatureCollection", "features": features}
+def get_geometry_version():
+    _load_geojson()
+    return _current_snapshot().geometry_version
+
+
+def get_region_geometry(zoom=None):
+    """Static region geometry and descriptive properties, without vintage data.
+
+    Identical shapes (e.g. Burgundy red and white) are stored once in `shapes` and
+    referenced by index from each feature. Pair with get_region_scores, whose
+    arrays follow the same feature order.
+    """
+    geojson = _load_geojson()
+    snapshot = _current_snapshot()
+    if zoom is None:
+        geometries = [feature["geometry"] for feature in geojson["features"]]
+    else:
+        geometries = snapshot.geometry_levels[zoom]
+
+    shapes = []
+    shape_ids = {}
+    features = []
+    for feature, geometry in zip(geojson["features"], geometries):
+        shape_key = json.dumps(geometry, sort_keys=True)
+        if shape_key not in shape_ids:
+            shape_ids[shape_key] = len(shapes)
+            shapes.append(geometry)
+        features.append({**feature["properties"], "shape": shape_ids[shape_key]})
+
+    return {
+        "version": snapshot.geometry_version,
+        "tiers": list(TIERS),
+        "shapes": shapes,
+        "features": features,
+    }
+
+
+def get_region_scores(year):
+    """Per-feature score and tier-code arrays for a year, in get_region_geometry order."""
+    _load_geojson()
+    snapshot = _current_snapshot()
+    scores, tiers = snapshot.score_matrix.lookup(snapshot.feature_rows, year)
+    return {
+        "year": year,
+        "geometry_version": snapshot.geometry_version,
+        "scores": _compact_numbers(scores),
+        "tiers": tiers.tolist(),
+    }
+
+
+def _compact_numbers(values):
+    # Scores are whole numbers in practice; emit ints so the payload stays small.
+    return values.astype(int).tolist() if np.all(values == np.round(values)) else values.tolist()
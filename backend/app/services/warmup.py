@@ -0,0 +1,102 @@
+"""Startup warmup: load, check and index the data, then prime the hot caches.
+
+Priming goes through the app's own routes (via the test client), so every
+response cache key, tile and memoized recommendation is exactly the one a real
+request would hit. Loading has to finish first; the per-year requests are
+independent and run on a thread pool, which overlaps their gzip/brotli work (both
+release the GIL).
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.vintage_service import (
+    DataUnavailableError, _current_snapshot, get_year_range, load_data,
+)
+from app.utils.server_timing import WARMUP_ENVIRON_KEY
+
+log = logging.getLogger(__name__)
+
+WARMUP_THREADS = 4
+TILE_WARMUP_MAX_ZOOM = 2
+
+
+class WarmupState:
+    """Readiness of one app, shared with workers forked after warmup."""
+
+    def __init__(self):
+        self.ready = threading.Event()
+        self.error = None
+        self.data_version = None
+        self.duration_ms = None
+
+
+def _check_snapshot():
+    """Fail warmup on data the app can't fully serve; warn about partial coverage."""
+    snapshot = _current_snapshot()
+    if snapshot.geojson_data is None:
+        raise DataUnavailableError(snapshot.geojson_error)
+    unmatched = [
+        feature["properties"]["region_key"]
+        for feature, row in zip(snapshot.geojson_data["features"], snapshot.feature_rows)
+        if row < 0
+    ]
+    if unmatched:
+        log.warning(f"GeoJSON regions without vintage data: {', '.join(unmatched)}")
+    return snapshot.version
+
+
+def _warmup_paths():
+    from app.routes.recommend import VALID_SIGNIFICANCES
+
+    yr = get_year_range()
+    years = range(yr["min_year"], yr["max_year"] + 1)
+    paths = ["/api/year-range", "/api/regions/geometry"]
+    for year in years:
+        paths += [
+            f"/api/vintage/{year}",
+            f"/api/vintage/{year}/report",
+            f"/api/regions/{year}",
+            f"/api/regions/{year}/scores",
+        ]
+        paths += [f"/api/recommend?year={year}&significance={s}" for s in VALID_SIGNIFICANCES]
+    for z in range(TILE_WARMUP_MAX_ZOOM + 1):
+        paths += [
+            f"/api/tiles/{yr['max_year']}/{z}/{x}/{y}.mvt"
+            for x in range(2 ** z) for y in range(2 ** z)
+        ]
+    return paths
+
+
+def warm(app, threads=WARMUP_THREADS):
+    """Run the warmup for `app` and mark it ready. Returns the WarmupState."""
+    state = app.extensions["warmup"]
+    start = time.perf_counter()
+    try:
+        load_data()
+        state.data_version = _check_snapshot()
+
+        def fetch(paths):
+            client = app.test_client()
+            for path in paths:
+                response = client.get(path, environ_base={WARMUP_ENVIRON_KEY: True})
+                if response.status_code != 200:
+                    log.warning(f"Warmup request {path} returned {response.status_code}")
+
+        paths = _warmup_paths()
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="warmup") as pool:
+            list(pool.map(fetch, [paths[i::threads] for i in range(threads)]))
+    except DataUnavailableError as e:
+        state.error = str(e)
+        log.error(f"Warmup failed: {e}")
+        return state
+    state.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+    state.ready.set()
+    log.info(f"Warmed data snapshot {state.data_version} in {state.duration_ms} ms ({len(paths)} requests)")
+    return state
+
+
+def start_warmup(app):
+    """Warm on a daemon thread; /api/ready reports 503 until it finishes."""
+    threading.Thread(target=warm, args=(app,), name="warmup", daemon=True).start()
@@ -0,0 +1,295 @@
+"""Process-local request metrics with Prometheus text exposition.
+
+Each process counts into its own in-memory registry. Under gunicorn, setting
+METRICS_DIR makes every worker flush its registry to
+`<METRICS_DIR>/<pid>-<start ns>.json` every METRICS_FLUSH_INTERVAL seconds (and
+at exit); /api/metrics then sums the serving worker's live counts with every
+other file, so a scrape that lands on any one worker reports the whole server.
+The start time in the name keeps a worker that reuses a dead worker's pid from
+overwriting its file. When a worker exits, gunicorn.conf.py folds its file into
+`retired.json` (see `retire_worker`), so totals stay monotonic without a file
+per worker ever started; it empties the directory when the master starts.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_HELP = {
+    "vintage_http_requests_total": ("counter", "HTTP requests by route, method and status (304s are revalidations)."),
+    "vintage_http_request_duration_seconds": ("histogram", "Time spent handling the request in the app."),
+    "vintage_cache_requests_total": ("counter", "Response and tile cache lookups by result."),
+    "vintage_data_reloads_total": ("counter", "Data snapshot reloads by result."),
+}
+
+
+RETIRED_FILE = "retired.json"
+_FOLDED_NAMES_KEPT = 1000
+
+
+def _metrics_dir():
+    return os.environ.get("METRICS_DIR") or None
+
+
+def _flush_interval():
+    try:
+        return float(os.environ.get("METRICS_FLUSH_INTERVAL", "5"))
+    except ValueError:
+        return 5.0
+
+
+def _file_name(pid):
+    return f"{pid}-{time.time_ns()}.json"
+
+
+def _write_json(path, data):
+    # Per-thread temp name: a scrape and the flusher thread may write the same file.
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+class Registry:
+    """Counters and fixed-bucket histograms keyed by (name, sorted label pairs)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._file_name = _file_name(self._pid)
+        self._counters = {}
+        self._histograms = {}  # key -> [bucket counts..., +Inf count, sum]
+        self._flusher = None
+
+    def _check_fork(self):
+        # A forked worker inherits the master's counts; start from zero so they
+        # aren't reported twice once both are aggregated.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._file_name = _file_name(self._pid)
+            self._counters = {}
+            self._histograms = {}
+            self._flusher = None
+        if self._flusher is None and _metrics_dir():
+            self._flusher = threading.Thread(target=self._flush_forever, name="metrics-flush", daemon=True)
+            self._flusher.start()
+
+    def inc(self, name, labels=None, amount=1):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            self._check_fork()
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, value, labels=None):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            self._check_fork()
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0] * (len(LATENCY_BUCKETS) + 2)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if value <= bound:
+                    histogram[i] += 1
+                    break
+            else:
+                histogram[len(LATENCY_BUCKETS)] += 1
+            histogram[-1] += value
+
+    def snapshot(self):
+        """JSON-serializable copy of the current counts."""
+        with self._lock:
+            return {
+                "counters": [[name, list(labels), value] for (name, labels), value in self._counters.items()],
+                "histograms": [[name, list(labels), list(h)] for (name, labels), h in self._histograms.items()],
+            }
+
+    def flush(self):
+        """Write the current counts to this process's file. Returns what was written."""
+        directory = _metrics_dir()
+        if directory is None:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        snapshot = self.snapshot()
+        _write_json(os.path.join(directory, self._file_name), snapshot)
+        return snapshot
+
+    def _flush_forever(self):
+        interval = _flush_interval()
+        while True:
+            time.sleep(interval)
+            try:
+                self.flush()
+            except OSError as e:
+                log.warning(f"Metrics flush failed: {e}")
+
+
+REGISTRY = Registry()
+
+
+@atexit.register
+def _flush_at_exit():
+    # Only processes that recorded anything (workers, not the gunicorn master).
+    if REGISTRY._flusher is not None and REGISTRY._pid == os.getpid():
+        REGISTRY.flush()
+
+
+def inc(name, labels=None, amount=1):
+    REGISTRY.inc(name, labels, amount)
+
+
+def observe(name, value, labels=None):
+    REGISTRY.observe(name, value, labels)
+
+
+def clear_metrics_dir():
+    """Remove flushed worker files, e.g. when a fresh master starts."""
+    directory = _metrics_dir()
+    if directory is None or not os.path.isdir(directory):
+        return
+    for name in os.listdir(directory):
+        if name.endswith(".json"):
+            os.remove(os.path.join(directory, name))
+
+
+def retire_worker(pid):
+    """Fold an exited worker's last flush into retired.json and remove its file.
+
+    Called by the one process that reaps workers (the gunicorn master).
+    retired.json also lists the most recently folded file names and is written
+    before those files are removed, so `aggregate` can tell which worker files it
+    read are already included in the retired totals.
+    """
+    directory = _metrics_dir()
+    if directory is None or not os.path.isdir(directory):
+        return
+    retired = _read_retired(directory)
+    total = {"counters": {}, "histograms": {}}
+    _merge(total, retired)
+    folded = []
+    for name in os.listdir(directory):
+        if not (name.startswith(f"{pid}-") and name.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(directory, name)) as f:
+                _merge(total, json.load(f))
+        except (OSError, ValueError) as e:
+            log.warning(f"Could not retire metrics file {name}: {e}")
+            continue
+        folded.append(name)
+    if not folded:
+        return
+    _write_json(os.path.join(directory, RETIRED_FILE), {
+        **_to_snapshot(total), "folded": (retired["folded"] + folded)[-_FOLDED_NAMES_KEPT:],
+    })
+    for name in folded:
+        os.remove(os.path.join(directory, name))
+
+
+def _read_retired(directory):
+    try:
+        with open(os.path.join(directory, RETIRED_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"counters": [], "histograms": [], "folded": []}
+
+
+def _to_snapshot(total):
+    return {
+        "counters": [[name, list(labels), value] for (name, labels), value in total["counters"].items()],
+        "histograms": [[name, list(labels), list(h)] for (name, labels), h in total["histograms"].items()],
+    }
+
+
+def _merge(total, snapshot):
+    for name, labels, value in snapshot["counters"]:
+        key = (name, tuple(tuple(pair) for pair in labels))
+        total["counters"][key] = total["counters"].get(key, 0) + value
+    for name, labels, histogram in snapshot["histograms"]:
+        key = (name, tuple(tuple(pair) for pair in labels))
+        current = total["histograms"].setdefault(key, [0] * len(histogram))
+        for i, value in enumerate(histogram):
+            current[i] += value
+
+
+def aggregate():
+    """This process's counts plus every other worker's last flush.
+
+    This process flushes first and reports exactly what it wrote, so its share
+    never exceeds what a later scrape served by another worker will read from its
+    file, and consecutive scrapes never see a counter go down.
+    """
+    total = {"counters": {}, "histograms": {}}
+    try:
+        own = REGISTRY.flush()
+    except OSError as e:
+        log.warning(f"Metrics flush failed: {e}")
+        own = None
+    _merge(total, own if own is not None else REGISTRY.snapshot())
+    directory = _metrics_dir()
+    if directory is not None and os.path.isdir(directory):
+        workers = {}
+        for name in os.listdir(directory):
+            if not name.endswith(".json") or name in (REGISTRY._file_name, RETIRED_FILE):
+                continue
+            try:
+                with open(os.path.join(directory, name)) as f:
+                    workers[name] = json.load(f)
+            except (OSError, ValueError):
+                continue  # retired since the listing; counted in retired.json below
+        # Read after the worker files: retire_worker writes retired.json before it
+        # removes a file, so a worker read above is either listed as folded here
+        # (and taken from the retired totals) or not yet included in them.
+        retired = _read_retired(directory)
+        _merge(total, retired)
+        folded = set(retired["folded"])
+        for name, snapshot in workers.items():
+            if name not in folded:
+                _merge(total, snapshot)
+    return total
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value):
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_prometheus(total=None):
+    """Prometheus text exposition (format 0.0.4) of the aggregated metrics."""
+    total = total if total is not None else aggregate()
+    lines = []
+    for name, (kind, help_text) in _HELP.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        if kind == "counter":
+            for (metric, labels), value in sorted(total["counters"].items()):
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+            continue
+        for (metric, labels), histogram in sorted(total["histograms"].items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, histogram):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(labels, [('le', repr(bound))])} {cumulative}")
+            cumulative += histogram[len(LATENCY_BUCKETS)]
+            lines.append(f"{name}_bucket{_format_labels(labels, [('le', '+Inf')])} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram[-1])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,100 @@
+"""Opt-in cProfile capture of individual API requests.
+
+Enabled only when PROFILE_DIR is set; otherwise no hooks are installed and
+requests pay nothing. Once enabled, a request is profiled when it is picked by
+PROFILE_SAMPLE_RATE (0-1) or, only if PROFILE_TOKEN is set, when it carries an
+`X-Profile` header equal to that token. Without a token the header is ignored,
+so clients can't make the server profile and write files on demand. Each
+profiled request writes two files:
+
+    <PROFILE_DIR>/<time>-<route>-<pid>-<n>.prof   cProfile stats
+    <PROFILE_DIR>/<time>-<route>-<pid>-<n>.json   route, params, data version, status, duration
+
+and returns the file stem in an `X-Profile-Id` header. Inspect with e.g.
+`python -m pstats <file>.prof` (then `sort cumtime`, `stats 25`) or snakeviz.
+"""
+import cProfile
+import hmac
+import itertools
+import json
+import logging
+import os
+import random
+import re
+import time
+
+from flask import g, request
+
+log = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+_counter = itertools.count()
+
+
+def _read_sample_rate():
+    try:
+        return min(max(float(os.environ.get("PROFILE_SAMPLE_RATE", "0")), 0.0), 1.0)
+    except ValueError:
+        return 0.0
+
+
+def _slug(route):
+    return re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+
+
+def install_profiler(app, directory):
+    sample_rate = _read_sample_rate()
+    token = os.environ.get("PROFILE_TOKEN") or None
+    os.makedirs(directory, exist_ok=True)
+
+    def wanted():
+        header = request.headers.get(PROFILE_HEADER)
+        if token is not None and header is not None and hmac.compare_digest(header.encode(), token.encode()):
+            return True
+        return sample_rate > 0 and random.random() < sample_rate
+
+    # Registered before the app's own hooks so snapshot pinning/loading is included.
+    @app.before_request
+    def start_profile():
+        if not request.path.startswith("/api/") or not wanted():
+            return
+        g.profile_start = time.perf_counter()
+        g.profiler = cProfile.Profile()
+        try:
+            g.profiler.enable()
+        except ValueError:  # another profiler already active on this thread
+            g.pop("profiler")
+
+    @app.after_request
+    def write_profile(response):
+        profiler = g.pop("profiler", None)
+        if profiler is None:
+            return response
+        profiler.disable()
+        elapsed = time.perf_counter() - g.profile_start
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        stem = f"{time.strftime('%Y%m%dT%H%M%S')}-{_slug(route)}-{os.getpid()}-{next(_counter)}"
+        try:
+            profiler.dump_stats(os.path.join(directory, f"{stem}.prof"))
+            with open(os.path.join(directory, f"{stem}.json"), "w") as f:
+                json.dump({
+                    "route": route,
+                    "path": request.path,
+                    "params": request.args.to_dict(flat=False),
+                    "view_args": request.view_args or {},
+                    "data_version": g.get("data_version"),
+                    "status": response.status_code,
+                    "duration_ms": round(elapsed * 1000, 3),
+                }, f, indent=2)
+        except OSError as e:
+            log.warning(f"Could not write request profile: {e}")
+            return response
+        response.headers["X-Profile-Id"] = stem
+        return response
+
+    @app.teardown_request
+    def discard_profile(exc):
+        # Only left set when the request failed before after_request ran.
+        profiler = g.pop("profiler", None)
+        if profiler is not None:
+            profiler.disable()
@@ -0,0 +1,150 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from flask import current_app, request
+
+from app.services.vintage_service import data_version
+from app.utils.compression import choose_encoding, compress_variants
+from app.utils.server_timing import phase, record_cache
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    variants: dict  # Content-Encoding -> precompressed body
+
+
+class ResponseCache:
+    """Serialized JSON bodies keyed by (endpoint, params), each with a content-hash ETag
+    and gzip/brotli variants compressed once when the entry is built.
+
+    The response space is small and fixed (years x endpoints x significances), so
+    entries are kept for the lifetime of a data version. The previous version's
+    entries are retained so requests still pinned to it during a reload stay cached.
+    Responses carrying geometry go in a BoundedResponseCache instead.
+    """
+
+    def __init__(self, max_versions=2):
+        self._max_versions = max_versions
+        self._generations = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, version, key, build):
+        entries = self._generations.get(version)
+        if entries is None:
+            with self._lock:
+                entries = self._generations.setdefault(version, {})
+                while len(self._generations) > self._max_versions:
+                    self._generations.popitem(last=False)
+        entry = entries.get(key)
+        if entry is None:
+            entry = _serialize(build())
+            entries[key] = entry
+        return entry
+
+    def clear(self):
+        self._generations = OrderedDict()
+
+    def __len__(self):
+        return sum(len(entries) for entries in list(self._generations.values()))
+
+
+class BoundedResponseCache:
+    """Serialized responses in an LRU bounded by their total size in bytes, for keys
+    whose bodies are large and whose space isn't small, e.g. geometry per (year, zoom).
+
+    Keys include the data version, so entries from a previous version stop being hit
+    after a reload and age out. A body larger than the whole budget is served but not
+    kept.
+    """
+
+    def __init__(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get_or_build(self, version, key, build):
+        key = (version, key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        entry = _serialize(build())
+        size = _entry_size(entry)
+        if size > self._max_bytes:
+            return entry
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = entry
+                self._size += size
+                while self._size > self._max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._size -= _entry_size(evicted)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries = OrderedDict()
+            self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _entry_size(entry):
+    return len(entry.body) + sum(len(variant) for variant in entry.variants.values())
+
+
+def _serialize(payload, compress=True):
+    with phase("serialize"):
+        body = current_app.json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        return CachedResponse(body, etag, compress_variants(body) if compress else {})
+
+
+def negotiated_response(entry, mimetype):
+    """Response for a cached entry in the best encoding the client accepts. Each
+    encoding gets its own strong ETag so conditional requests stay correct."""
+    encoding = choose_encoding(request.accept_encodings, entry.variants)
+    if encoding is None:
+        response = current_app.response_class(entry.body, mimetype=mimetype)
+        response.set_etag(entry.etag)
+    else:
+        response = current_app.response_class(entry.variants[encoding], mimetype=mimetype)
+        response.headers["Content-Encoding"] = encoding
+        response.set_etag(f"{entry.etag}-{encoding}")
+    if entry.variants:
+        response.vary.add("Accept-Encoding")
+    return response.make_conditional(request)
+
+
+def _conditional_response(entry):
+    return negotiated_response(entry, "application/json")
+
+
+def json_with_etag(payload):
+    """Serve a one-off JSON payload with a content ETag, bypassing the cache (and
+    compression). For responses whose parameters (e.g. a bbox) make the key space
+    unbounded."""
+    return _conditional_response(_serialize(payload, compress=False))
+
+
+def cached_json(key, build, cache="response"):
+    """Serve `build()` as JSON from one of the app's response caches, honoring
+    If-None-Match. `cache` is "response" for the per-version cache or "geometry"
+    for the size-bounded one that holds responses carrying region geometry."""
+    missed = False
+
+    def timed_build():
+        nonlocal missed
+        missed = True
+        with phase("compute"):
+            return build()
+
+    entry = current_app.extensions[f"{cache}_cache"].get_or_build(data_version(), key, timed_build)
+    record_cache(cache, hit=not missed)
+    return _conditional_response(entry)
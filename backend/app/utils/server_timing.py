@@ -0,0 +1,51 @@
+"""Per-request phase timings, reported in the Server-Timing response header.
+
+Phases accumulate on flask.g, so the same phase entered twice in one request adds
+up. Outside a request (benchmarks, scripts) every helper is a no-op.
+"""
+import time
+from contextlib import contextmanager
+
+from flask import g, has_request_context, request
+
+from app.utils import metrics
+
+# Set on the startup warmup's own requests (app/services/warmup.py) to keep them out
+# of the metrics; clients can't set environ keys.
+WARMUP_ENVIRON_KEY = "vintage_map.warmup"
+
+
+def is_warmup_request():
+    return has_request_context() and bool(request.environ.get(WARMUP_ENVIRON_KEY))
+
+
+@contextmanager
+def phase(name):
+    if not has_request_context():
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases = g.setdefault("server_timing", {})
+        phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def record_cache(cache, hit):
+    """Note a cache lookup on the current response and in the metrics."""
+    if is_warmup_request():
+        return
+    result = "hit" if hit else "miss"
+    metrics.inc("vintage_cache_requests_total", {"cache": cache, "result": result})
+    if has_request_context():
+        g.server_timing_cache = result
+
+
+def header_value(total):
+    """Server-Timing value: each phase in ms, the cache result, and `total`."""
+    parts = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in g.get("server_timing", {}).items()]
+    if "server_timing_cache" in g:
+        parts.append(f'cache;desc="{g.server_timing_cache}"')
+    parts.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(parts)
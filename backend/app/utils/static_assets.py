@@ -0,0 +1,95 @@
+import hashlib
+import mimetypes
+import os
+import re
+from typing import NamedTuple
+
+from flask import abort, request, send_file
+
+from app.utils.compression import choose_encoding
+
+# Precompressed siblings written at build time by scripts/precompress_static.py
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# Vite emits content-hashed bundles as assets/<name>-<hash>.<ext>; their URL
+# changes whenever their bytes do, so browsers may keep them forever.
+_HASHED_ASSET = re.compile(r"^assets/.+-[A-Za-z0-9_-]{8,}\.[A-Za-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+ENTRY_CACHE_CONTROL = "no-cache"
+DEFAULT_CACHE_CONTROL = "public, max-age=3600"
+
+
+class StaticAsset(NamedTuple):
+    path: str            # absolute path on disk
+    mimetype: str
+    size: int
+    etag: str
+    cache_control: str
+    variants: dict       # Content-Encoding -> (absolute path, size)
+
+
+def _cache_control(relpath):
+    if relpath == "index.html":
+        return ENTRY_CACHE_CONTROL
+    if _HASHED_ASSET.match(relpath):
+        return IMMUTABLE_CACHE_CONTROL
+    return DEFAULT_CACHE_CONTROL
+
+
+def _file_etag(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_static_manifest(static_dir):
+    """Every servable file under `static_dir`, keyed by URL path relative to the root.
+
+    Built once at startup so serving the SPA is a dict lookup: no per-request
+    filesystem probing or hashing. The frontend build is immutable for the life
+    of the process, so the manifest never needs refreshing.
+    """
+    manifest = {}
+    if not os.path.isdir(static_dir):
+        return manifest
+    suffixes = tuple(ENCODING_SUFFIXES.values())
+    for root, _, files in os.walk(static_dir):
+        for name in files:
+            if name.endswith(suffixes):
+                continue
+            path = os.path.join(root, name)
+            relpath = os.path.relpath(path, static_dir).replace(os.sep, "/")
+            variants = {}
+            for encoding, suffix in ENCODING_SUFFIXES.items():
+                if os.path.isfile(path + suffix):
+                    variants[encoding] = (path + suffix, os.path.getsize(path + suffix))
+            manifest[relpath] = StaticAsset(
+                path=path,
+                mimetype=mimetypes.guess_type(name)[0] or "application/octet-stream",
+                size=os.path.getsize(path),
+                etag=_file_etag(path),
+                cache_control=_cache_control(relpath),
+                variants=variants,
+            )
+    return manifest
+
+
+def send_static_asset(manifest, relpath):
+    """Serve `relpath` from the manifest, falling back to index.html for client-side
+    routes. Honors If-None-Match and picks a precompressed variant when accepted."""
+    asset = manifest.get(relpath) or manifest.get("index.html")
+    if asset is None:
+        abort(404)
+    encoding = choose_encoding(request.accept_encodings, asset.variants)
+    if encoding is None:
+        response = send_file(asset.path, mimetype=asset.mimetype, etag=asset.etag, conditional=True)
+    else:
+        path, _ = asset.variants[encoding]
+        response = send_file(path, mimetype=asset.mimetype, etag=f"{asset.etag}-{encoding}", conditional=True)
+        response.headers["Content-Encoding"] = encoding
+    if asset.variants:
+        response.vary.add("Accept-Encoding")
+    response.headers["Cache-Control"] = asset.cache_control
+    return response
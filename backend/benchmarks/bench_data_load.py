@@ -0,0 +1,102 @@
+"""Compare cold-load cost of the JSON sources against the compiled runtime artifact.
+
+The json path is what the service does without a current snapshot: parse,
+validate and build every index. Each path runs in a fresh interpreter so
+resident memory reflects only that load.
+
+    python benchmarks/bench_data_load.py [--repeat 20]
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BACKEND_DIR)
+
+from app.services.compiled_data import (  # noqa: E402
+    COMPILED_PATH, GEOJSON_PATH, VINTAGE_PATH, build_runtime_data, compile_from_sources, read_compiled,
+    source_version,
+)
+from app.services.data_schema import validate_geojson, validate_vintage_data  # noqa: E402
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def load_json():
+    vintage_raw, geojson_raw = _read(VINTAGE_PATH), _read(GEOJSON_PATH)
+    source_version(vintage_raw, geojson_raw)
+    vintage_data, geojson_data = json.loads(vintage_raw), json.loads(geojson_raw)
+    validate_vintage_data(vintage_data)
+    validate_geojson(geojson_data)
+    return build_runtime_data(vintage_data, geojson_data)
+
+
+def load_compiled():
+    vintage_raw, geojson_raw = _read(VINTAGE_PATH), _read(GEOJSON_PATH)
+    return read_compiled(source_version(vintage_raw, geojson_raw))
+
+
+LOADERS = {"json": load_json, "compiled": load_compiled}
+
+
+def _max_rss_kb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def measure(path_name, repeat):
+    """Run inside the child interpreter: time `repeat` loads, report RSS growth of the first."""
+    loader = LOADERS[path_name]
+    before = _max_rss_kb()
+    start = time.perf_counter()
+    data = loader()
+    first = time.perf_counter() - start
+    assert data is not None, f"{path_name} loader returned nothing"
+    rss_delta = _max_rss_kb() - before
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader()
+        timings.append(time.perf_counter() - start)
+    return {"first_ms": first * 1000, "median_ms": statistics.median(timings) * 1000,
+            "min_ms": min(timings) * 1000, "rss_delta_kb": rss_delta}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--child", choices=sorted(LOADERS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.repeat)))
+        return
+
+    if read_compiled(source_version(_read(VINTAGE_PATH), _read(GEOJSON_PATH))) is None:
+        compile_from_sources()
+
+    print(f"vintage_data.json    {os.path.getsize(VINTAGE_PATH) / 1024:8.1f} KB")
+    print(f"wine_regions.geojson {os.path.getsize(GEOJSON_PATH) / 1024:8.1f} KB")
+    print(f"compiled snapshot    {os.path.getsize(COMPILED_PATH) / 1024:8.1f} KB")
+    print()
+    print(f"{'path':10s} {'first ms':>9s} {'median ms':>10s} {'min ms':>8s} {'RSS +KB':>8s}")
+    for name in LOADERS:
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", name, "--repeat", str(args.repeat)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        r = json.loads(out)
+        print(f"{name:10s} {r['first_ms']:9.2f} {r['median_ms']:10.2f} {r['min_ms']:8.2f} {r['rss_delta_kb']:8d}")
+
+
+if __name__ == "__main__":
+    main()
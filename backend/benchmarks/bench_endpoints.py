@@ -0,0 +1,210 @@
+"""Micro-benchmarks for the hot service functions and the full HTTP path.
+
+Every case is timed warm (caches populated by earlier calls) and most also cold:
+"cold" drops the data snapshot and every in-process cache before each call, the
+way the first request after a deploy or data reload sees them. The HTTP cases go
+through create_app().test_client(), including the 304 revalidation path.
+
+    python benchmarks/bench_endpoints.py run [--quick] [--filter recommend] [--output results.json]
+    python benchmarks/bench_endpoints.py compare baselines/reference.json results.json [--threshold 25]
+
+`run --output` writes a JSON baseline; `compare` diffs two of them and exits 1
+if any case's median regressed by more than --threshold percent. Timings are
+normalized by a fixed pure-Python calibration workload recorded with each run,
+so baselines from a different machine compare meaningfully (if loosely).
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BACKEND_DIR)
+# Cold cases control cache state themselves; a background warmup would race them.
+os.environ["WARMUP"] = "off"
+
+from app import create_app  # noqa: E402
+from app.services import recommendation, vector_tiles, vintage_service  # noqa: E402
+
+YEAR = 2015
+SIGNIFICANCE = "birthday"
+
+
+def _drop_caches(app):
+    """Forget the data snapshot and everything derived from it."""
+    vintage_service._swap_in(None)
+    app.extensions["response_cache"].clear()
+    app.extensions["geometry_cache"].clear()
+    recommendation._recommend_cached.cache_clear()
+    recommendation._recommend_range_cached.cache_clear()
+    recommendation._bonus_vectors.cache_clear()
+    vector_tiles._render_cached.cache_clear()
+
+
+def _cases(app):
+    client = app.test_client()
+
+    def http_get(path, **headers):
+        def call():
+            response = client.get(path, headers=headers)
+            assert response.status_code in (200, 304), f"{path}: {response.status_code}"
+        return call
+
+    def etag_of(path):
+        return client.get(path).headers["ETag"]
+
+    services = {
+        "get_vintage_by_year": lambda: vintage_service.get_vintage_by_year(YEAR),
+        "get_year_report": lambda: vintage_service.get_year_report(YEAR),
+        "get_regions_geojson_with_vintage": lambda: vintage_service.get_regions_geojson_with_vintage(YEAR),
+        "get_regions_geojson_with_vintage[zoom=4]": lambda: vintage_service.get_regions_geojson_with_vintage(YEAR, zoom=4),
+        "recommend": lambda: recommendation.recommend(YEAR, SIGNIFICANCE),
+    }
+    paths = {
+        "http /api/vintage/<year>": f"/api/vintage/{YEAR}",
+        "http /api/vintage/<year>/report": f"/api/vintage/{YEAR}/report",
+        "http /api/regions/<year>": f"/api/regions/{YEAR}",
+        "http /api/recommend": f"/api/recommend?year={YEAR}&significance={SIGNIFICANCE}",
+        "http /api/tiles/<year>/3/4/2.mvt": f"/api/tiles/{YEAR}/3/4/2.mvt",
+    }
+
+    cases = []
+    for name, call in services.items():
+        cases.append((f"{name} cold", call, True))
+        cases.append((f"{name} warm", call, False))
+    for name, path in paths.items():
+        cases.append((f"{name} cold", http_get(path), True))
+        cases.append((f"{name} warm", http_get(path), False))
+        cases.append((f"{name} 304", http_get(path, **{"If-None-Match": etag_of(path)}), False))
+    return cases
+
+
+def _time(call, setup, repeat, min_seconds):
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < repeat or time.perf_counter() - started < min_seconds:
+        setup()
+        start = time.perf_counter_ns()
+        call()
+        timings.append((time.perf_counter_ns() - start) / 1000)
+        if len(timings) >= repeat * 20:
+            break
+    timings.sort()
+    return {
+        "iterations": len(timings),
+        "median_us": statistics.median(timings),
+        "p95_us": timings[min(len(timings) - 1, int(0.95 * len(timings)))],
+        "mean_us": statistics.fmean(timings),
+        "min_us": timings[0],
+    }
+
+
+def _calibrate(repeat=15):
+    """Median time of a fixed interpreter-bound workload, for cross-machine scaling."""
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(20000)]
+
+    def workload():
+        json.dumps(sorted(values)[::10])
+
+    workload()
+    return _time(workload, lambda: None, repeat, 0)["median_us"]
+
+
+def run(args):
+    app = create_app()
+    repeat, min_seconds = (10, 0.05) if args.quick else (50, 0.5)
+    results = {}
+    for name, call, cold in _cases(app):
+        if args.filter and args.filter not in name:
+            continue
+        if cold:
+            result = _time(call, lambda: _drop_caches(app), repeat, min_seconds)
+        else:
+            call()
+            result = _time(call, lambda: None, repeat, min_seconds)
+        results[name] = result
+        print(f"{name:<48} {result['median_us']:>10.1f} us  p95 {result['p95_us']:>10.1f} us  "
+              f"({result['iterations']} runs)")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "calibration_us": _calibrate(),
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f"\nWrote {args.output}")
+    return 0
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    scale = 1.0
+    if not args.no_normalize:
+        scale = baseline["meta"]["calibration_us"] / current["meta"]["calibration_us"]
+        print(f"Normalizing by calibration: current timings x {scale:.2f}")
+
+    regressions = []
+    print(f"{'case':<48} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    for name, base in baseline["results"].items():
+        if name not in current["results"]:
+            print(f"{name:<48} {base['median_us']:>12.1f} {'missing':>12}")
+            continue
+        now = current["results"][name]["median_us"] * scale
+        change = (now - base["median_us"]) / base["median_us"] * 100
+        flag = ""
+        if change > args.threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<48} {base['median_us']:>12.1f} {now:>12.1f} {change:>+7.1f}%{flag}")
+    for name in current["results"].keys() - baseline["results"].keys():
+        print(f"{name:<48} {'new':>12} {current['results'][name]['median_us'] * scale:>12.1f}")
+
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:g}%")
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:g}%")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the hot endpoints and compare against baselines.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="time every case")
+    run_parser.add_argument("--quick", action="store_true", help="fewer iterations, for CI smoke runs")
+    run_parser.add_argument("--filter", help="only cases whose name contains this")
+    run_parser.add_argument("--output", help="write results as a JSON baseline")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="diff two JSON baselines")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=25.0, help="allowed median slowdown in percent")
+    compare_parser.add_argument("--no-normalize", action="store_true", help="compare raw timings")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Scraper fetch layer against local stub sites: cold refresh, revalidation, partial change.
+
+Each stub site is a local HTTP server on its own port (so its own host for the
+per-host limits) that answers every page after `--latency` ms, sets ETag and
+Last-Modified, and honours If-None-Match / If-Modified-Since with a 304. Runs:
+
+    serial        one request at a time per site, empty cache
+    cold          concurrent, empty cache: every page downloaded
+    revalidate    concurrent, nothing changed: every page a 304
+    changed       concurrent, `--change` of the pages edited: only those downloaded
+
+    python benchmarks/bench_scraper.py [--sites 3] [--pages 200] [--latency 50] [--rate 0]
+
+By default the per-host rate limit is off, to show what concurrency and
+revalidation buy. With `--rate R`, each site takes about pages / R seconds
+whatever the cache state, and revalidation saves bandwidth rather than time.
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, BACKEND_DIR)
+
+from scraper.fetch import Fetcher  # noqa: E402
+from scraper.refresh import refresh  # noqa: E402
+from scraper.sources.base import Source  # noqa: E402
+
+
+class StubSite:
+    """Pages `/vintage/<n>` whose content changes when their revision is bumped."""
+
+    def __init__(self, pages, latency):
+        self.revisions = [0] * pages
+        self.latency = latency
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def page(self, n):
+        revision = self.revisions[n]
+        body = f"<html><body><p class='score'>{80 + (n + revision) % 20}</p>{'x' * 20000}</body></html>".encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        return body, etag, formatdate(1_700_000_000 + revision * 86400, usegmt=True)
+
+    def _handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                time.sleep(site.latency)
+                n = int(self.path.rsplit("/", 1)[-1])
+                body, etag, last_modified = site.page(n)
+                unchanged = (self.headers.get("If-None-Match") == etag
+                             or self.headers.get("If-Modified-Since") == last_modified)
+                self.send_response(304 if unchanged else 200)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", last_modified)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", "0" if unchanged else str(len(body)))
+                self.end_headers()
+                if not unchanged:
+                    self.wfile.write(body)
+                with site._lock:
+                    site.requests += 1
+                    site.bytes_sent += 0 if unchanged else len(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+class StubSource(Source):
+    def __init__(self, name, site):
+        self.name = name
+        self.site = site
+
+    def urls(self):
+        return [f"{self.site.base_url}/vintage/{n}" for n in range(len(self.site.revisions))]
+
+    def parse(self, result):
+        n = int(result.url.rsplit("/", 1)[-1])
+        score = int(result.text.split("<p class='score'>")[1].split("<")[0])
+        return [{"region_key": f"{self.name}_{n}", "year": 2000, "score": score}]
+
+
+def run(label, sites, sources, cache_dir, output_dir, **fetcher_args):
+    for site in sites:
+        site.requests = site.bytes_sent = 0
+    start = time.perf_counter()
+    with Fetcher(cache_dir, **fetcher_args) as fetcher:
+        failures = refresh(sources, fetcher, output_dir)
+    elapsed = time.perf_counter() - start
+    pages = sum(len(site.revisions) for site in sites)
+    mb = sum(site.bytes_sent for site in sites) / 1e6
+    print(f"  -> {label:<11} {elapsed:>7.2f} s  {pages / elapsed:>7.1f} pages/s  {mb:>6.2f} MB  "
+          f"{fetcher.stats}  failed={sum(map(len, failures.values()))}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scraper fetch layer against stub sites.")
+    parser.add_argument("--sites", type=int, default=3)
+    parser.add_argument("--pages", type=int, default=200, help="pages per site")
+    parser.add_argument("--latency", type=float, default=50, help="server latency per request, ms")
+    parser.add_argument("--rate", type=float, default=0, help="per-host request rate limit (0: none)")
+    parser.add_argument("--per-host", type=int, default=4)
+    parser.add_argument("--change", type=float, default=0.1, help="fraction of pages changed before the last run")
+    parser.add_argument("--skip-serial", action="store_true")
+    args = parser.parse_args()
+
+    sites = [StubSite(args.pages, args.latency / 1000) for _ in range(args.sites)]
+    sources = [StubSource(f"site{i}", site) for i, site in enumerate(sites)]
+    workdir = tempfile.mkdtemp(prefix="bench-scraper-")
+    cache_dir, output_dir = os.path.join(workdir, "cache"), os.path.join(workdir, "out")
+    print(f"{args.sites} sites x {args.pages} pages, {args.latency:g} ms latency, "
+          f"{f'{args.rate:g} req/s' if args.rate > 0 else 'no rate limit'} and {args.per_host} concurrent per host\n")
+    try:
+        if not args.skip_serial:
+            run("serial", sites, sources, os.path.join(workdir, "serial-cache"), output_dir,
+                threads=1, per_host_concurrency=1, per_host_rate=args.rate)
+        concurrent = dict(per_host_concurrency=args.per_host, per_host_rate=args.rate)
+        run("cold", sites, sources, cache_dir, output_dir, **concurrent)
+        run("revalidate", sites, sources, cache_dir, output_dir, **concurrent)
+        for site in sites:
+            for n in range(0, args.pages, max(int(1 / args.change), 1) if args.change > 0 else args.pages + 1):
+                site.revisions[n] += 1
+        run("changed", sites, sources, cache_dir, output_dir, **concurrent)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+        for site in sites:
+            site.server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Side-by-side throughput of the WSGI (gunicorn sync) and ASGI (gunicorn + uvicorn
+worker) entry points.
+
+Both servers run the same app with the same worker count and are driven by the
+same closed-loop client: `--concurrency` keep-alive connections, each issuing its
+next request as soon as the previous one completes. `--slow-clients` additionally
+holds that many connections open mid-request, the way a client on a bad network
+does, to show how each server copes while they are stuck.
+
+    python benchmarks/bench_servers.py [--concurrency 32] [--duration 10] [--slow-clients 4]
+"""
+import argparse
+import http.client
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+PATHS = (
+    "/api/year-range",
+    "/api/vintage/2015",
+    "/api/vintage/2015/report",
+    "/api/recommend?year=2010&significance=birthday",
+    "/api/regions/2015/scores",
+    "/api/regions/at?lng=4.8&lat=45.0&year=2015",
+)
+
+SERVERS = {
+    "wsgi": lambda port, workers: [
+        sys.executable, "-m", "gunicorn", "run:app", "--bind", f"127.0.0.1:{port}",
+        "--workers", str(workers), "--timeout", "120", "--log-level", "warning",
+    ],
+    # Same process manager for both, so only the worker model differs.
+    "asgi": lambda port, workers: [
+        sys.executable, "-m", "gunicorn", "run_asgi:app", "--bind", f"127.0.0.1:{port}",
+        "--workers", str(workers), "--worker-class", "uvicorn.workers.UvicornWorker",
+        "--timeout", "120", "--log-level", "warning",
+    ],
+}
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/api/ready")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not become ready")
+
+
+def _hold_slow_clients(port, count):
+    """Open `count` connections that send only part of their request headers."""
+    sockets = []
+    for _ in range(count):
+        s = socket.create_connection(("127.0.0.1", port))
+        s.sendall(b"GET /api/year-range HTTP/1.1\r\nHost: localhost\r\n")
+        sockets.append(s)
+    return sockets
+
+
+def _client(port, deadline, latencies, errors, offset):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    i = offset
+    while time.monotonic() < deadline:
+        path = PATHS[i % len(PATHS)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            conn.request("GET", path, headers={"Accept-Encoding": "gzip, br"})
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(response.status)
+                continue
+        except (OSError, http.client.HTTPException):
+            errors.append("connection")
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+            continue
+        latencies.append(time.perf_counter() - start)
+    conn.close()
+
+
+def run(kind, workers, concurrency, duration, slow_clients):
+    port = _free_port()
+    proc = subprocess.Popen(SERVERS[kind](port, workers), cwd=BACKEND_DIR)
+    try:
+        _wait_ready(port)
+        # Warm every worker's caches before measuring.
+        warm_deadline = time.monotonic() + 1
+        _client(port, warm_deadline, [], [], 0)
+        held = _hold_slow_clients(port, slow_clients)
+
+        latencies, errors = [], []
+        deadline = time.monotonic() + duration
+        threads = [
+            threading.Thread(target=_client, args=(port, deadline, latencies, errors, n))
+            for n in range(concurrency)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for s in held:
+            s.close()
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    latencies.sort()
+    pick = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000 if latencies else float("nan")  # noqa: E731
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / duration,
+        "p50_ms": pick(0.50),
+        "p99_ms": pick(0.99),
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare WSGI and ASGI throughput.")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--slow-clients", type=int, default=0)
+    parser.add_argument("--only", choices=sorted(SERVERS))
+    args = parser.parse_args()
+
+    kinds = [args.only] if args.only else ["wsgi", "asgi"]
+    print(f"workers={args.workers} concurrency={args.concurrency} duration={args.duration}s "
+          f"slow_clients={args.slow_clients}")
+    print(f"{'server':<8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}{'errors':>8}")
+    for kind in kinds:
+        r = run(kind, args.workers, args.concurrency, args.duration, args.slow_clients)
+        print(f"{kind:<8}{r['rps']:>10.0f}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['mean_ms']:>10.2f}{r['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
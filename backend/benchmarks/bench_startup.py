@@ -0,0 +1,102 @@
+"""Cold-start budget: import time of the app plus each startup phase, in a fresh interpreter.
+
+Imports are measured with `python -X importtime` and attributed to their
+top-level package, so a newly added dependency or an import moved to module
+level shows up immediately. Phases (create_app, data load, warmup) are timed in a second
+fresh interpreter with warmup disabled so each is isolated.
+
+    python benchmarks/bench_startup.py [--top 15] [--budget-ms 1500]
+
+With --budget-ms, exits 1 when importing the app takes longer than the budget.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+_PHASES = """
+import json, time
+t0 = time.perf_counter()
+from app import create_app
+from app.services.vintage_service import load_data
+from app.services.warmup import warm
+t1 = time.perf_counter()
+app = create_app()
+t2 = time.perf_counter()
+load_data()
+t3 = time.perf_counter()
+state = warm(app)
+t4 = time.perf_counter()
+print(json.dumps({
+    "import app": (t1 - t0) * 1000,
+    "create_app()": (t2 - t1) * 1000,
+    "load data": (t3 - t2) * 1000,
+    "warm caches": (t4 - t3) * 1000,
+    "ready": state.ready.is_set(),
+}))
+"""
+
+
+def _child_env():
+    return {**os.environ, "WARMUP": "off", "PYTHONDONTWRITEBYTECODE": "1"}
+
+
+def import_times():
+    """(module, self_us, cumulative_us, depth) for every import made by `import app`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from app import create_app"],
+        cwd=BACKEND_DIR, env=_child_env(), capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def phase_times():
+    result = subprocess.run(
+        [sys.executable, "-c", _PHASES], cwd=BACKEND_DIR, env=_child_env(),
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure app import time and startup phases.")
+    parser.add_argument("--top", type=int, default=15, help="heaviest packages to list")
+    parser.add_argument("--budget-ms", type=float, help="fail if importing the app exceeds this")
+    args = parser.parse_args()
+
+    rows = import_times()
+    total_ms = sum(cumulative for _, _, cumulative, depth in rows if depth == 0) / 1000
+    by_package = {}
+    for name, self_us, _, _ in rows:
+        package = name.split(".")[0]
+        by_package[package] = by_package.get(package, 0) + self_us
+
+    print(f"{'package':<24} {'self ms':>9} {'share':>7}")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{package:<24} {self_us / 1000:>9.1f} {self_us / 1000 / total_ms:>7.0%}")
+    print(f"\n{len(rows)} modules imported in {total_ms:.1f} ms\n")
+
+    phases = phase_times()
+    for name, value in phases.items():
+        if name != "ready":
+            print(f"{name:<16} {value:>9.1f} ms")
+    if not phases["ready"]:
+        print("warmup did not complete (data unavailable?)")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"\nImport time {total_ms:.1f} ms exceeds the {args.budget_ms:g} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
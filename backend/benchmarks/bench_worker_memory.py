@@ -0,0 +1,141 @@
+"""Per-worker memory of the plain gunicorn command vs the preloaded, frozen profile.
+
+"before" is the historical `gunicorn run:app --workers N` (each worker lazily loads
+its own data); "after" is `gunicorn run:app -c gunicorn.conf.py`. Both are warmed
+with the same requests so every worker has loaded the data, then each worker's
+/proc/<pid>/smaps_rollup is read. Linux only.
+
+    python benchmarks/bench_worker_memory.py [--workers 4] [--requests 400]
+"""
+import argparse
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+PATHS = (
+    "/api/vintage/2015",
+    "/api/vintage/2015/report",
+    "/api/regions/2015",
+    "/api/regions/2015?zoom=4",
+    "/api/recommend?year=2010&significance=birthday",
+    "/api/region/bordeaux/series",
+    "/api/tiles/2015/3/4/2.mvt",
+)
+
+PROFILES = {
+    # -c /dev/null: don't pick up gunicorn.conf.py from the working directory.
+    "before": lambda port, workers: (
+        ["gunicorn", "run:app", "-c", "/dev/null", "--bind", f"127.0.0.1:{port}",
+         "--workers", str(workers), "--timeout", "120"],
+        {},
+    ),
+    "after": lambda port, workers: (
+        ["gunicorn", "run:app", "-c", "gunicorn.conf.py"],
+        {"PORT": str(port), "WEB_CONCURRENCY": str(workers)},
+    ),
+}
+
+FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Dirty")
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _get(port, path):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    try:
+        conn.request("GET", path)
+        return conn.getresponse().status
+    finally:
+        conn.close()
+
+
+def _wait_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if _get(port, "/api/ready") == 200:
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not become ready")
+
+
+def _warm(port, total, concurrency=16):
+    """Fresh connections spread requests across every worker."""
+    def client(n):
+        for i in range(n, total, concurrency):
+            _get(port, PATHS[i % len(PATHS)])
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def _children(pid):
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(p) for p in f.read().split()]
+
+
+def _smaps(pid):
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            name, _, rest = line.partition(":")
+            if name in FIELDS:
+                values[name] = int(rest.split()[0])
+    return values
+
+
+def measure(profile, workers, requests):
+    port = _free_port()
+    cmd, env = PROFILES[profile](port, workers)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", *cmd], cwd=BACKEND_DIR, env={**os.environ, **env},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_ready(port)
+        _warm(port, requests)
+        time.sleep(0.5)
+        return _smaps(proc.pid), [_smaps(pid) for pid in _children(proc.pid)]
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def _row(label, values):
+    return f"{label:<10}" + "".join(f"{values.get(field, 0) / 1024:>18.1f}" for field in FIELDS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-worker memory of the gunicorn profiles.")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=400)
+    args = parser.parse_args()
+
+    header = f"{'process':<10}" + "".join(f"{field + ' MB':>18}" for field in FIELDS)
+    for profile in PROFILES:
+        master, workers = measure(profile, args.workers, args.requests)
+        print(f"\n{profile}: {' '.join(PROFILES[profile]('PORT', args.workers)[0])}")
+        print(header)
+        print(_row("master", master))
+        for i, worker in enumerate(workers):
+            print(_row(f"worker {i}", worker))
+        total_pss = master.get("Pss", 0) + sum(w.get("Pss", 0) for w in workers)
+        print(f"total PSS: {total_pss / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
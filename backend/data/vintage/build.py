@@ -0,0 +1,238 @@
+"""Build vintage_data.json from one source file per region, rebuilding only what changed.
+
+    python data/vintage/build.py [--force] [--no-compile]
+
+Sources:
+
+    dataset.json          metadata (last_updated, sources, drinking_window_as_of)
+                          and the order of regions
+    regions/<key>.json    one region: its properties, longevity and vintages
+
+Sources hold only authored data. Each region is checked against the schema in
+app/services/data_schema.py and gets its derived fields (quality_tier from the
+score, drinking_window from the year, longevity and drinking_window_as_of)
+filled in from the rules there, so they can't drift between regions.
+
+Each region is rendered on its own into a cached fragment of the output
+(`.build/`), keyed by a content hash of its source file. A build re-renders only
+regions whose source changed; unchanged ones are reused without being parsed
+(their files are not even read while size and mtime match the last build). The
+output is those fragments joined in dataset order, in a canonical form: fixed
+key order, vintages sorted by year, `indent=2`, no timestamp of the build. The
+same sources always give the same bytes, so vintage_data.json, the data version
+and every ETag derived from it only change when the data does. vintage_data.json
+and the compiled snapshot are only rewritten when the output changed.
+
+build_vintage_data.py and complete_data.py regenerate the region sources from
+their tables (via `write_region_sources`) and then run this build.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, "..", ".."))
+
+from app.services.data_schema import derive_region, region_problems  # noqa: E402
+
+REGIONS_DIR = os.path.join(SCRIPT_DIR, "regions")
+DATASET_PATH = os.path.join(SCRIPT_DIR, "dataset.json")
+OUTPUT_PATH = os.path.join(SCRIPT_DIR, "vintage_data.json")
+CACHE_DIR = os.path.join(SCRIPT_DIR, ".build")
+
+# Bump when the rendering or the derivation rules change, to invalidate every cached fragment.
+RENDER_VERSION = 2
+REGION_FIELDS = ("display_name", "country", "primary_grapes", "wine_style", "longevity", "vintages")
+VINTAGE_FIELDS = ("score", "quality_tier", "description", "drinking_window", "notable_wines")
+
+
+class BuildError(Exception):
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__("\n  ".join(problems))
+
+
+def _ordered(obj, fields):
+    """`obj` with `fields` first in that order, then any other keys sorted."""
+    return {
+        **{k: obj[k] for k in fields if k in obj},
+        **{k: obj[k] for k in sorted(obj) if k not in fields},
+    }
+
+
+def canonical_region(region):
+    vintages = region["vintages"]
+    return _ordered({
+        **region,
+        "vintages": {year: _ordered(vintages[year], VINTAGE_FIELDS) for year in sorted(vintages, key=int)},
+    }, REGION_FIELDS)
+
+
+def _dumps(obj, depth):
+    """JSON for `obj` as it appears `depth` levels deep in an `indent=2` document."""
+    return json.dumps(obj, indent=2, ensure_ascii=False).replace("\n", "\n" + "  " * depth)
+
+
+def _hash(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _write_if_changed(path, data):
+    """Atomically write `data` (bytes) unless the file already holds exactly that."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return True
+
+
+def write_region_sources(regions, regions_dir=REGIONS_DIR):
+    """Write `regions` ({key: region}) as canonical source files. Returns the keys
+    whose file changed; untouched files keep their mtime, so the next build skips them."""
+    problems = [problem for key, region in regions.items() for problem in region_problems(key, region)]
+    if problems:
+        raise BuildError(problems)
+    os.makedirs(regions_dir, exist_ok=True)
+    changed = []
+    for key, region in regions.items():
+        data = (_dumps(canonical_region(region), 0) + "\n").encode()
+        if _write_if_changed(os.path.join(regions_dir, f"{key}.json"), data):
+            changed.append(key)
+    return changed
+
+
+def _render_region(key, raw, as_of):
+    """(output fragment, (first year, last year)) for one region's source bytes."""
+    try:
+        region = json.loads(raw)
+    except ValueError as e:
+        raise BuildError([f"regions/{key}.json: {e}"]) from e
+    problems = region_problems(key, region)
+    if problems:
+        raise BuildError([f"regions/{key}.json: {problem}" for problem in problems])
+    years = sorted(int(year) for year in region["vintages"])
+    fragment = f"    {json.dumps(key)}: {_dumps(canonical_region(derive_region(region, as_of)), 2)}"
+    return fragment, (years[0], years[-1])
+
+
+def _load_manifest(cache_dir, render_key):
+    try:
+        with open(os.path.join(cache_dir, "manifest.json")) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get("render_key") == render_key else {}
+
+
+def build(regions_dir=REGIONS_DIR, dataset_path=DATASET_PATH, output_path=OUTPUT_PATH,
+          cache_dir=CACHE_DIR, force=False):
+    """Build the output. Returns (output changed, rebuilt region keys, reused region count)."""
+    with open(dataset_path) as f:
+        dataset = json.load(f)
+    order = dataset["regions"]
+    on_disk = {name[:-5] for name in os.listdir(regions_dir) if name.endswith(".json")}
+    if missing := [key for key in order if key not in on_disk]:
+        raise BuildError([f"dataset.json lists regions without a source file: {', '.join(missing)}"])
+    if unlisted := sorted(on_disk - set(order)):
+        raise BuildError([f"Region sources missing from dataset.json: {', '.join(unlisted)}"])
+    if not order:
+        raise BuildError(["dataset.json lists no regions"])
+    as_of = dataset["metadata"].get("drinking_window_as_of")
+    if not isinstance(as_of, int):
+        raise BuildError(["dataset.json: metadata.drinking_window_as_of must be a year"])
+
+    render_key = [RENDER_VERSION, as_of]
+    old = {} if force else _load_manifest(cache_dir, render_key).get("regions", {})
+    fragments_dir = os.path.join(cache_dir, "fragments")
+    os.makedirs(fragments_dir, exist_ok=True)
+    manifest, fragments, rebuilt, problems = {}, [], [], []
+    for key in order:
+        source_path = os.path.join(regions_dir, f"{key}.json")
+        fragment_path = os.path.join(fragments_dir, f"{key}.json")
+        st = os.stat(source_path)
+        stamp = [st.st_size, st.st_mtime_ns]
+        entry = old.get(key)
+        fragment = None
+        if entry is not None:
+            try:
+                with open(fragment_path, encoding="utf-8") as f:
+                    cached = f.read()
+            except OSError:
+                cached = None
+            if cached is not None and _hash(cached.encode()) == entry["fragment"]:
+                if entry["stamp"] == stamp:
+                    fragment = cached
+                else:
+                    with open(source_path, "rb") as f:
+                        if _hash(f.read()) == entry["source"]:  # touched but not changed
+                            fragment = cached
+        if fragment is not None:
+            manifest[key] = {**entry, "stamp": stamp}
+        else:
+            with open(source_path, "rb") as f:
+                raw = f.read()
+            try:
+                fragment, years = _render_region(key, raw, as_of)
+            except BuildError as e:
+                problems.extend(e.problems)
+                continue
+            _write_if_changed(fragment_path, fragment.encode())
+            manifest[key] = {
+                "source": _hash(raw), "stamp": stamp, "fragment": _hash(fragment.encode()), "years": list(years),
+            }
+            rebuilt.append(key)
+        fragments.append(fragment)
+    if problems:
+        raise BuildError(problems)
+
+    metadata = {
+        **dataset["metadata"],
+        "year_range": [min(m["years"][0] for m in manifest.values()), max(m["years"][1] for m in manifest.values())],
+    }
+    output = (
+        '{\n  "metadata": ' + _dumps(metadata, 1) + ',\n  "regions": {\n'
+        + ",\n".join(fragments)
+        + "\n  }\n}"
+    ).encode()
+    changed = _write_if_changed(output_path, output)
+    _write_if_changed(
+        os.path.join(cache_dir, "manifest.json"),
+        json.dumps({"render_key": render_key, "regions": manifest}, indent=1, sort_keys=True).encode(),
+    )
+    return changed, rebuilt, len(order) - len(rebuilt)
+
+
+def main(force=False, compile_snapshot=True):
+    start = time.perf_counter()
+    try:
+        changed, rebuilt, reused = build(force=force)
+    except BuildError as e:
+        print(f"Build failed:\n  {e}", file=sys.stderr)
+        sys.exit(1)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Rebuilt {len(rebuilt)} regions, reused {reused} in {elapsed:.0f} ms"
+          + (f": {', '.join(rebuilt)}" if 0 < len(rebuilt) <= 10 else ""))
+    print(f"{'Wrote' if changed else 'Unchanged:'} {os.path.normpath(OUTPUT_PATH)}")
+
+    if compile_snapshot:
+        from compile_snapshot import COMPILED_PATH, main as compile_main
+
+        if changed or force or not os.path.exists(COMPILED_PATH):
+            compile_main()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build vintage_data.json from the per-region sources.")
+    parser.add_argument("--force", action="store_true", help="re-render every region and recompile")
+    parser.add_argument("--no-compile", action="store_true", help="skip compiling the binary snapshot")
+    args = parser.parse_args()
+    main(force=args.force, compile_snapshot=not args.no_compile)
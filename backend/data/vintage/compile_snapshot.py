@@ -0,0 +1,23 @@
+"""Validate vintage_data.json and wine_regions.geojson and compile them into the runtime
+artifact the API loads at startup. Exits 1, writing nothing, if either is invalid."""
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, "..", ".."))
+
+from app.services.compiled_data import COMPILED_PATH, compile_from_sources  # noqa: E402
+from app.services.data_schema import DataValidationError  # noqa: E402
+
+
+def main():
+    try:
+        version = compile_from_sources()
+    except DataValidationError as e:
+        print(f"Data validation failed, {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Wrote {os.path.normpath(COMPILED_PATH)} (data version {version})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,5 @@
-"""Generate vintage data for remaining wine regions and merge with existing data."""
-import json
-import os
-
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-EXISTING_PATH = os.path.join(SCRIPT_DIR, "vintage_data.json")
+"""Regenerate the source files of the remaining wine regions (regions/*.json), then build."""
+from build import main as build, write_region_sources
 
 # Additional regions with curated vintage data
 ADDITIONAL_REGIONS = {
@@ -12,61 +8,62 @@ ADDITIONAL_REGIONS = {
         "country": "France",
         "primary_grapes": ["Chardonnay", "Pinot Noir", "Pinot Meunier"],
         "wine_style": "sparkling",
+        "longevity": "medium",
         "vintages": {
-            "1970": {"score": 65, "quality_tier": "average", "description": "Modest vintage with cool growing season. Most producers relied on non-vintage blends.", "drinking_window": "past_peak", "notable_wines": ["Krug", "Dom Perignon"]},
-            "1971": {"score": 78, "quality_tier": "good", "description": "Warm summer produced ripe fruit with decent acidity. Some vintage declarations.", "drinking_window": "past_peak", "notable_wines": ["Dom Perignon", "Taittinger Comtes"]},
-            "1972": {"score": 50, "quality_tier": "poor", "description": "Cold and wet throughout. No vintage declarations from major houses.", "drinking_window": "past_peak", "notable_wines": []},
-            "1973": {"score": 68, "quality_tier": "average", "description": "Large harvest but dilute. Few vintage wines of note.", "drinking_window": "past_peak", "notable_wines": []},
-            "1974": {"score": 60, "quality_tier": "average", "description": "Cool summer with late ripening. Thin and acidic wines.", "drinking_window": "past_peak", "notable_wines": []},
-            "1975": {"score": 90, "quality_tier": "outstanding", "description": "Exceptional vintage with warm dry summer. Rich powerful wines with great aging potential. Widely declared.", "drinking_window": "past_peak", "notable_wines": ["Dom Perignon", "Krug", "Salon"]},
-            "1976": {"score": 88, "quality_tier": "excellent", "description": "Scorching hot summer produced very ripe grapes. Full-bodied wines, though some lacked the classic Champagne acidity.", "drinking_window": "past_peak", "notable_wines": ["Dom Perignon", "Bollinger RD", "Comtes de Champagne"]},
-            "1977": {"score": 52, "quality_tier": "poor", "description": "Dismal weather throughout. No significant vintage declarations.", "drinking_window": "past_peak", "notable_wines": []},
-            "1978": {"score": 72, "quality_tier": "good", "description": "Late-ripening year saved by warm September. Elegant wines with good acidity.", "drinking_window": "past_peak", "notable_wines": ["Krug"]},
-            "1979": {"score": 86, "quality_tier": "excellent", "description": "Large crop of very good quality. Balanced wines with finesse, widely declared vintage.", "drinking_window": "past_peak", "notable_wines": ["Dom Perignon", "Krug", "Salon"]},
-            "1980": {"score": 58, "quality_tier": "poor", "description": "Cold wet year. Very few vintage declarations.", "drinking_window": "past_peak", "notable_wines": []},
-            "1981": {"score": 75, "quality_tier": "good", "description": "Small crop due to frost but good quality fruit. Concentrated wines from those who harvested well.", "drinking_window": "past_peak", "notable_wines": ["Bollinger", "Krug"]},
-            "1982": {"score": 88, "quality_tier": "excellent", "description": "Hot summer produced very ripe generous wines. Rich and opulent style, widely declared.", "drinking_window": "mature", "notable_wines": ["Dom Perignon", "Krug", "Taittinger Comtes"]},
-            "1983": {"score": 78, "quality_tier": "good", "description": "Warm but uneven summer. Some rot required careful selection. Best wines are surprisingly good.", "drinking_window": "past_peak", "notable_wines": ["Krug", "Bollinger RD"]},
-            "1984": {"score": 55, "quality_tier": "poor", "description": "Cool rainy summer. Very few vintage declarations.", "drinking_window": "past_peak", "notable_wines": []},
-            "1985": {"score": 92, "quality_tier": "outstanding", "description": "Perfect balance of warmth and freshness. Elegant, refined wines with superb aging potential. Classic vintage.", "drinking_window": "mature", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal"]},
-            "1986": {"score": 76, "quality_tier": "good", "description": "Good growing season though not as exceptional as 1985. Firm structured wines.", "drinking_window": "mature", "notable_wines": ["Bollinger", "Pol Roger"]},
-            "1987": {"score": 60, "quality_tier": "average", "description": "Difficult vintage with late season rain. Few declarations.", "drinking_window": "past_peak", "notable_wines": []},
-            "1988": {"score": 90, "quality_tier": "outstanding", "description": "Classic vintage with ideal growing conditions. High acidity balanced by ripe fruit. Superb structure for long aging.", "drinking_window": "mature", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Bollinger Grande Annee"]},
-            "1989": {"score": 88, "quality_tier": "excellent", "description": "Warm ripe vintage producing generous fruit-forward wines. Softer than 1988 but immediately appealing.", "drinking_window": "mature", "notable_wines": ["Dom Perignon", "Krug", "Cristal"]},
-            "1990": {"score": 93, "quality_tier": "outstanding", "description": "Outstanding vintage with warm summer and ideal harvest conditions. Rich powerful wines with complexity and depth.", "drinking_window": "at_peak", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Bollinger Grande Annee"]},
-            "1991": {"score": 58, "quality_tier": "poor", "description": "April frost devastated vineyards. Small difficult crop.", "drinking_window": "past_peak", "notable_wines": []},
-            "1992": {"score": 65, "quality_tier": "average", "description": "Uneven growing season. Some decent wines but generally unremarkable.", "drinking_window": "past_peak", "notable_wines": []},
-            "1993": {"score": 72, "quality_tier": "good", "description": "Surprisingly good after a rainy start. Fresh elegant wines from careful producers.", "drinking_window": "mature", "notable_wines": ["Krug", "Bollinger"]},
-            "1994": {"score": 62, "quality_tier": "average", "description": "Rain at harvest diluted quality. Few vintage declarations.", "drinking_window": "past_peak", "notable_wines": []},
-            "1995": {"score": 90, "quality_tier": "outstanding", "description": "Hot dry summer followed by perfectly timed harvest rains. Powerful concentrated wines with wonderful complexity.", "drinking_window": "at_peak", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal"]},
-            "1996": {"score": 95, "quality_tier": "outstanding", "description": "The benchmark Champagne vintage. Blazing acidity with extraordinary concentration and minerality. Will age for decades.", "drinking_window": "at_peak", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Bollinger Grande Annee", "Cristal"]},
-            "1997": {"score": 72, "quality_tier": "good", "description": "Warm early harvest. Forward drinking wines with ripe fruit but less structure than 1996.", "drinking_window": "mature", "notable_wines": ["Bollinger", "Pol Roger"]},
-            "1998": {"score": 78, "quality_tier": "good", "description": "Uneven season with good Chardonnay. Some strong Blanc de Blancs produced.", "drinking_window": "mature", "notable_wines": ["Salon", "Dom Perignon"]},
-            "1999": {"score": 80, "quality_tier": "excellent", "description": "Very large crop with good quality. Generous fruity wines, less structured than 1996 but very appealing.", "drinking_window": "mature", "notable_wines": ["Krug", "Dom Perignon"]},
-            "2000": {"score": 82, "quality_tier": "excellent", "description": "Mixed season redeemed by warm September. Good quality broadly declared vintage.", "drinking_window": "at_peak", "notable_wines": ["Dom Perignon", "Bollinger", "Cristal"]},
-            "2001": {"score": 70, "quality_tier": "good", "description": "Warm but uneven. Some decent wines but inconsistent quality across the region.", "drinking_window": "mature", "notable_wines": ["Krug"]},
-            "2002": {"score": 93, "quality_tier": "outstanding", "description": "Magnificent vintage. Perfect Indian summer conditions produced wines of extraordinary depth, finesse and minerality.", "drinking_window": "at_peak", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal", "Bollinger Grande Annee"]},
-            "2003": {"score": 72, "quality_tier": "good", "description": "Record-breaking heat wave. Atypical rich wines lacking classic Champagne freshness. Unusual but interesting.", "drinking_window": "mature", "notable_wines": ["Dom Perignon Rose", "Bollinger"]},
-            "2004": {"score": 88, "quality_tier": "excellent", "description": "Large crop of very consistent quality. Classic Champagne profile with bright acidity and elegant fruit.", "drinking_window": "at_peak", "notable_wines": ["Dom Perignon", "Krug", "Comtes de Champagne"]},
-            "2005": {"score": 78, "quality_tier": "good", "description": "Dry warm summer but October rains complicated harvest. Best producers made very good wines.", "drinking_window": "ready", "notable_wines": ["Salon", "Bollinger"]},
-            "2006": {"score": 82, "quality_tier": "excellent", "description": "Uneven season with a warm July/August and cool September. Good Pinot Noir year, widely declared.", "drinking_window": "ready", "notable_wines": ["Dom Perignon", "Krug", "Cristal"]},
-            "2007": {"score": 75, "quality_tier": "good", "description": "Challenging vintage with rain and uneven ripening. Few major declarations.", "drinking_window": "ready", "notable_wines": ["Bollinger"]},
-            "2008": {"score": 93, "quality_tier": "outstanding", "description": "Exceptional vintage. Cool conditions preserved acidity while late sunshine brought beautiful ripeness. Precise mineral wines built for decades.", "drinking_window": "at_peak", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal"]},
-            "2009": {"score": 82, "quality_tier": "excellent", "description": "Warm generous vintage. Fruit-forward accessible wines with good early appeal.", "drinking_window": "ready", "notable_wines": ["Dom Perignon", "Bollinger"]},
-            "2010": {"score": 78, "quality_tier": "good", "description": "Cool vintage with high acidity. Lean structured wines that should develop well.", "drinking_window": "ready", "notable_wines": ["Krug"]},
-            "2011": {"score": 72, "quality_tier": "good", "description": "Early harvest after warm spring. Light but pleasant wines.", "drinking_window": "ready", "notable_wines": []},
-            "2012": {"score": 90, "quality_tier": "outstanding", "description": "Classic vintage with ideal harvest conditions after a challenging growing season. Beautifully balanced wines with precision.", "drinking_window": "ready", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal"]},
-            "2013": {"score": 88, "quality_tier": "excellent", "description": "Late harvest with excellent concentration. Fresh vivid wines with great aging potential.", "drinking_window": "young", "notable_wines": ["Dom Perignon", "Bollinger", "Comtes de Champagne"]},
-            "2014": {"score": 78, "quality_tier": "good", "description": "Good Chardonnay vintage. Blanc de Blancs particularly successful.", "drinking_window": "young", "notable_wines": ["Salon", "Comtes de Champagne"]},
-            "2015": {"score": 90, "quality_tier": "outstanding", "description": "Warm dry summer produced rich concentrated wines. Outstanding Pinot Noir. Power combined with freshness.", "drinking_window": "young", "notable_wines": ["Dom Perignon", "Krug", "Cristal"]},
-            "2016": {"score": 82, "quality_tier": "excellent", "description": "Dramatic spring frost reduced yields significantly. Surviving grapes were concentrated and intense.", "drinking_window": "young", "notable_wines": ["Bollinger", "Pol Roger"]},
-            "2017": {"score": 75, "quality_tier": "good", "description": "April frost severely reduced production. Quality was good where vines survived.", "drinking_window": "young", "notable_wines": []},
-            "2018": {"score": 86, "quality_tier": "excellent", "description": "Warm generous vintage with large crop. Rich opulent wines with ripe fruit character.", "drinking_window": "young", "notable_wines": ["Dom Perignon", "Krug"]},
-            "2019": {"score": 91, "quality_tier": "outstanding", "description": "Hot summer but cool nights preserved acidity. Exceptional balance of power and freshness. Widely declared.", "drinking_window": "young", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal"]},
-            "2020": {"score": 86, "quality_tier": "excellent", "description": "Early warm harvest produced ripe wines. Sunny growing season with good concentration.", "drinking_window": "young", "notable_wines": ["Bollinger", "Pol Roger"]},
-            "2021": {"score": 72, "quality_tier": "good", "description": "Frost and rain made this a challenging year. Small production but decent quality from the best sites.", "drinking_window": "young", "notable_wines": []},
-            "2022": {"score": 88, "quality_tier": "excellent", "description": "Very hot dry summer. Record early harvest produced powerful concentrated wines with surprising freshness.", "drinking_window": "young", "notable_wines": ["Dom Perignon", "Krug"]},
-            "2023": {"score": 82, "quality_tier": "excellent", "description": "Variable conditions with rain and warmth. Good quality overall, particularly for Chardonnay.", "drinking_window": "young", "notable_wines": ["Comtes de Champagne"]},
+            "1970": {"score": 65, "description": "Modest vintage with cool growing season. Most producers relied on non-vintage blends.", "notable_wines": ["Krug", "Dom Perignon"]},
+            "1971": {"score": 78, "description": "Warm summer produced ripe fruit with decent acidity. Some vintage declarations.", "notable_wines": ["Dom Perignon", "Taittinger Comtes"]},
+            "1972": {"score": 50, "description": "Cold and wet throughout. No vintage declarations from major houses.", "notable_wines": []},
+            "1973": {"score": 68, "description": "Large harvest but dilute. Few vintage wines of note.", "notable_wines": []},
+            "1974": {"score": 60, "description": "Cool summer with late ripening. Thin and acidic wines.", "notable_wines": []},
+            "1975": {"score": 90, "description": "Exceptional vintage with warm dry summer. Rich powerful wines with great aging potential. Widely declared.", "notable_wines": ["Dom Perignon", "Krug", "Salon"]},
+            "1976": {"score": 88, "description": "Scorching hot summer produced very ripe grapes. Full-bodied wines, though some lacked the classic Champagne acidity.", "notable_wines": ["Dom Perignon", "Bollinger RD", "Comtes de Champagne"]},
+            "1977": {"score": 52, "description": "Dismal weather throughout. No significant vintage declarations.", "notable_wines": []},
+            "1978": {"score": 72, "description": "Late-ripening year saved by warm September. Elegant wines with good acidity.", "notable_wines": ["Krug"]},
+            "1979": {"score": 86, "description": "Large crop of very good quality. Balanced wines with finesse, widely declared vintage.", "notable_wines": ["Dom Perignon", "Krug", "Salon"]},
+            "1980": {"score": 58, "description": "Cold wet year. Very few vintage declarations.", "notable_wines": []},
+            "1981": {"score": 75, "description": "Small crop due to frost but good quality fruit. Concentrated wines from those who harvested well.", "notable_wines": ["Bollinger", "Krug"]},
+            "1982": {"score": 88, "description": "Hot summer produced very ripe generous wines. Rich and opulent style, widely declared.", "notable_wines": ["Dom Perignon", "Krug", "Taittinger Comtes"]},
+            "1983": {"score": 78, "description": "Warm but uneven summer. Some rot required careful selection. Best wines are surprisingly good.", "notable_wines": ["Krug", "Bollinger RD"]},
+            "1984": {"score": 55, "description": "Cool rainy summer. Very few vintage declarations.", "notable_wines": []},
+            "1985": {"score": 92, "description": "Perfect balance of warmth and freshness. Elegant, refined wines with superb aging potential. Classic vintage.", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal"]},
+            "1986": {"score": 76, "description": "Good growing season though not as exceptional as 1985. Firm structured wines.", "notable_wines": ["Bollinger", "Pol Roger"]},
+            "1987": {"score": 60, "description": "Difficult vintage with late season rain. Few declarations.", "notable_wines": []},
+            "1988": {"score": 90, "description": "Classic vintage with ideal growing conditions. High acidity balanced by ripe fruit. Superb structure for long aging.", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Bollinger Grande Annee"]},
+            "1989": {"score": 88, "description": "Warm ripe vintage producing generous fruit-forward wines. Softer than 1988 but immediately appealing.", "notable_wines": ["Dom Perignon", "Krug", "Cristal"]},
+            "1990": {"score": 93, "description": "Outstanding vintage with warm summer and ideal harvest conditions. Rich powerful wines with complexity and depth.", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Bollinger Grande Annee"]},
+            "1991": {"score": 58, "description": "April frost devastated vineyards. Small difficult crop.", "notable_wines": []},
+            "1992": {"score": 65, "description": "Uneven growing season. Some decent wines but generally unremarkable.", "notable_wines": []},
+            "1993": {"score": 72, "description": "Surprisingly good after a rainy start. Fresh elegant wines from careful producers.", "notable_wines": ["Krug", "Bollinger"]},
+            "1994": {"score": 62, "description": "Rain at harvest diluted quality. Few vintage declarations.", "notable_wines": []},
+            "1995": {"score": 90, "description": "Hot dry summer followed by perfectly timed harvest rains. Powerful concentrated wines with wonderful complexity.", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal"]},
+            "1996": {"score": 95, "description": "The benchmark Champagne vintage. Blazing acidity with extraordinary concentration and minerality. Will age for decades.", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Bollinger Grande Annee", "Cristal"]},
+            "1997": {"score": 72, "description": "Warm early harvest. Forward drinking wines with ripe fruit but less structure than 1996.", "notable_wines": ["Bollinger", "Pol Roger"]},
+            "1998": {"score": 78, "description": "Uneven season with good Chardonnay. Some strong Blanc de Blancs produced.", "notable_wines": ["Salon", "Dom Perignon"]},
+            "1999": {"score": 80, "description": "Very large crop with good quality. Generous fruity wines, less structured than 1996 but very appealing.", "notable_wines": ["Krug", "Dom Perignon"]},
+            "2000": {"score": 82, "description": "Mixed season redeemed by warm September. Good quality broadly declared vintage.", "notable_wines": ["Dom Perignon", "Bollinger", "Cristal"]},
+            "2001": {"score": 70, "description": "Warm but uneven. Some decent wines but inconsistent quality across the region.", "notable_wines": ["Krug"]},
+            "2002": {"score": 93, "description": "Magnificent vintage. Perfect Indian summer conditions produced wines of extraordinary depth, finesse and minerality.", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal", "Bollinger Grande Annee"]},
+            "2003": {"score": 72, "description": "Record-breaking heat wave. Atypical rich wines lacking classic Champagne freshness. Unusual but interesting.", "notable_wines": ["Dom Perignon Rose", "Bollinger"]},
+            "2004": {"score": 88, "description": "Large crop of very consistent quality. Classic Champagne profile with bright acidity and elegant fruit.", "notable_wines": ["Dom Perignon", "Krug", "Comtes de Champagne"]},
+            "2005": {"score": 78, "description": "Dry warm summer but October rains complicated harvest. Best producers made very good wines.", "notable_wines": ["Salon", "Bollinger"]},
+            "2006": {"score": 82, "description": "Uneven season with a warm July/August and cool September. Good Pinot Noir year, widely declared.", "notable_wines": ["Dom Perignon", "Krug", "Cristal"]},
+            "2007": {"score": 75, "description": "Challenging vintage with rain and uneven ripening. Few major declarations.", "notable_wines": ["Bollinger"]},
+            "2008": {"score": 93, "description": "Exceptional vintage. Cool conditions preserved acidity while late sunshine brought beautiful ripeness. Precise mineral wines built for decades.", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal"]},
+            "2009": {"score": 82, "description": "Warm generous vintage. Fruit-forward accessible wines with good early appeal.", "notable_wines": ["Dom Perignon", "Bollinger"]},
+            "2010": {"score": 78, "description": "Cool vintage with high acidity. Lean structured wines that should develop well.", "notable_wines": ["Krug"]},
+            "2011": {"score": 72, "description": "Early harvest after warm spring. Light but pleasant wines.", "notable_wines": []},
+            "2012": {"score": 90, "description": "Classic vintage with ideal harvest conditions after a challenging growing season. Beautifully balanced wines with precision.", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal"]},
+            "2013": {"score": 88, "description": "Late harvest with excellent concentration. Fresh vivid wines with great aging potential.", "notable_wines": ["Dom Perignon", "Bollinger", "Comtes de Champagne"]},
+            "2014": {"score": 78, "description": "Good Chardonnay vintage. Blanc de Blancs particularly successful.", "notable_wines": ["Salon", "Comtes de Champagne"]},
+            "2015": {"score": 90, "description": "Warm dry summer produced rich concentrated wines. Outstanding Pinot Noir. Power combined with freshness.", "notable_wines": ["Dom Perignon", "Krug", "Cristal"]},
+            "2016": {"score": 82, "description": "Dramatic spring frost reduced yields significantly. Surviving grapes were concentrated and intense.", "notable_wines": ["Bollinger", "Pol Roger"]},
+            "2017": {"score": 75, "description": "April frost severely reduced production. Quality was good where vines survived.", "notable_wines": []},
+            "2018": {"score": 86, "description": "Warm generous vintage with large crop. Rich opulent wines with ripe fruit character.", "notable_wines": ["Dom Perignon", "Krug"]},
+            "2019": {"score": 91, "description": "Hot summer but cool nights preserved acidity. Exceptional balance of power and freshness. Widely declared.", "notable_wines": ["Dom Perignon", "Krug", "Salon", "Cristal"]},
+            "2020": {"score": 86, "description": "Early warm harvest produced ripe wines. Sunny growing season with good concentration.", "notable_wines": ["Bollinger", "Pol Roger"]},
+            "2021": {"score": 72, "description": "Frost and rain made this a challenging year. Small production but decent quality from the best sites.", "notable_wines": []},
+            "2022": {"score": 88, "description": "Very hot dry summer. Record early harvest produced powerful concentrated wines with surprising freshness.", "notable_wines": ["Dom Perignon", "Krug"]},
+            "2023": {"score": 82, "description": "Variable conditions with rain and warmth. Good quality overall, particularly for Chardonnay.", "notable_wines": ["Comtes de Champagne"]},
         }
     },
     "rhone_north": {
@@ -74,61 +71,62 @@ ADDITIONAL_REGIONS = {
         "country": "France",
         "primary_grapes": ["Syrah"],
         "wine_style": "red",
+        "longevity": "long",
         "vintages": {y: v for y, v in {
-            "1970": {"score": 78, "quality_tier": "good", "description": "Warm vintage producing structured Syrah with good depth.", "drinking_window": "past_peak", "notable_wines": ["Guigal", "Jaboulet"]},
-            "1971": {"score": 82, "quality_tier": "excellent", "description": "Ripe vintage with concentrated fruit. Hermitage excelled.", "drinking_window": "past_peak", "notable_wines": ["Jaboulet La Chapelle", "Guigal"]},
-            "1972": {"score": 60, "quality_tier": "average", "description": "Cool wet vintage. Dilute wines lacking concentration.", "drinking_window": "past_peak", "notable_wines": []},
-            "1973": {"score": 72, "quality_tier": "good", "description": "Generous vintage with soft approachable wines.", "drinking_window": "past_peak", "notable_wines": ["Guigal"]},
-            "1974": {"score": 65, "quality_tier": "average", "description": "Cool growing season produced lean angular wines.", "drinking_window": "past_peak", "notable_wines": []},
-            "1975": {"score": 68, "quality_tier": "average", "description": "Rainy harvest reduced quality. Some decent Hermitage produced.", "drinking_window": "past_peak", "notable_wines": ["Jaboulet"]},
-            "1976": {"score": 85, "quality_tier": "excellent", "description": "Scorching summer produced big powerful wines. Very ripe tannins.", "drinking_window": "past_peak", "notable_wines": ["Jaboulet La Chapelle", "Guigal"]},
-            "1977": {"score": 58, "quality_tier": "poor", "description": "Difficult vintage with persistent rain. Thin underripe wines.", "drinking_window": "past_peak", "notable_wines": []},
-            "1978": {"score": 95, "quality_tier": "outstanding", "description": "Legendary vintage. Perfect conditions produced monumental Syrah with extraordinary depth, complexity, and longevity.", "drinking_window": "mature", "notable_wines": ["Jaboulet La Chapelle", "Guigal La Mouline", "Chave Hermitage"]},
-            "1979": {"score": 82, "quality_tier": "excellent", "description": "Very good vintage overshadowed by 1978. Balanced elegant wines.", "drinking_window": "past_peak", "notable_wines": ["Guigal", "Chave"]},
-            "1980": {"score": 72, "quality_tier": "good", "description": "Cool vintage with moderate quality. Light but pleasant wines.", "drinking_window": "past_peak", "notable_wines": []},
-            "1981": {"score": 75, "quality_tier": "good", "description": "Warm summer but rain at harvest. Uneven quality.", "drinking_window": "past_peak", "notable_wines": ["Guigal"]},
-            "1982": {"score": 82, "quality_tier": "excellent", "description": "Hot vintage producing rich opulent wines. Forward and generous.", "drinking_window": "mature", "notable_wines": ["Guigal La Mouline", "Jaboulet La Chapelle"]},
-            "1983": {"score": 88, "quality_tier": "excellent", "description": "Outstanding vintage with perfect ripeness and structure. Powerful long-lived wines.", "drinking_window": "mature", "notable_wines": ["Guigal La Landonne", "Chave Hermitage", "Jaboulet La Chapelle"]},
-            "1984": {"score": 60, "quality_tier": "average", "description": "Cold wet vintage. Light wines without much character.", "drinking_window": "past_peak", "notable_wines": []},
-            "1985": {"score": 88, "quality_tier": "excellent", "description": "Superb vintage with warm balanced growing season. Elegant powerful wines.", "drinking_window": "mature", "notable_wines": ["Guigal La Mouline", "Chave Hermitage"]},
-            "1986": {"score": 72, "quality_tier": "good", "description": "Mixed vintage with some rain. Decent wines from best producers.", "drinking_window": "past_peak", "notable_wines": ["Guigal"]},
-            "1987": {"score": 65, "quality_tier": "average", "description": "Difficult vintage. Light and early-drinking wines.", "drinking_window": "past_peak", "notable_wines": []},
-            "1988": {"score": 90, "quality_tier": "outstanding", "description": "Superb conditions produced classic Northern Rhone Syrah. Firm structured wines with pepper and dark fruit.", "drinking_window": "mature", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Clape Cornas"]},
-            "1989": {"score": 88, "quality_tier": "excellent", "description": "Very warm vintage. Rich powerful wines with ripe generous fruit.", "drinking_window": "mature", "notable_wines": ["Guigal La Landonne", "Jaboulet La Chapelle"]},
-            "1990": {"score": 92, "quality_tier": "outstanding", "description": "Magnificent vintage. Intense concentrated wines with layers of complexity. One of the great years.", "drinking_window": "at_peak", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Jaboulet La Chapelle"]},
-            "1991": {"score": 90, "quality_tier": "outstanding", "description": "Exceptional vintage often overshadowed by 1990. Structured precise wines with great purity of fruit.", "drinking_window": "at_peak", "notable_wines": ["Guigal La Turque", "Chave Hermitage"]},
-            "1992": {"score": 68, "quality_tier": "average", "description": "Rainy vintage with dilute wines. Few highlights.", "drinking_window": "past_peak", "notable_wines": []},
-            "1993": {"score": 72, "quality_tier": "good", "description": "Decent vintage with good fruit but some dilution from late rains.", "drinking_window": "mature", "notable_wines": ["Guigal", "Chave"]},
-            "1994": {"score": 75, "quality_tier": "good", "description": "Good vintage with moderate ripeness. Elegant restrained style.", "drinking_window": "mature", "notable_wines": ["Guigal La Mouline"]},
-            "1995": {"score": 85, "quality_tier": "excellent", "description": "Warm generous vintage with very good concentration and structure.", "drinking_window": "at_peak", "notable_wines": ["Guigal La Mouline", "Chave Hermitage"]},
-            "1996": {"score": 78, "quality_tier": "good", "description": "Uneven growing season. Fresh structured wines from best sites.", "drinking_window": "mature", "notable_wines": ["Chave Hermitage"]},
-            "1997": {"score": 82, "quality_tier": "excellent", "description": "Early warm harvest. Forward approachable wines with ripe sweet fruit.", "drinking_window": "mature", "notable_wines": ["Guigal", "Jaboulet"]},
-            "1998": {"score": 86, "quality_tier": "excellent", "description": "Very good vintage with excellent structure and depth. Classic Northern Rhone character.", "drinking_window": "at_peak", "notable_wines": ["Guigal La Mouline", "Chave Hermitage"]},
-            "1999": {"score": 90, "quality_tier": "outstanding", "description": "Outstanding vintage. Rich concentrated wines with exceptional balance and complexity.", "drinking_window": "at_peak", "notable_wines": ["Guigal La Turque", "Chave Hermitage", "Clape Cornas"]},
-            "2000": {"score": 82, "quality_tier": "excellent", "description": "Good vintage overshadowed by 1999. Balanced mid-weight wines.", "drinking_window": "at_peak", "notable_wines": ["Guigal", "Chave"]},
-            "2001": {"score": 85, "quality_tier": "excellent", "description": "Excellent vintage with superb structure. Dark intense wines from Hermitage and Cote-Rotie.", "drinking_window": "at_peak", "notable_wines": ["Chave Hermitage", "Guigal La Landonne"]},
-            "2002": {"score": 68, "quality_tier": "average", "description": "Rain-affected harvest. Light wines without great depth.", "drinking_window": "mature", "notable_wines": []},
-            "2003": {"score": 86, "quality_tier": "excellent", "description": "Extreme heat wave vintage. Powerful concentrated wines, though some lack freshness. Best from north-facing slopes.", "drinking_window": "at_peak", "notable_wines": ["Chave Hermitage", "Guigal La Mouline"]},
-            "2004": {"score": 78, "quality_tier": "good", "description": "Classic cool-climate vintage. Fresh elegant wines with good acidity.", "drinking_window": "mature", "notable_wines": ["Guigal", "Chave"]},
-            "2005": {"score": 90, "quality_tier": "outstanding", "description": "Superb vintage with perfectly ripe Syrah. Dense structured wines with dark fruit and spice complexity.", "drinking_window": "at_peak", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Clape Cornas"]},
-            "2006": {"score": 82, "quality_tier": "excellent", "description": "Very good vintage with warm summer. Generous wines with fine tannins.", "drinking_window": "ready", "notable_wines": ["Chave", "Guigal"]},
-            "2007": {"score": 85, "quality_tier": "excellent", "description": "Fresh vintage with excellent Cote-Rotie. Elegant perfumed wines.", "drinking_window": "ready", "notable_wines": ["Guigal La Turque", "Chave Hermitage"]},
-            "2008": {"score": 75, "quality_tier": "good", "description": "Cool uneven vintage. Some good wines from careful producers.", "drinking_window": "ready", "notable_wines": ["Chave"]},
-            "2009": {"score": 90, "quality_tier": "outstanding", "description": "Warm generous vintage producing rich powerful wines. Deep color, concentrated fruit, silky tannins.", "drinking_window": "at_peak", "notable_wines": ["Guigal La Mouline", "Chave Hermitage"]},
-            "2010": {"score": 93, "quality_tier": "outstanding", "description": "Exceptional vintage. Perfect growing conditions produced intense structured wines of extraordinary complexity. One for the ages.", "drinking_window": "at_peak", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Clape Cornas"]},
-            "2011": {"score": 82, "quality_tier": "excellent", "description": "Early harvest after warm spring. Forward drinking wines with good concentration.", "drinking_window": "ready", "notable_wines": ["Guigal", "Chave"]},
-            "2012": {"score": 85, "quality_tier": "excellent", "description": "Small crop of concentrated wines. Dark intense Syrah with mineral backbone.", "drinking_window": "ready", "notable_wines": ["Guigal La Turque", "Chave Hermitage"]},
-            "2013": {"score": 75, "quality_tier": "good", "description": "Cool late-ripening vintage. Elegant lighter-bodied wines.", "drinking_window": "ready", "notable_wines": ["Chave"]},
-            "2014": {"score": 80, "quality_tier": "excellent", "description": "Warm summer saved by cool finish. Balanced fragrant wines.", "drinking_window": "ready", "notable_wines": ["Guigal", "Chave"]},
-            "2015": {"score": 93, "quality_tier": "outstanding", "description": "Magnificent vintage. Hot dry summer but cool nights preserved freshness. Powerful concentrated wines with extraordinary depth.", "drinking_window": "young", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Clape Cornas"]},
-            "2016": {"score": 88, "quality_tier": "excellent", "description": "Classic vintage after tricky growing season. Precise structured wines with peppery Syrah character.", "drinking_window": "young", "notable_wines": ["Guigal La Turque", "Chave Hermitage"]},
-            "2017": {"score": 90, "quality_tier": "outstanding", "description": "Superb vintage with warm balanced conditions. Generous wines with great purity of fruit and silky tannins.", "drinking_window": "young", "notable_wines": ["Guigal La Mouline", "Chave Hermitage"]},
-            "2018": {"score": 88, "quality_tier": "excellent", "description": "Hot vintage producing rich powerful wines. Deep color with ripe dark fruit character.", "drinking_window": "young", "notable_wines": ["Guigal", "Chave"]},
-            "2019": {"score": 92, "quality_tier": "outstanding", "description": "Outstanding vintage combining power with elegance. Concentrated wines with exceptional freshness and complexity.", "drinking_window": "young", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Clape Cornas"]},
-            "2020": {"score": 90, "quality_tier": "outstanding", "description": "Warm dry vintage producing intense concentrated wines. Great structure and aging potential.", "drinking_window": "young", "notable_wines": ["Guigal La Turque", "Chave Hermitage"]},
-            "2021": {"score": 80, "quality_tier": "excellent", "description": "Cooler vintage with fresher wines. Good acidity and elegance, lighter style.", "drinking_window": "young", "notable_wines": ["Chave", "Guigal"]},
-            "2022": {"score": 86, "quality_tier": "excellent", "description": "Very hot dry summer. Concentrated wines with ripe fruit, some lacking freshness.", "drinking_window": "young", "notable_wines": ["Guigal", "Chave"]},
-            "2023": {"score": 82, "quality_tier": "excellent", "description": "Variable conditions. Good quality from best producers with balanced wines.", "drinking_window": "young", "notable_wines": ["Chave Hermitage"]},
+            "1970": {"score": 78, "description": "Warm vintage producing structured Syrah with good depth.", "notable_wines": ["Guigal", "Jaboulet"]},
+            "1971": {"score": 82, "description": "Ripe vintage with concentrated fruit. Hermitage excelled.", "notable_wines": ["Jaboulet La Chapelle", "Guigal"]},
+            "1972": {"score": 60, "description": "Cool wet vintage. Dilute wines lacking concentration.", "notable_wines": []},
+            "1973": {"score": 72, "description": "Generous vintage with soft approachable wines.", "notable_wines": ["Guigal"]},
+            "1974": {"score": 65, "description": "Cool growing season produced lean angular wines.", "notable_wines": []},
+            "1975": {"score": 68, "description": "Rainy harvest reduced quality. Some decent Hermitage produced.", "notable_wines": ["Jaboulet"]},
+            "1976": {"score": 85, "description": "Scorching summer produced big powerful wines. Very ripe tannins.", "notable_wines": ["Jaboulet La Chapelle", "Guigal"]},
+            "1977": {"score": 58, "description": "Difficult vintage with persistent rain. Thin underripe wines.", "notable_wines": []},
+            "1978": {"score": 95, "description": "Legendary vintage. Perfect conditions produced monumental Syrah with extraordinary depth, complexity, and longevity.", "notable_wines": ["Jaboulet La Chapelle", "Guigal La Mouline", "Chave Hermitage"]},
+            "1979": {"score": 82, "description": "Very good vintage overshadowed by 1978. Balanced elegant wines.", "notable_wines": ["Guigal", "Chave"]},
+            "1980": {"score": 72, "description": "Cool vintage with moderate quality. Light but pleasant wines.", "notable_wines": []},
+            "1981": {"score": 75, "description": "Warm summer but rain at harvest. Uneven quality.", "notable_wines": ["Guigal"]},
+            "1982": {"score": 82, "description": "Hot vintage producing rich opulent wines. Forward and generous.", "notable_wines": ["Guigal La Mouline", "Jaboulet La Chapelle"]},
+            "1983": {"score": 88, "description": "Outstanding vintage with perfect ripeness and structure. Powerful long-lived wines.", "notable_wines": ["Guigal La Landonne", "Chave Hermitage", "Jaboulet La Chapelle"]},
+            "1984": {"score": 60, "description": "Cold wet vintage. Light wines without much character.", "notable_wines": []},
+            "1985": {"score": 88, "description": "Superb vintage with warm balanced growing season. Elegant powerful wines.", "notable_wines": ["Guigal La Mouline", "Chave Hermitage"]},
+            "1986": {"score": 72, "description": "Mixed vintage with some rain. Decent wines from best producers.", "notable_wines": ["Guigal"]},
+            "1987": {"score": 65, "description": "Difficult vintage. Light and early-drinking wines.", "notable_wines": []},
+            "1988": {"score": 90, "description": "Superb conditions produced classic Northern Rhone Syrah. Firm structured wines with pepper and dark fruit.", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Clape Cornas"]},
+            "1989": {"score": 88, "description": "Very warm vintage. Rich powerful wines with ripe generous fruit.", "notable_wines": ["Guigal La Landonne", "Jaboulet La Chapelle"]},
+            "1990": {"score": 92, "description": "Magnificent vintage. Intense concentrated wines with layers of complexity. One of the great years.", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Jaboulet La Chapelle"]},
+            "1991": {"score": 90, "description": "Exceptional vintage often overshadowed by 1990. Structured precise wines with great purity of fruit.", "notable_wines": ["Guigal La Turque", "Chave Hermitage"]},
+            "1992": {"score": 68, "description": "Rainy vintage with dilute wines. Few highlights.", "notable_wines": []},
+            "1993": {"score": 72, "description": "Decent vintage with good fruit but some dilution from late rains.", "notable_wines": ["Guigal", "Chave"]},
+            "1994": {"score": 75, "description": "Good vintage with moderate ripeness. Elegant restrained style.", "notable_wines": ["Guigal La Mouline"]},
+            "1995": {"score": 85, "description": "Warm generous vintage with very good concentration and structure.", "notable_wines": ["Guigal La Mouline", "Chave Hermitage"]},
+            "1996": {"score": 78, "description": "Uneven growing season. Fresh structured wines from best sites.", "notable_wines": ["Chave Hermitage"]},
+            "1997": {"score": 82, "description": "Early warm harvest. Forward approachable wines with ripe sweet fruit.", "notable_wines": ["Guigal", "Jaboulet"]},
+            "1998": {"score": 86, "description": "Very good vintage with excellent structure and depth. Classic Northern Rhone character.", "notable_wines": ["Guigal La Mouline", "Chave Hermitage"]},
+            "1999": {"score": 90, "description": "Outstanding vintage. Rich concentrated wines with exceptional balance and complexity.", "notable_wines": ["Guigal La Turque", "Chave Hermitage", "Clape Cornas"]},
+            "2000": {"score": 82, "description": "Good vintage overshadowed by 1999. Balanced mid-weight wines.", "notable_wines": ["Guigal", "Chave"]},
+            "2001": {"score": 85, "description": "Excellent vintage with superb structure. Dark intense wines from Hermitage and Cote-Rotie.", "notable_wines": ["Chave Hermitage", "Guigal La Landonne"]},
+            "2002": {"score": 68, "description": "Rain-affected harvest. Light wines without great depth.", "notable_wines": []},
+            "2003": {"score": 86, "description": "Extreme heat wave vintage. Powerful concentrated wines, though some lack freshness. Best from north-facing slopes.", "notable_wines": ["Chave Hermitage", "Guigal La Mouline"]},
+            "2004": {"score": 78, "description": "Classic cool-climate vintage. Fresh elegant wines with good acidity.", "notable_wines": ["Guigal", "Chave"]},
+            "2005": {"score": 90, "description": "Superb vintage with perfectly ripe Syrah. Dense structured wines with dark fruit and spice complexity.", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Clape Cornas"]},
+            "2006": {"score": 82, "description": "Very good vintage with warm summer. Generous wines with fine tannins.", "notable_wines": ["Chave", "Guigal"]},
+            "2007": {"score": 85, "description": "Fresh vintage with excellent Cote-Rotie. Elegant perfumed wines.", "notable_wines": ["Guigal La Turque", "Chave Hermitage"]},
+            "2008": {"score": 75, "description": "Cool uneven vintage. Some good wines from careful producers.", "notable_wines": ["Chave"]},
+            "2009": {"score": 90, "description": "Warm generous vintage producing rich powerful wines. Deep color, concentrated fruit, silky tannins.", "notable_wines": ["Guigal La Mouline", "Chave Hermitage"]},
+            "2010": {"score": 93, "description": "Exceptional vintage. Perfect growing conditions produced intense structured wines of extraordinary complexity. One for the ages.", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Clape Cornas"]},
+            "2011": {"score": 82, "description": "Early harvest after warm spring. Forward drinking wines with good concentration.", "notable_wines": ["Guigal", "Chave"]},
+            "2012": {"score": 85, "description": "Small crop of concentrated wines. Dark intense Syrah with mineral backbone.", "notable_wines": ["Guigal La Turque", "Chave Hermitage"]},
+            "2013": {"score": 75, "description": "Cool late-ripening vintage. Elegant lighter-bodied wines.", "notable_wines": ["Chave"]},
+            "2014": {"score": 80, "description": "Warm summer saved by cool finish. Balanced fragrant wines.", "notable_wines": ["Guigal", "Chave"]},
+            "2015": {"score": 93, "description": "Magnificent vintage. Hot dry summer but cool nights preserved freshness. Powerful concentrated wines with extraordinary depth.", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Clape Cornas"]},
+            "2016": {"score": 88, "description": "Classic vintage after tricky growing season. Precise structured wines with peppery Syrah character.", "notable_wines": ["Guigal La Turque", "Chave Hermitage"]},
+            "2017": {"score": 90, "description": "Superb vintage with warm balanced conditions. Generous wines with great purity of fruit and silky tannins.", "notable_wines": ["Guigal La Mouline", "Chave Hermitage"]},
+            "2018": {"score": 88, "description": "Hot vintage producing rich powerful wines. Deep color with ripe dark fruit character.", "notable_wines": ["Guigal", "Chave"]},
+            "2019": {"score": 92, "description": "Outstanding vintage combining power with elegance. Concentrated wines with exceptional freshness and complexity.", "notable_wines": ["Guigal La Mouline", "Chave Hermitage", "Clape Cornas"]},
+            "2020": {"score": 90, "description": "Warm dry vintage producing intense concentrated wines. Great structure and aging potential.", "notable_wines": ["Guigal La Turque", "Chave Hermitage"]},
+            "2021": {"score": 80, "description": "Cooler vintage with fresher wines. Good acidity and elegance, lighter style.", "notable_wines": ["Chave", "Guigal"]},
+            "2022": {"score": 86, "description": "Very hot dry summer. Concentrated wines with ripe fruit, some lacking freshness.", "notable_wines": ["Guigal", "Chave"]},
+            "2023": {"score": 82, "description": "Variable conditions. Good quality from best producers with balanced wines.", "notable_wines": ["Chave Hermitage"]},
         }.items()}
     },
     "rhone_south": {
@@ -136,61 +134,62 @@ ADDITIONAL_REGIONS = {
         "country": "France",
         "primary_grapes": ["Grenache", "Syrah", "Mourvedre"],
         "wine_style": "red",
-        "vintages": {str(y): {"score": s, "quality_tier": t, "description": d, "drinking_window": dw, "notable_wines": nw} for y, s, t, d, dw, nw in [
-            (1970, 72, "good", "Warm year with decent Grenache-based blends.", "past_peak", []),
-            (1971, 75, "good", "Good conditions for GSM blends. Ripe fruit.", "past_peak", ["Beaucastel"]),
-            (1972, 55, "poor", "Wet difficult year. Dilute wines.", "past_peak", []),
-            (1973, 68, "average", "Large crop, modest quality.", "past_peak", []),
-            (1974, 62, "average", "Cool uneven season.", "past_peak", []),
-            (1975, 70, "good", "Decent vintage, warm summer.", "past_peak", []),
-            (1976, 82, "excellent", "Hot dry vintage. Powerful concentrated wines.", "past_peak", ["Beaucastel", "Rayas"]),
-            (1977, 58, "poor", "Cool rainy. Thin wines.", "past_peak", []),
-            (1978, 90, "outstanding", "Great vintage. Warm dry conditions produced profound Chateauneuf-du-Pape.", "past_peak", ["Beaucastel", "Rayas"]),
-            (1979, 78, "good", "Very good generous vintage.", "past_peak", ["Beaucastel"]),
-            (1980, 68, "average", "Cool vintage, light wines.", "past_peak", []),
-            (1981, 80, "excellent", "Good warm year with balanced wines.", "past_peak", ["Beaucastel"]),
-            (1982, 78, "good", "Warm vintage, softer wines.", "past_peak", ["Rayas"]),
-            (1983, 82, "excellent", "Strong vintage with good structure and ripeness.", "past_peak", ["Beaucastel"]),
-            (1984, 60, "average", "Cool difficult year.", "past_peak", []),
-            (1985, 85, "excellent", "Very good vintage. Balanced ripe wines.", "mature", ["Beaucastel", "Rayas"]),
-            (1986, 78, "good", "Good year, overshadowed by neighbors.", "past_peak", ["Beaucastel"]),
-            (1987, 65, "average", "Light vintage, early drinking.", "past_peak", []),
-            (1988, 85, "excellent", "Strong structured vintage. Classic Chateauneuf character.", "mature", ["Beaucastel", "Rayas"]),
-            (1989, 90, "outstanding", "Hot vintage producing powerful concentrated wines. Exceptional ripeness.", "mature", ["Beaucastel", "Rayas", "Pegau"]),
-            (1990, 93, "outstanding", "Magnificent vintage. Rich powerful wines with complexity and depth. One of the greats.", "at_peak", ["Beaucastel", "Rayas", "Pegau"]),
-            (1991, 65, "average", "Frost damage and rain. Modest quality.", "past_peak", []),
-            (1992, 62, "average", "Rain-affected harvest. Light wines.", "past_peak", []),
-            (1993, 72, "good", "Decent vintage, some good Grenache.", "mature", []),
-            (1994, 78, "good", "Good vintage with solid structure.", "mature", ["Beaucastel"]),
-            (1995, 85, "excellent", "Excellent concentrated vintage. Rich powerful wines.", "at_peak", ["Beaucastel", "Rayas"]),
-            (1996, 72, "good", "Cooler year, lighter style wines.", "mature", []),
-            (1997, 75, "good", "Warm early harvest. Forward wines.", "mature", ["Beaucastel"]),
-            (1998, 88, "excellent", "Outstanding vintage. Classic rich wines with great structure.", "at_peak", ["Beaucastel", "Rayas", "Pegau"]),
-            (1999, 85, "excellent", "Very good vintage. Concentrated warm wines.", "at_peak", ["Beaucastel", "Bonneau"]),
-            (2000, 88, "excellent", "Superb vintage with perfect Grenache. Rich complex wines.", "at_peak", ["Beaucastel", "Rayas", "Pegau"]),
-            (2001, 90, "outstanding", "Outstanding vintage. Elegant and powerful with great depth.", "at_peak", ["Beaucastel", "Rayas"]),
-            (2002, 62, "average", "September floods devastated the harvest. Difficult year.", "mature", []),
-            (2003, 82, "excellent", "Heat wave vintage. Very ripe powerful wines, some lacking freshness.", "at_peak", ["Beaucastel"]),
-            (2004, 78, "good", "Good consistent vintage. Fresh balanced wines.", "mature", ["Beaucastel"]),
-            (2005, 90, "outstanding", "Superb vintage. Perfectly ripe Grenache with dark fruit and spice.", "at_peak", ["Beaucastel", "Rayas", "Pegau"]),
-            (2006, 85, "excellent", "Very good warm vintage. Generous wines.", "ready", ["Beaucastel", "Rayas"]),
-            (2007, 92, "outstanding", "Exceptional vintage. Concentrated balanced wines with extraordinary complexity.", "at_peak", ["Beaucastel", "Rayas", "Bonneau"]),
-            (2008, 75, "good", "Cool uneven vintage. Some good wines from top estates.", "ready", []),
-            (2009, 88, "excellent", "Warm generous vintage. Rich full wines.", "at_peak", ["Beaucastel", "Rayas"]),
-            (2010, 95, "outstanding", "Legendary vintage. Perfect conditions produced monumental wines of extraordinary concentration and balance.", "at_peak", ["Beaucastel", "Rayas", "Pegau", "Bonneau"]),
-            (2011, 78, "good", "Warm early vintage. Forward drinking wines.", "ready", []),
-            (2012, 85, "excellent", "Strong vintage with good concentration and structure.", "ready", ["Beaucastel", "Rayas"]),
-            (2013, 72, "good", "Cool vintage. Lighter elegant style.", "ready", []),
-            (2014, 78, "good", "Good balanced vintage with moderate concentration.", "ready", ["Beaucastel"]),
-            (2015, 88, "excellent", "Warm concentrated vintage. Rich powerful wines.", "ready", ["Beaucastel", "Rayas"]),
-            (2016, 92, "outstanding", "Exceptional vintage. Concentrated complex wines with extraordinary balance.", "young", ["Beaucastel", "Rayas", "Pegau"]),
-            (2017, 85, "excellent", "Hot dry vintage. Powerful wines with ripe fruit.", "young", ["Beaucastel"]),
-            (2018, 88, "excellent", "Very warm vintage producing generous rich wines.", "young", ["Beaucastel", "Rayas"]),
-            (2019, 93, "outstanding", "Outstanding vintage. Perfect Grenache with depth, complexity and freshness.", "young", ["Beaucastel", "Rayas", "Pegau"]),
-            (2020, 88, "excellent", "Warm dry vintage. Concentrated intense wines.", "young", ["Beaucastel", "Rayas"]),
-            (2021, 78, "good", "Cooler vintage with lighter fresh wines.", "young", []),
-            (2022, 85, "excellent", "Hot summer but overnight cool preserved acidity. Good concentration.", "young", ["Beaucastel"]),
-            (2023, 80, "excellent", "Variable season. Good quality from best estates.", "young", ["Rayas"]),
+        "longevity": "long",
+        "vintages": {str(y): {"score": s, "description": d, "notable_wines": nw} for y, s, d, nw in [
+            (1970, 72, "Warm year with decent Grenache-based blends.", []),
+            (1971, 75, "Good conditions for GSM blends. Ripe fruit.", ["Beaucastel"]),
+            (1972, 55, "Wet difficult year. Dilute wines.", []),
+            (1973, 68, "Large crop, modest quality.", []),
+            (1974, 62, "Cool uneven season.", []),
+            (1975, 70, "Decent vintage, warm summer.", []),
+            (1976, 82, "Hot dry vintage. Powerful concentrated wines.", ["Beaucastel", "Rayas"]),
+            (1977, 58, "Cool rainy. Thin wines.", []),
+            (1978, 90, "Great vintage. Warm dry conditions produced profound Chateauneuf-du-Pape.", ["Beaucastel", "Rayas"]),
+            (1979, 78, "Very good generous vintage.", ["Beaucastel"]),
+            (1980, 68, "Cool vintage, light wines.", []),
+            (1981, 80, "Good warm year with balanced wines.", ["Beaucastel"]),
+            (1982, 78, "Warm vintage, softer wines.", ["Rayas"]),
+            (1983, 82, "Strong vintage with good structure and ripeness.", ["Beaucastel"]),
+            (1984, 60, "Cool difficult year.", []),
+            (1985, 85, "Very good vintage. Balanced ripe wines.", ["Beaucastel", "Rayas"]),
+            (1986, 78, "Good year, overshadowed by neighbors.", ["Beaucastel"]),
+            (1987, 65, "Light vintage, early drinking.", []),
+            (1988, 85, "Strong structured vintage. Classic Chateauneuf character.", ["Beaucastel", "Rayas"]),
+            (1989, 90, "Hot vintage producing powerful concentrated wines. Exceptional ripeness.", ["Beaucastel", "Rayas", "Pegau"]),
+            (1990, 93, "Magnificent vintage. Rich powerful wines with complexity and depth. One of the greats.", ["Beaucastel", "Rayas", "Pegau"]),
+            (1991, 65, "Frost damage and rain. Modest quality.", []),
+            (1992, 62, "Rain-affected harvest. Light wines.", []),
+            (1993, 72, "Decent vintage, some good Grenache.", []),
+            (1994, 78, "Good vintage with solid structure.", ["Beaucastel"]),
+            (1995, 85, "Excellent concentrated vintage. Rich powerful wines.", ["Beaucastel", "Rayas"]),
+            (1996, 72, "Cooler year, lighter style wines.", []),
+            (1997, 75, "Warm early harvest. Forward wines.", ["Beaucastel"]),
+            (1998, 88, "Outstanding vintage. Classic rich wines with great structure.", ["Beaucastel", "Rayas", "Pegau"]),
+            (1999, 85, "Very good vintage. Concentrated warm wines.", ["Beaucastel", "Bonneau"]),
+            (2000, 88, "Superb vintage with perfect Grenache. Rich complex wines.", ["Beaucastel", "Rayas", "Pegau"]),
+            (2001, 90, "Outstanding vintage. Elegant and powerful with great depth.", ["Beaucastel", "Rayas"]),
+            (2002, 62, "September floods devastated the harvest. Difficult year.", []),
+            (2003, 82, "Heat wave vintage. Very ripe powerful wines, some lacking freshness.", ["Beaucastel"]),
+            (2004, 78, "Good consistent vintage. Fresh balanced wines.", ["Beaucastel"]),
+            (2005, 90, "Superb vintage. Perfectly ripe Grenache with dark fruit and spice.", ["Beaucastel", "Rayas", "Pegau"]),
+            (2006, 85, "Very good warm vintage. Generous wines.", ["Beaucastel", "Rayas"]),
+            (2007, 92, "Exceptional vintage. Concentrated balanced wines with extraordinary complexity.", ["Beaucastel", "Rayas", "Bonneau"]),
+            (2008, 75, "Cool uneven vintage. Some good wines from top estates.", []),
+            (2009, 88, "Warm generous vintage. Rich full wines.", ["Beaucastel", "Rayas"]),
+            (2010, 95, "Legendary vintage. Perfect conditions produced monumental wines of extraordinary concentration and balance.", ["Beaucastel", "Rayas", "Pegau", "Bonneau"]),
+            (2011, 78, "Warm early vintage. Forward drinking wines.", []),
+            (2012, 85, "Strong vintage with good concentration and structure.", ["Beaucastel", "Rayas"]),
+            (2013, 72, "Cool vintage. Lighter elegant style.", []),
+            (2014, 78, "Good balanced vintage with moderate concentration.", ["Beaucastel"]),
+            (2015, 88, "Warm concentrated vintage. Rich powerful wines.", ["Beaucastel", "Rayas"]),
+            (2016, 92, "Exceptional vintage. Concentrated complex wines with extraordinary balance.", ["Beaucastel", "Rayas", "Pegau"]),
+            (2017, 85, "Hot dry vintage. Powerful wines with ripe fruit.", ["Beaucastel"]),
+            (2018, 88, "Very warm vintage producing generous rich wines.", ["Beaucastel", "Rayas"]),
+            (2019, 93, "Outstanding vintage. Perfect Grenache with depth, complexity and freshness.", ["Beaucastel", "Rayas", "Pegau"]),
+            (2020, 88, "Warm dry vintage. Concentrated intense wines.", ["Beaucastel", "Rayas"]),
+            (2021, 78, "Cooler vintage with lighter fresh wines.", []),
+            (2022, 85, "Hot summer but overnight cool preserved acidity. Good concentration.", ["Beaucastel"]),
+            (2023, 80, "Variable season. Good quality from best estates.", ["Rayas"]),
         ]}
     },
     "piedmont": {
@@ -198,61 +197,62 @@ ADDITIONAL_REGIONS = {
         "country": "Italy",
         "primary_grapes": ["Nebbiolo"],
         "wine_style": "red",
-        "vintages": {str(y): {"score": s, "quality_tier": t, "description": d, "drinking_window": dw, "notable_wines": nw} for y, s, t, d, dw, nw in [
-            (1970, 75, "good", "Good vintage with solid Barolo. Well-structured wines.", "past_peak", ["Giacomo Conterno"]),
-            (1971, 88, "excellent", "Outstanding vintage for Barolo. Powerful concentrated wines built for decades.", "past_peak", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
-            (1972, 55, "poor", "Cold wet year. Very poor Nebbiolo.", "past_peak", []),
-            (1973, 72, "good", "Decent year with lighter-bodied Barolo.", "past_peak", []),
-            (1974, 68, "average", "Uneven vintage. Some decent wines.", "past_peak", []),
-            (1975, 60, "average", "Difficult year with rain and hail.", "past_peak", []),
-            (1976, 65, "average", "Cool vintage. Light underripe wines.", "past_peak", []),
-            (1977, 58, "poor", "Wet vintage. Poor quality overall.", "past_peak", []),
-            (1978, 90, "outstanding", "Exceptional vintage. Warm dry conditions produced powerful long-lived Barolo.", "mature", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
-            (1979, 78, "good", "Good vintage with balanced wines.", "past_peak", ["Giacomo Conterno"]),
-            (1980, 68, "average", "Cool vintage with light wines.", "past_peak", []),
-            (1981, 72, "good", "Decent vintage, not remarkable.", "past_peak", []),
-            (1982, 85, "excellent", "Very warm vintage producing rich powerful Barolo.", "mature", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
-            (1983, 72, "good", "Mixed vintage with some good wines.", "past_peak", []),
-            (1984, 55, "poor", "Cold and wet. Very difficult for Nebbiolo.", "past_peak", []),
-            (1985, 88, "excellent", "Superb vintage. Warm conditions produced structured elegant wines.", "mature", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
-            (1986, 78, "good", "Good vintage overshadowed by 1985.", "mature", ["Giacomo Conterno"]),
-            (1987, 65, "average", "Cool late vintage. Light wines.", "past_peak", []),
-            (1988, 85, "excellent", "Very good vintage with excellent structure and depth.", "mature", ["Bruno Giacosa", "Giacomo Conterno"]),
-            (1989, 90, "outstanding", "Exceptional vintage. Warm balanced conditions produced magnificent Barolo.", "at_peak", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
-            (1990, 88, "excellent", "Hot vintage. Rich powerful wines, though some lack the finesse of 1989.", "at_peak", ["Giacomo Conterno", "Bruno Giacosa"]),
-            (1991, 72, "good", "Hailstorms reduced quality in some areas. Uneven.", "mature", []),
-            (1992, 60, "average", "Rainy vintage. Weak dilute wines.", "past_peak", []),
-            (1993, 75, "good", "Decent vintage after two difficult years.", "mature", ["Giacomo Conterno"]),
-            (1994, 68, "average", "September rains hurt quality. Some decent wines.", "mature", []),
-            (1995, 82, "excellent", "Strong vintage with good concentration and structure.", "at_peak", ["Bruno Giacosa", "Giacomo Conterno"]),
-            (1996, 90, "outstanding", "Classic vintage. Ideal growing conditions produced structured complex Barolo.", "at_peak", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
-            (1997, 85, "excellent", "Warm early vintage. Rich opulent wines with sweet fruit.", "at_peak", ["Giacomo Conterno", "Bruno Giacosa"]),
-            (1998, 82, "excellent", "Good vintage with firm structure. Classic Barolo.", "at_peak", ["Giacomo Conterno"]),
-            (1999, 88, "excellent", "Excellent vintage. Powerful concentrated wines.", "at_peak", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
-            (2000, 85, "excellent", "Very good vintage. Balanced ripe wines.", "at_peak", ["Giacomo Conterno", "Gaja"]),
-            (2001, 90, "outstanding", "Outstanding vintage. Perfect balance of power and elegance.", "at_peak", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
-            (2002, 60, "average", "Hail and rain devastated many vineyards. Weak vintage.", "mature", []),
-            (2003, 75, "good", "Extreme heat. Atypical wines, some good from high altitude.", "mature", []),
-            (2004, 85, "excellent", "Classic vintage with excellent structure and finesse.", "at_peak", ["Bruno Giacosa", "Giacomo Conterno"]),
-            (2005, 82, "excellent", "Good vintage with balanced wines. Not as exciting as 2004.", "ready", ["Giacomo Conterno"]),
-            (2006, 88, "excellent", "Excellent vintage. Powerful structured wines with great aging potential.", "at_peak", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
-            (2007, 82, "excellent", "Good warm vintage. Forward drinking style.", "ready", ["Gaja"]),
-            (2008, 85, "excellent", "Classic cool-climate vintage. Elegant structured wines.", "ready", ["Giacomo Conterno", "Bruno Giacosa"]),
-            (2009, 78, "good", "Warm vintage with some hail damage. Uneven.", "ready", ["Giacomo Conterno"]),
-            (2010, 93, "outstanding", "Exceptional vintage. Cool conditions produced Barolo of extraordinary elegance and complexity.", "at_peak", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
-            (2011, 82, "excellent", "Warm vintage with good fruit. Medium-term wines.", "ready", ["Giacomo Conterno"]),
-            (2012, 85, "excellent", "Dry growing season. Concentrated firm wines.", "ready", ["Giacomo Conterno", "Bruno Giacosa"]),
-            (2013, 90, "outstanding", "Outstanding vintage. Classic Nebbiolo with perfect balance and structure.", "young", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
-            (2014, 78, "good", "Wet year. Some good wines from careful selection.", "ready", []),
-            (2015, 85, "excellent", "Warm vintage with rich concentrated wines.", "young", ["Giacomo Conterno", "Bruno Giacosa"]),
-            (2016, 93, "outstanding", "Magnificent vintage. Perfect conditions produced Barolo of exceptional depth and finesse.", "young", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
-            (2017, 82, "excellent", "Hot dry vintage. Powerful wines, some lacking freshness.", "young", ["Giacomo Conterno"]),
-            (2018, 85, "excellent", "Good balanced vintage after some September rain.", "young", ["Bruno Giacosa"]),
-            (2019, 90, "outstanding", "Excellent vintage with warm balanced growing season. Complex wines.", "young", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
-            (2020, 88, "excellent", "Warm vintage with good concentration. Solid quality across the board.", "young", ["Giacomo Conterno", "Gaja"]),
-            (2021, 78, "good", "Cooler vintage producing elegant lighter wines.", "young", []),
-            (2022, 82, "excellent", "Hot dry summer but good quality from best producers.", "young", ["Giacomo Conterno"]),
-            (2023, 80, "excellent", "Variable conditions. Decent quality overall.", "young", []),
+        "longevity": "long",
+        "vintages": {str(y): {"score": s, "description": d, "notable_wines": nw} for y, s, d, nw in [
+            (1970, 75, "Good vintage with solid Barolo. Well-structured wines.", ["Giacomo Conterno"]),
+            (1971, 88, "Outstanding vintage for Barolo. Powerful concentrated wines built for decades.", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
+            (1972, 55, "Cold wet year. Very poor Nebbiolo.", []),
+            (1973, 72, "Decent year with lighter-bodied Barolo.", []),
+            (1974, 68, "Uneven vintage. Some decent wines.", []),
+            (1975, 60, "Difficult year with rain and hail.", []),
+            (1976, 65, "Cool vintage. Light underripe wines.", []),
+            (1977, 58, "Wet vintage. Poor quality overall.", []),
+            (1978, 90, "Exceptional vintage. Warm dry conditions produced powerful long-lived Barolo.", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
+            (1979, 78, "Good vintage with balanced wines.", ["Giacomo Conterno"]),
+            (1980, 68, "Cool vintage with light wines.", []),
+            (1981, 72, "Decent vintage, not remarkable.", []),
+            (1982, 85, "Very warm vintage producing rich powerful Barolo.", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
+            (1983, 72, "Mixed vintage with some good wines.", []),
+            (1984, 55, "Cold and wet. Very difficult for Nebbiolo.", []),
+            (1985, 88, "Superb vintage. Warm conditions produced structured elegant wines.", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
+            (1986, 78, "Good vintage overshadowed by 1985.", ["Giacomo Conterno"]),
+            (1987, 65, "Cool late vintage. Light wines.", []),
+            (1988, 85, "Very good vintage with excellent structure and depth.", ["Bruno Giacosa", "Giacomo Conterno"]),
+            (1989, 90, "Exceptional vintage. Warm balanced conditions produced magnificent Barolo.", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
+            (1990, 88, "Hot vintage. Rich powerful wines, though some lack the finesse of 1989.", ["Giacomo Conterno", "Bruno Giacosa"]),
+            (1991, 72, "Hailstorms reduced quality in some areas. Uneven.", []),
+            (1992, 60, "Rainy vintage. Weak dilute wines.", []),
+            (1993, 75, "Decent vintage after two difficult years.", ["Giacomo Conterno"]),
+            (1994, 68, "September rains hurt quality. Some decent wines.", []),
+            (1995, 82, "Strong vintage with good concentration and structure.", ["Bruno Giacosa", "Giacomo Conterno"]),
+            (1996, 90, "Classic vintage. Ideal growing conditions produced structured complex Barolo.", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
+            (1997, 85, "Warm early vintage. Rich opulent wines with sweet fruit.", ["Giacomo Conterno", "Bruno Giacosa"]),
+            (1998, 82, "Good vintage with firm structure. Classic Barolo.", ["Giacomo Conterno"]),
+            (1999, 88, "Excellent vintage. Powerful concentrated wines.", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
+            (2000, 85, "Very good vintage. Balanced ripe wines.", ["Giacomo Conterno", "Gaja"]),
+            (2001, 90, "Outstanding vintage. Perfect balance of power and elegance.", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
+            (2002, 60, "Hail and rain devastated many vineyards. Weak vintage.", []),
+            (2003, 75, "Extreme heat. Atypical wines, some good from high altitude.", []),
+            (2004, 85, "Classic vintage with excellent structure and finesse.", ["Bruno Giacosa", "Giacomo Conterno"]),
+            (2005, 82, "Good vintage with balanced wines. Not as exciting as 2004.", ["Giacomo Conterno"]),
+            (2006, 88, "Excellent vintage. Powerful structured wines with great aging potential.", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
+            (2007, 82, "Good warm vintage. Forward drinking style.", ["Gaja"]),
+            (2008, 85, "Classic cool-climate vintage. Elegant structured wines.", ["Giacomo Conterno", "Bruno Giacosa"]),
+            (2009, 78, "Warm vintage with some hail damage. Uneven.", ["Giacomo Conterno"]),
+            (2010, 93, "Exceptional vintage. Cool conditions produced Barolo of extraordinary elegance and complexity.", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
+            (2011, 82, "Warm vintage with good fruit. Medium-term wines.", ["Giacomo Conterno"]),
+            (2012, 85, "Dry growing season. Concentrated firm wines.", ["Giacomo Conterno", "Bruno Giacosa"]),
+            (2013, 90, "Outstanding vintage. Classic Nebbiolo with perfect balance and structure.", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
+            (2014, 78, "Wet year. Some good wines from careful selection.", []),
+            (2015, 85, "Warm vintage with rich concentrated wines.", ["Giacomo Conterno", "Bruno Giacosa"]),
+            (2016, 93, "Magnificent vintage. Perfect conditions produced Barolo of exceptional depth and finesse.", ["Giacomo Conterno Monfortino", "Bruno Giacosa", "Gaja"]),
+            (2017, 82, "Hot dry vintage. Powerful wines, some lacking freshness.", ["Giacomo Conterno"]),
+            (2018, 85, "Good balanced vintage after some September rain.", ["Bruno Giacosa"]),
+            (2019, 90, "Excellent vintage with warm balanced growing season. Complex wines.", ["Giacomo Conterno Monfortino", "Bruno Giacosa"]),
+            (2020, 88, "Warm vintage with good concentration. Solid quality across the board.", ["Giacomo Conterno", "Gaja"]),
+            (2021, 78, "Cooler vintage producing elegant lighter wines.", []),
+            (2022, 82, "Hot dry summer but good quality from best producers.", ["Giacomo Conterno"]),
+            (2023, 80, "Variable conditions. Decent quality overall.", []),
         ]}
     },
     "tuscany": {
@@ -260,61 +260,62 @@ ADDITIONAL_REGIONS = {
         "country": "Italy",
         "primary_grapes": ["Sangiovese"],
         "wine_style": "red",
-        "vintages": {str(y): {"score": s, "quality_tier": t, "description": d, "drinking_window": dw, "notable_wines": nw} for y, s, t, d, dw, nw in [
-            (1970, 78, "good", "Good vintage for Brunello with structured tannic wines.", "past_peak", ["Biondi-Santi"]),
-            (1971, 82, "excellent", "Very good vintage. Classic Brunello with good aging potential.", "past_peak", ["Biondi-Santi"]),
-            (1972, 55, "poor", "Wet cold vintage. Poor quality Sangiovese.", "past_peak", []),
-            (1973, 68, "average", "Modest quality. Light early-drinking wines.", "past_peak", []),
-            (1974, 65, "average", "Uneven conditions. Mediocre wines.", "past_peak", []),
-            (1975, 78, "good", "Good vintage with balanced Brunello.", "past_peak", ["Biondi-Santi"]),
-            (1976, 62, "average", "Rain and rot. Difficult vintage.", "past_peak", []),
-            (1977, 72, "good", "Decent year with some good Chianti Classico.", "past_peak", []),
-            (1978, 75, "good", "Good conditions produced solid wines.", "past_peak", ["Biondi-Santi"]),
-            (1979, 78, "good", "Very good vintage for Brunello.", "past_peak", ["Biondi-Santi"]),
-            (1980, 68, "average", "Cool vintage with modest wines.", "past_peak", []),
-            (1981, 72, "good", "Decent vintage.", "past_peak", []),
-            (1982, 82, "excellent", "Very warm vintage. Rich concentrated Sangiovese.", "past_peak", ["Biondi-Santi"]),
-            (1983, 78, "good", "Good balanced vintage.", "past_peak", ["Biondi-Santi"]),
-            (1984, 55, "poor", "Cold wet year. No Brunello Riserva declared.", "past_peak", []),
-            (1985, 90, "outstanding", "Exceptional vintage. Warm conditions produced magnificent Brunello.", "mature", ["Biondi-Santi", "Soldera", "Sassicaia"]),
-            (1986, 72, "good", "Decent but overshadowed by 1985.", "past_peak", []),
-            (1987, 65, "average", "Cool difficult year.", "past_peak", []),
-            (1988, 88, "excellent", "Excellent vintage with structured classic wines.", "mature", ["Biondi-Santi", "Sassicaia", "Soldera"]),
-            (1989, 72, "good", "Mixed vintage. Some good wines from top estates.", "past_peak", []),
-            (1990, 92, "outstanding", "Outstanding vintage. Perfect Sangiovese with concentration and elegance.", "at_peak", ["Biondi-Santi", "Sassicaia", "Soldera", "Ornellaia"]),
-            (1991, 72, "good", "Good vintage overshadowed by 1990.", "mature", []),
-            (1992, 60, "average", "Rainy harvest. Weak dilute wines.", "past_peak", []),
-            (1993, 78, "good", "Good recovery year with solid wines.", "mature", ["Biondi-Santi"]),
-            (1994, 68, "average", "September rains reduced quality.", "mature", []),
-            (1995, 85, "excellent", "Very good vintage with concentrated structured wines.", "at_peak", ["Sassicaia", "Soldera"]),
-            (1996, 78, "good", "Classic vintage with good acidity and structure.", "at_peak", ["Biondi-Santi"]),
-            (1997, 90, "outstanding", "Warm excellent vintage. Rich complex Brunello and outstanding Super Tuscans.", "at_peak", ["Sassicaia", "Ornellaia", "Biondi-Santi", "Soldera"]),
-            (1998, 78, "good", "Decent vintage with balanced wines.", "at_peak", []),
-            (1999, 85, "excellent", "Very good vintage with excellent Brunello.", "at_peak", ["Biondi-Santi", "Soldera"]),
-            (2000, 82, "excellent", "Warm vintage with rich forward wines.", "at_peak", ["Sassicaia", "Ornellaia"]),
-            (2001, 85, "excellent", "Excellent balanced vintage. Classic Tuscan elegance.", "at_peak", ["Biondi-Santi", "Sassicaia"]),
-            (2002, 55, "poor", "Terrible weather with devastating September rains.", "mature", []),
-            (2003, 72, "good", "Extreme heat. Atypical heavy wines lacking freshness.", "mature", []),
-            (2004, 88, "excellent", "Superb vintage. Classic Sangiovese with perfect balance.", "at_peak", ["Biondi-Santi", "Sassicaia", "Soldera"]),
-            (2005, 78, "good", "Decent vintage but inconsistent.", "ready", []),
-            (2006, 90, "outstanding", "Outstanding vintage. Perfect ripeness with fresh acidity. Exceptional Brunello.", "at_peak", ["Biondi-Santi", "Sassicaia", "Ornellaia", "Soldera"]),
-            (2007, 88, "excellent", "Very warm vintage producing powerful rich wines.", "ready", ["Sassicaia", "Ornellaia"]),
-            (2008, 82, "excellent", "Good classic vintage with balanced wines.", "ready", ["Biondi-Santi"]),
-            (2009, 78, "good", "Good vintage, some heat stress.", "ready", []),
-            (2010, 92, "outstanding", "Exceptional vintage. Cool conditions produced Brunello of extraordinary elegance and structure.", "at_peak", ["Biondi-Santi", "Sassicaia", "Soldera"]),
-            (2011, 78, "good", "Warm vintage. Some good wines from higher elevations.", "ready", []),
-            (2012, 85, "excellent", "Warm dry vintage. Concentrated balanced wines.", "ready", ["Sassicaia", "Ornellaia"]),
-            (2013, 82, "excellent", "Classic vintage with fresh elegant Sangiovese.", "ready", ["Biondi-Santi"]),
-            (2014, 68, "average", "Wet cool year. Challenging for Sangiovese.", "ready", []),
-            (2015, 90, "outstanding", "Superb vintage. Warm dry conditions produced magnificent Brunello.", "young", ["Biondi-Santi", "Sassicaia", "Ornellaia"]),
-            (2016, 92, "outstanding", "Exceptional vintage with perfect growing conditions. Elegant complex wines.", "young", ["Biondi-Santi", "Sassicaia", "Soldera"]),
-            (2017, 72, "good", "Very hot dry vintage. Some wines lack freshness.", "young", []),
-            (2018, 82, "excellent", "Good vintage with balanced wines.", "young", ["Sassicaia"]),
-            (2019, 90, "outstanding", "Excellent vintage. Beautiful Sangiovese with depth and freshness.", "young", ["Biondi-Santi", "Sassicaia", "Ornellaia"]),
-            (2020, 85, "excellent", "Warm vintage with good quality across Tuscany.", "young", ["Sassicaia"]),
-            (2021, 78, "good", "Cooler vintage. Elegant lighter-bodied wines.", "young", []),
-            (2022, 82, "excellent", "Hot dry summer but good quality from careful producers.", "young", ["Biondi-Santi"]),
-            (2023, 78, "good", "Variable season. Decent Sangiovese quality.", "young", []),
+        "longevity": "long",
+        "vintages": {str(y): {"score": s, "description": d, "notable_wines": nw} for y, s, d, nw in [
+            (1970, 78, "Good vintage for Brunello with structured tannic wines.", ["Biondi-Santi"]),
+            (1971, 82, "Very good vintage. Classic Brunello with good aging potential.", ["Biondi-Santi"]),
+            (1972, 55, "Wet cold vintage. Poor quality Sangiovese.", []),
+            (1973, 68, "Modest quality. Light early-drinking wines.", []),
+            (1974, 65, "Uneven conditions. Mediocre wines.", []),
+            (1975, 78, "Good vintage with balanced Brunello.", ["Biondi-Santi"]),
+            (1976, 62, "Rain and rot. Difficult vintage.", []),
+            (1977, 72, "Decent year with some good Chianti Classico.", []),
+            (1978, 75, "Good conditions produced solid wines.", ["Biondi-Santi"]),
+            (1979, 78, "Very good vintage for Brunello.", ["Biondi-Santi"]),
+            (1980, 68, "Cool vintage with modest wines.", []),
+            (1981, 72, "Decent vintage.", []),
+            (1982, 82, "Very warm vintage. Rich concentrated Sangiovese.", ["Biondi-Santi"]),
+            (1983, 78, "Good balanced vintage.", ["Biondi-Santi"]),
+            (1984, 55, "Cold wet year. No Brunello Riserva declared.", []),
+            (1985, 90, "Exceptional vintage. Warm conditions produced magnificent Brunello.", ["Biondi-Santi", "Soldera", "Sassicaia"]),
+            (1986, 72, "Decent but overshadowed by 1985.", []),
+            (1987, 65, "Cool difficult year.", []),
+            (1988, 88, "Excellent vintage with structured classic wines.", ["Biondi-Santi", "Sassicaia", "Soldera"]),
+            (1989, 72, "Mixed vintage. Some good wines from top estates.", []),
+            (1990, 92, "Outstanding vintage. Perfect Sangiovese with concentration and elegance.", ["Biondi-Santi", "Sassicaia", "Soldera", "Ornellaia"]),
+            (1991, 72, "Good vintage overshadowed by 1990.", []),
+            (1992, 60, "Rainy harvest. Weak dilute wines.", []),
+            (1993, 78, "Good recovery year with solid wines.", ["Biondi-Santi"]),
+            (1994, 68, "September rains reduced quality.", []),
+            (1995, 85, "Very good vintage with concentrated structured wines.", ["Sassicaia", "Soldera"]),
+            (1996, 78, "Classic vintage with good acidity and structure.", ["Biondi-Santi"]),
+            (1997, 90, "Warm excellent vintage. Rich complex Brunello and outstanding Super Tuscans.", ["Sassicaia", "Ornellaia", "Biondi-Santi", "Soldera"]),
+            (1998, 78, "Decent vintage with balanced wines.", []),
+            (1999, 85, "Very good vintage with excellent Brunello.", ["Biondi-Santi", "Soldera"]),
+            (2000, 82, "Warm vintage with rich forward wines.", ["Sassicaia", "Ornellaia"]),
+            (2001, 85, "Excellent balanced vintage. Classic Tuscan elegance.", ["Biondi-Santi", "Sassicaia"]),
+            (2002, 55, "Terrible weather with devastating September rains.", []),
+            (2003, 72, "Extreme heat. Atypical heavy wines lacking freshness.", []),
+            (2004, 88, "Superb vintage. Classic Sangiovese with perfect balance.", ["Biondi-Santi", "Sassicaia", "Soldera"]),
+            (2005, 78, "Decent vintage but inconsistent.", []),
+            (2006, 90, "Outstanding vintage. Perfect ripeness with fresh acidity. Exceptional Brunello.", ["Biondi-Santi", "Sassicaia", "Ornellaia", "Soldera"]),
+            (2007, 88, "Very warm vintage producing powerful rich wines.", ["Sassicaia", "Ornellaia"]),
+            (2008, 82, "Good classic vintage with balanced wines.", ["Biondi-Santi"]),
+            (2009, 78, "Good vintage, some heat stress.", []),
+            (2010, 92, "Exceptional vintage. Cool conditions produced Brunello of extraordinary elegance and structure.", ["Biondi-Santi", "Sassicaia", "Soldera"]),
+            (2011, 78, "Warm vintage. Some good wines from higher elevations.", []),
+            (2012, 85, "Warm dry vintage. Concentrated balanced wines.", ["Sassicaia", "Ornellaia"]),
+            (2013, 82, "Classic vintage with fresh elegant Sangiovese.", ["Biondi-Santi"]),
+            (2014, 68, "Wet cool year. Challenging for Sangiovese.", []),
+            (2015, 90, "Superb vintage. Warm dry conditions produced magnificent Brunello.", ["Biondi-Santi", "Sassicaia", "Ornellaia"]),
+            (2016, 92, "Exceptional vintage with perfect growing conditions. Elegant complex wines.", ["Biondi-Santi", "Sassicaia", "Soldera"]),
+            (2017, 72, "Very hot dry vintage. Some wines lack freshness.", []),
+            (2018, 82, "Good vintage with balanced wines.", ["Sassicaia"]),
+            (2019, 90, "Excellent vintage. Beautiful Sangiovese with depth and freshness.", ["Biondi-Santi", "Sassicaia", "Ornellaia"]),
+            (2020, 85, "Warm vintage with good quality across Tuscany.", ["Sassicaia"]),
+            (2021, 78, "Cooler vintage. Elegant lighter-bodied wines.", []),
+            (2022, 82, "Hot dry summer but good quality from careful producers.", ["Biondi-Santi"]),
+            (2023, 78, "Variable season. Decent Sangiovese quality.", []),
         ]}
     },
 }
@@ -327,27 +328,22 @@ def _gen_vintages(great_years, good_years, avg_years, poor_years, start=1985, en
     vintages = {}
     for y in range(start, end + 1):
         ys = str(y)
+        # Score bands only; quality_tier and drinking_window are derived by build.py.
         if y in great_years:
             s = random.randint(90, 96)
-            tier = "outstanding"
         elif y in good_years:
             s = random.randint(82, 89)
-            tier = "excellent"
         elif y in avg_years:
             s = random.randint(62, 69)
-            tier = "average"
         elif y in poor_years:
             s = random.randint(48, 58)
-            tier = "poor"
         else:
             s = random.randint(72, 80)
-            tier = "good"
 
         desc = descriptions.get(y, f"Typical vintage for the region with {'warm' if s > 78 else 'moderate'} growing conditions.") if descriptions else f"Typical vintage for the region with {'warm' if s > 78 else 'moderate'} growing conditions."
         nw = notable.get(y, []) if notable else []
-        dw = "past_peak" if y < 1990 else ("mature" if y < 2005 else ("at_peak" if y < 2015 else "young"))
 
-        vintages[ys] = {"score": s, "quality_tier": tier, "description": desc, "drinking_window": dw, "notable_wines": nw}
+        vintages[ys] = {"score": s, "description": desc, "notable_wines": nw}
     return vintages
 
 
@@ -357,6 +353,7 @@ MORE_REGIONS = {
         "country": "Italy",
         "primary_grapes": ["Corvina", "Rondinella"],
         "wine_style": "red",
+        "longevity": "medium",
         "vintages": _gen_vintages(
             great_years={1988, 1990, 1995, 1997, 2001, 2004, 2006, 2010, 2015, 2016},
             good_years={1985, 1986, 1993, 1996, 1998, 2000, 2003, 2007, 2008, 2011, 2012, 2013, 2017, 2019, 2020, 2022},
@@ -390,6 +387,7 @@ MORE_REGIONS = {
         "country": "Spain",
         "primary_grapes": ["Tempranillo", "Garnacha"],
         "wine_style": "red",
+        "longevity": "medium",
         "vintages": _gen_vintages(
             great_years={1982, 1994, 1995, 2001, 2004, 2005, 2010, 2011, 2016, 2019},
             good_years={1985, 1986, 1987, 1989, 1996, 1998, 2002, 2006, 2007, 2008, 2009, 2014, 2017, 2018, 2020},
@@ -423,6 +421,7 @@ MORE_REGIONS = {
         "country": "Spain",
         "primary_grapes": ["Tempranillo"],
         "wine_style": "red",
+        "longevity": "medium",
         "vintages": _gen_vintages(
             great_years={1986, 1995, 1996, 1999, 2001, 2004, 2009, 2010, 2014, 2015, 2016, 2019},
             good_years={1985, 1989, 1994, 1998, 2000, 2003, 2005, 2006, 2011, 2012, 2017, 2018, 2020},
@@ -460,6 +459,7 @@ MORE_REGIONS = {
         "country": "USA",
         "primary_grapes": ["Cabernet Sauvignon"],
         "wine_style": "red",
+        "longevity": "long",
         "vintages": _gen_vintages(
             great_years={1985, 1986, 1991, 1994, 1997, 2001, 2002, 2007, 2012, 2013, 2014, 2015, 2016, 2018, 2019},
             good_years={1987, 1990, 1993, 1995, 1996, 1999, 2003, 2004, 2005, 2006, 2008, 2009, 2010, 2017, 2020, 2021},
@@ -501,6 +501,7 @@ MORE_REGIONS = {
         "country": "USA",
         "primary_grapes": ["Pinot Noir", "Chardonnay"],
         "wine_style": "red",
+        "longevity": "medium",
         "vintages": _gen_vintages(
             great_years={1994, 2001, 2007, 2012, 2013, 2014, 2015, 2019},
             good_years={1990, 1991, 1995, 1996, 1997, 1999, 2002, 2004, 2005, 2006, 2008, 2009, 2010, 2016, 2017, 2018, 2020, 2021},
@@ -530,6 +531,7 @@ MORE_REGIONS = {
         "country": "USA",
         "primary_grapes": ["Pinot Noir"],
         "wine_style": "red",
+        "longevity": "medium",
         "vintages": _gen_vintages(
             great_years={2002, 2008, 2012, 2014, 2015, 2018, 2019, 2021},
             good_years={1994, 1996, 1998, 1999, 2001, 2004, 2005, 2006, 2007, 2009, 2010, 2016, 2017, 2020},
@@ -559,6 +561,7 @@ MORE_REGIONS = {
         "country": "Australia",
         "primary_grapes": ["Shiraz"],
         "wine_style": "red",
+        "longevity": "medium",
         "vintages": _gen_vintages(
             great_years={1986, 1990, 1991, 1996, 1998, 2002, 2004, 2005, 2006, 2010, 2012, 2018, 2019, 2021},
             good_years={1985, 1988, 1992, 1994, 1997, 1999, 2001, 2003, 2008, 2009, 2013, 2014, 2015, 2016, 2017, 2020, 2022},
@@ -598,6 +601,7 @@ MORE_REGIONS = {
         "country": "Germany",
         "primary_grapes": ["Riesling"],
         "wine_style": "white",
+        "longevity": "medium",
         "vintages": _gen_vintages(
             great_years={1990, 1995, 2001, 2005, 2007, 2009, 2015, 2017, 2019, 2020, 2022},
             good_years={1985, 1986, 1988, 1992, 1993, 1994, 1996, 1997, 1999, 2002, 2003, 2004, 2006, 2008, 2010, 2011, 2012, 2016, 2018, 2021},
@@ -633,6 +637,7 @@ MORE_REGIONS = {
         "country": "Portugal",
         "primary_grapes": ["Touriga Nacional", "Touriga Franca"],
         "wine_style": "fortified",
+        "longevity": "long",
         "vintages": _gen_vintages(
             great_years={1985, 1991, 1994, 1997, 2000, 2003, 2007, 2011, 2016, 2017},
             good_years={1982, 1983, 1987, 1992, 1995, 1998, 1999, 2001, 2004, 2005, 2008, 2009, 2012, 2014, 2015, 2018, 2019},
@@ -670,6 +675,7 @@ MORE_REGIONS = {
         "country": "Argentina",
         "primary_grapes": ["Malbec"],
         "wine_style": "red",
+        "longevity": "medium",
         "vintages": _gen_vintages(
             great_years={2002, 2006, 2009, 2010, 2013, 2015, 2017, 2019},
             good_years={1995, 1996, 1999, 2001, 2003, 2004, 2005, 2007, 2008, 2011, 2012, 2014, 2016, 2018, 2020, 2021},
@@ -701,6 +707,7 @@ MORE_REGIONS = {
         "country": "South Africa",
         "primary_grapes": ["Cabernet Sauvignon", "Pinotage"],
         "wine_style": "red",
+        "longevity": "medium",
         "vintages": _gen_vintages(
             great_years={2003, 2009, 2015, 2017, 2019},
             good_years={1995, 1997, 1998, 2000, 2001, 2004, 2005, 2006, 2007, 2010, 2011, 2012, 2014, 2016, 2018, 2020, 2021},
@@ -726,6 +733,7 @@ MORE_REGIONS = {
         "country": "New Zealand",
         "primary_grapes": ["Sauvignon Blanc"],
         "wine_style": "white",
+        "longevity": "short",
         "vintages": _gen_vintages(
             great_years={2006, 2010, 2013, 2015, 2019, 2020, 2022},
             good_years={1998, 2000, 2001, 2002, 2004, 2005, 2007, 2008, 2009, 2011, 2012, 2014, 2016, 2017, 2018, 2021},
@@ -754,24 +762,15 @@ MORE_REGIONS = {
 
 
 def main():
-    with open(EXISTING_PATH) as f:
-        data = json.load(f)
-
-    # Merge additional hand-curated regions
-    data["regions"].update(ADDITIONAL_REGIONS)
-    # Merge generated regions
-    data["regions"].update(MORE_REGIONS)
-
-    with open(EXISTING_PATH, "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-    print(f"Updated {EXISTING_PATH}")
-    print(f"Total regions: {len(data['regions'])}")
-    for rk in sorted(data["regions"]):
-        rv = data["regions"][rk]
-        years = sorted(rv["vintages"].keys())
+    regions = {**ADDITIONAL_REGIONS, **MORE_REGIONS}
+    changed = write_region_sources(regions)
+    print(f"Updated {len(changed)} of {len(regions)} region sources")
+    for rk in sorted(regions):
+        years = sorted(regions[rk]["vintages"].keys())
         print(f"  {rk:20s} | {len(years):3d} vintages | {years[0]}-{years[-1]}")
 
+    build()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,193 @@
+"""Generate a synthetic dataset at arbitrary scale for stress-testing the services.
+
+Writes vintage_data.json and wine_regions.geojson in the same layout as the real
+data (vintage/ and geojson/ under the output directory) plus the compiled
+snapshot, so the app can be pointed at it directly:
+
+    python data/vintage/generate_synthetic_data.py --regions 10000 --years 60 --vertices 200 -o /tmp/vintage-10k
+    VINTAGE_DATA_DIR=/tmp/vintage-10k python benchmarks/bench_endpoints.py run
+
+Scores follow the same banded scheme as _gen_vintages in complete_data.py, but each
+region draws its own great/poor years; quality tiers and drinking windows are
+derived with the same rules as build.py. Descriptions and notable-wine lists match
+the length distribution of the curated data. Output is a pure function of the
+arguments and --seed.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, "..", ".."))
+
+from app.services.compiled_data import compile_from_sources  # noqa: E402
+from app.services.data_schema import LONGEVITY_AGES, derive_region  # noqa: E402
+
+COUNTRIES = (
+    "France", "Italy", "Spain", "USA", "Australia", "Germany", "Portugal",
+    "Argentina", "South Africa", "New Zealand", "Chile", "Austria", "Greece",
+)
+# Roughly the curated mix: mostly red, some white, a few of the rest.
+STYLES = ("red",) * 10 + ("white",) * 4 + ("sparkling", "fortified", "dessert")
+GRAPES = (
+    "Cabernet Sauvignon", "Merlot", "Cabernet Franc", "Pinot Noir", "Chardonnay",
+    "Syrah", "Grenache", "Mourvedre", "Nebbiolo", "Sangiovese", "Tempranillo",
+    "Riesling", "Sauvignon Blanc", "Malbec", "Touriga Nacional", "Chenin Blanc",
+    "Gruner Veltliner", "Zinfandel", "Pinotage", "Assyrtiko",
+)
+SYLLABLES = ("val", "mon", "cor", "ri", "bel", "sa", "ta", "lo", "ver", "do", "mar", "chi", "an", "tes", "ro", "lu")
+SUFFIXES = ("Valley", "Hills", "Coast", "Highlands", "Slopes", "Plateau", "Heights", "Basin")
+ESTATES = ("Chateau", "Domaine", "Bodega", "Tenuta", "Quinta", "Weingut", "Estate", "Clos")
+
+# Sentence fragments assembled into descriptions of the curated length (median ~65 chars).
+OPENINGS = (
+    "Warm dry summer", "Cool wet spring", "Late frost", "Even flowering", "Harvest rain",
+    "A heat wave in August", "Drought conditions", "Ideal ripening weather", "Hail in July",
+)
+MIDDLES = (
+    "produced ripe concentrated fruit", "kept yields low", "preserved bright acidity",
+    "diluted the crop", "gave firm tannins", "delivered balanced wines",
+    "forced careful selection", "brought excellent phenolic ripeness",
+)
+CLOSINGS = (
+    "Built for long aging.", "Drink young.", "Best producers excelled.", "Inconsistent across the region.",
+    "A classic vintage.", "Forward and approachable.", "Widely declared.", "Few wines of note.",
+)
+
+TIER_SCORES = {
+    "outstanding": (90, 96), "excellent": (82, 89), "good": (72, 80), "average": (62, 69), "poor": (48, 58),
+}
+
+
+def _name(rng, syllables):
+    return "".join(rng.choice(SYLLABLES) for _ in range(syllables)).capitalize()
+
+
+def _description(rng):
+    text = f"{rng.choice(OPENINGS)} {rng.choice(MIDDLES)}."
+    if rng.random() < 0.6:
+        text += f" {rng.choice(CLOSINGS)}"
+    if rng.random() < 0.2:
+        text += f" {rng.choice(OPENINGS)} {rng.choice(MIDDLES)}."
+    return text
+
+
+def _gen_vintages(rng, first_year, last_year, estates):
+    """Banded scores like complete_data._gen_vintages, with region-specific band years."""
+    vintages = {}
+    for year in range(first_year, last_year + 1):
+        roll = rng.random()
+        tier = (
+            "outstanding" if roll < 0.12 else "excellent" if roll < 0.35 else
+            "good" if roll < 0.70 else "average" if roll < 0.90 else "poor"
+        )
+        low, high = TIER_SCORES[tier]
+        notable = rng.sample(estates, k=min(len(estates), rng.choice((0, 0, 1, 1, 2, 3, 5))))
+        vintages[str(year)] = {
+            "score": rng.randint(low, high),
+            "description": _description(rng),
+            "notable_wines": notable if tier != "poor" else [],
+        }
+    return vintages
+
+
+def _ring(rng, center_lng, center_lat, radius, vertices):
+    """Closed, star-shaped (so never self-intersecting) ring around the center."""
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(vertices))
+    ring = []
+    for angle in angles:
+        r = radius * rng.uniform(0.6, 1.0)
+        ring.append([
+            round(center_lng + r * math.cos(angle) / max(math.cos(math.radians(center_lat)), 0.2), 5),
+            round(center_lat + r * math.sin(angle), 5),
+        ])
+    ring.append(ring[0])
+    return ring
+
+
+def generate(regions, years, vertices, seed, first_year=1970):
+    rng = random.Random(seed)
+    last_year = first_year + years - 1
+    as_of = last_year + 3
+    vintage_regions = {}
+    features = []
+    for i in range(regions):
+        region_key = f"synthetic_{i:05d}"
+        display_name = f"{_name(rng, rng.randint(2, 3))} {rng.choice(SUFFIXES)}"
+        country = rng.choice(COUNTRIES)
+        wine_style = rng.choice(STYLES)
+        grapes = rng.sample(GRAPES, k=rng.randint(1, 3))
+        estates = [f"{rng.choice(ESTATES)} {_name(rng, 2)}" for _ in range(5)]
+        # Like the curated data, not every region's record starts in the first year.
+        region_first = first_year + rng.randint(0, years // 3)
+
+        vintage_regions[region_key] = derive_region({
+            "display_name": display_name,
+            "country": country,
+            "primary_grapes": grapes,
+            "wine_style": wine_style,
+            "longevity": rng.choice(tuple(LONGEVITY_AGES)),
+            "vintages": _gen_vintages(rng, region_first, last_year, estates),
+        }, as_of)
+        features.append({
+            "type": "Feature",
+            "properties": {
+                "region_key": region_key,
+                "display_name": display_name,
+                "country": country,
+                "wine_style": wine_style,
+                "primary_grapes": grapes,
+            },
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [_ring(rng, rng.uniform(-170, 170), rng.uniform(-55, 60),
+                                      rng.uniform(0.2, 1.5), vertices)],
+            },
+        })
+
+    vintage_data = {
+        "metadata": {
+            "last_updated": "synthetic",
+            "sources": [f"generate_synthetic_data.py seed={seed}"],
+            "drinking_window_as_of": as_of,
+            "year_range": [min(int(next(iter(r["vintages"]))) for r in vintage_regions.values()), last_year],
+        },
+        "regions": vintage_regions,
+    }
+    return vintage_data, {"type": "FeatureCollection", "features": features}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic vintage/GeoJSON dataset.")
+    parser.add_argument("--regions", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=54)
+    parser.add_argument("--first-year", type=int, default=1970)
+    parser.add_argument("--vertices", type=int, default=64, help="vertices per region polygon")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-o", "--output", required=True, help="dataset directory (not the real data dir)")
+    parser.add_argument("--no-compile", action="store_true", help="skip writing the compiled snapshot")
+    args = parser.parse_args()
+
+    vintage_data, geojson = generate(args.regions, args.years, args.vertices, args.seed, args.first_year)
+
+    vintage_path = os.path.join(args.output, "vintage", "vintage_data.json")
+    geojson_path = os.path.join(args.output, "geojson", "wine_regions.geojson")
+    for path, payload in ((vintage_path, vintage_data), (geojson_path, geojson)):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+        print(f"Wrote {path} ({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+
+    if not args.no_compile:
+        compiled_path = os.path.join(args.output, "vintage_map.snapshot")
+        version = compile_from_sources(vintage_path, geojson_path, compiled_path)
+        print(f"Wrote {compiled_path} (data version {version})")
+    print(f"{args.regions} regions x {args.years} years, {args.vertices} vertices per polygon, seed {args.seed}")
+    print(f"Serve it with VINTAGE_DATA_DIR={os.path.abspath(args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 """Rebuild wine_regions.geojson with larger polygons visible at world zoom level."""
 import json, os
 
+from compile_snapshot import main as compile_snapshot
+
 OUTPUT = os.path.join(os.path.dirname(__file__), "..", "geojson", "wine_regions.geojson")
 
 def rect(cx, cy, w, h, name, region_key, country, wine_style, grapes):
@@ -62,3 +64,5 @@ for feat in features:
     xs = [c[0] for c in coords]
     ys = [c[1] for c in coords]
     print(f"  {p['region_key']:20s} | lng {min(xs):.1f}–{max(xs):.1f} | lat {min(ys):.1f}–{max(ys):.1f}")
+
+compile_snapshot()
@@ -0,0 +1,85 @@
+"""Production gunicorn settings.
+
+    gunicorn run:app -c gunicorn.conf.py
+
+The app is imported, the data snapshot built and the hot caches warmed once in
+the master (see app/services/warmup.py), then
+`gc.freeze()` moves everything allocated so far out of the collector's reach
+before workers fork. Workers then share those pages copy-on-write instead of each
+parsing and indexing its own copy on its first request; without the freeze, the
+first collection in each worker would touch every object header and un-share them.
+"""
+import gc
+import os
+import shutil
+import tempfile
+
+_cores = os.cpu_count() or 1
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", min(2 * _cores + 1, 8)))
+# Threaded workers keep a slow client from pinning a whole process.
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+timeout = 120
+keepalive = 5
+preload_app = True
+
+# The reloader is a thread, and threads don't survive fork: keep the app from
+# starting one in the master and start one per worker in post_fork instead.
+try:
+    _reload_interval = float(os.environ.pop("DATA_RELOAD_INTERVAL", "0"))
+except ValueError:
+    _reload_interval = 0.0
+
+
+# Warm in the master (when_ready) so workers fork with loaded data and primed
+# caches; a warmup thread started by the app itself would not survive the fork.
+if os.environ.get("WARMUP") != "off":
+    os.environ["WARMUP"] = "manual"
+
+# Workers flush their metrics here so /api/metrics can sum them (app/utils/metrics.py).
+os.environ.setdefault("METRICS_DIR", os.path.join(tempfile.gettempdir(), f"vintage-map-metrics-{os.getpid()}"))
+
+
+def on_starting(server):
+    from app.utils.metrics import clear_metrics_dir
+
+    clear_metrics_dir()
+
+
+def on_exit(server):
+    shutil.rmtree(os.environ["METRICS_DIR"], ignore_errors=True)
+
+
+def when_ready(server):
+    if os.environ["WARMUP"] == "manual":
+        from app.services.warmup import warm
+
+        from flask import Flask
+
+        app = server.app.wsgi()
+        # run_asgi:app wraps the Flask app (as `.wsgi_app`); warm the Flask app itself.
+        state = warm(app if isinstance(app, Flask) else app.wsgi_app)
+        if state.ready.is_set():
+            server.log.info(f"Warmed data snapshot {state.data_version} in {state.duration_ms} ms")
+    else:
+        from app.services.vintage_service import load_data
+
+        load_data()
+    gc.collect()
+    gc.freeze()
+    server.log.info(f"Froze {gc.get_freeze_count()} objects before forking workers")
+
+
+def child_exit(server, worker):
+    from app.utils.metrics import retire_worker
+
+    retire_worker(worker.pid)
+
+
+def post_fork(server, worker):
+    if _reload_interval > 0:
+        from app.services.vintage_service import start_reloader
+
+        start_reloader(_reload_interval)
@@ -0,0 +1,262 @@
+"""Concurrent, polite HTTP fetching for source adapters, with a conditional disk cache.
+
+One `Fetcher` is shared by every source in a refresh. It holds a single pooled
+`requests.Session` (keep-alive connections are reused across pages and threads),
+runs fetches on one pool of `threads` workers (shared by every `fetch_many`
+call, so sources scraped in parallel share that bound too), and enforces
+per-host limits: at most `per_host_concurrency` requests in flight and
+`per_host_rate` started per second to any one host, however many threads are
+free. Transient failures (connection
+errors, 429 and 5xx) are retried with backoff, honouring Retry-After.
+
+Every 200 response is stored in `cache_dir` together with its ETag and
+Last-Modified. The next fetch of the same URL sends If-None-Match /
+If-Modified-Since, and a 304 is answered from disk, so a re-scrape only
+downloads pages that changed. `max_age` skips the network entirely for entries
+checked that recently, for iterating on a parser without touching the sites.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+log = logging.getLogger(__name__)
+
+USER_AGENT = "vintage-map-scraper/1.0"
+DEFAULT_THREADS = 16
+DEFAULT_PER_HOST_CONCURRENCY = 4
+DEFAULT_PER_HOST_RATE = 2.0  # requests started per second, per host
+DEFAULT_TIMEOUT = 30
+
+
+class FetchError(Exception):
+    """A page could not be fetched, after retries."""
+
+
+class FetchResult(NamedTuple):
+    url: str
+    body: bytes
+    encoding: Optional[str]
+    from_cache: bool    # body came from disk (304 revalidation or within max_age)
+    checked_at: float   # when the body was last downloaded or revalidated
+
+    @property
+    def text(self):
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+
+class DiskCache:
+    """Response bodies plus validators, one `<key>.body`/`<key>.json` pair per URL.
+
+    Files are written to a temp name and renamed into place, so a crashed or
+    concurrent run never leaves a body that doesn't match its metadata.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode()).hexdigest()
+        base = os.path.join(self.directory, urlsplit(url).hostname or "_", key[:2], key)
+        return f"{base}.json", f"{base}.body"
+
+    def get(self, url):
+        """(metadata, body) for `url`, or None when not cached or unreadable."""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or meta.get("sha256") != hashlib.sha256(body).hexdigest():
+            return None
+        return meta, body
+
+    def put(self, url, body, etag, last_modified, encoding, checked_at):
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": encoding,
+            "checked_at": checked_at,
+            "sha256": hashlib.sha256(body).hexdigest(),
+        }
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(body_path + suffix, "wb") as f:
+            f.write(body)
+        os.replace(body_path + suffix, body_path)
+        with open(meta_path + suffix, "w") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + suffix, meta_path)
+
+    def touch(self, url, meta):
+        """Record a successful revalidation without rewriting the body."""
+        meta_path, _ = self._paths(url)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(meta_path + suffix, "w") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + suffix, meta_path)
+
+
+class _HostLimiter:
+    """Caps concurrency and start rate for one host."""
+
+    def __init__(self, concurrency, rate):
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def __enter__(self):
+        self._slots.acquire()
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+    def __exit__(self, *exc):
+        self._slots.release()
+
+
+class Fetcher:
+    def __init__(self, cache_dir, threads=DEFAULT_THREADS, per_host_concurrency=DEFAULT_PER_HOST_CONCURRENCY,
+                 per_host_rate=DEFAULT_PER_HOST_RATE, timeout=DEFAULT_TIMEOUT, retries=3, max_age=0.0):
+        self.cache = DiskCache(cache_dir)
+        self.threads = threads
+        self.timeout = timeout
+        self.max_age = max_age
+        self._per_host = (per_host_concurrency, per_host_rate)
+        self._limiters = {}
+        self._limiters_lock = threading.Lock()
+
+        retry = Retry(
+            total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",), respect_retry_after_header=True, raise_on_status=False,
+        )
+        # One connection per thread is enough; pool_block keeps it from opening more.
+        adapter = HTTPAdapter(pool_connections=threads, pool_maxsize=threads, pool_block=True, max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.stats = {"downloaded": 0, "revalidated": 0, "fresh": 0, "failed": 0}
+        self._stats_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="fetch")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._pool.shutdown(cancel_futures=True)
+        self.session.close()
+
+    def _limiter(self, url):
+        host = urlsplit(url).netloc
+        with self._limiters_lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = _HostLimiter(*self._per_host)
+            return limiter
+
+    def _count(self, outcome):
+        with self._stats_lock:
+            self.stats[outcome] += 1
+
+    def fetch(self, url):
+        """FetchResult for `url`, from disk when unchanged. Raises FetchError."""
+        cached = self.cache.get(url)
+        if cached is not None and self.max_age > 0 and time.time() - cached[0]["checked_at"] < self.max_age:
+            self._count("fresh")
+            meta, body = cached
+            return FetchResult(url, body, meta["encoding"], True, meta["checked_at"])
+
+        headers = {}
+        if cached is not None:
+            meta = cached[0]
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            with self._limiter(url):
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            self._count("failed")
+            raise FetchError(f"{url}: {e}") from e
+
+        if response.status_code == 304 and cached is not None:
+            meta, body = cached
+            checked_at = time.time()
+            self.cache.touch(url, {**meta, "checked_at": checked_at})
+            self._count("revalidated")
+            return FetchResult(url, body, meta["encoding"], True, checked_at)
+        if response.status_code != 200:
+            self._count("failed")
+            raise FetchError(f"{url}: HTTP {response.status_code}")
+
+        checked_at = time.time()
+        body = response.content
+        encoding = response.encoding
+        self.cache.put(
+            url, body, response.headers.get("ETag"), response.headers.get("Last-Modified"), encoding, checked_at,
+        )
+        self._count("downloaded")
+        return FetchResult(url, body, encoding, False, checked_at)
+
+    def fetch_many(self, urls):
+        """Fetch `urls` concurrently on the shared pool. Yields (url, FetchResult or
+        FetchError) in input order.
+
+        Each host gets at most `per_host_concurrency` tasks, each working through
+        that host's URLs in turn, so pool threads never sit blocked behind one
+        host's limit while pages for other hosts wait in the queue.
+        """
+        urls = list(dict.fromkeys(urls))
+        results = {url: Future() for url in urls}
+        by_host = {}
+        for url in urls:
+            by_host.setdefault(urlsplit(url).netloc, deque()).append(url)
+        stop = threading.Event()
+
+        def drain(queue):
+            while not stop.is_set():
+                try:
+                    url = queue.popleft()
+                except IndexError:
+                    return
+                try:
+                    results[url].set_result(self.fetch(url))
+                except FetchError as e:
+                    log.warning(str(e))
+                    results[url].set_result(e)
+                except BaseException as e:
+                    results[url].set_exception(e)
+
+        for queue in by_host.values():
+            for _ in range(min(self._per_host[0], len(queue))):
+                self._pool.submit(drain, queue)
+        try:
+            for url in urls:
+                yield url, results[url].result()
+        finally:
+            stop.set()
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+
+class Source(ABC):
+    """A site that publishes vintage ratings.
+
+    Subclasses list the pages to fetch and turn each fetched page into records;
+    scraper/refresh.py does the fetching, for every source at once, through one
+    shared `Fetcher`. A source whose page list depends on an index page (pagination,
+    per-region links) overrides `scrape` and fetches in two rounds.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def urls(self):
+        """Absolute URLs of the pages holding this source's ratings."""
+
+    @abstractmethod
+    def parse(self, result):
+        """Records from one fetched page (a FetchResult): a list of dicts with at
+        least `region_key`, `year` and `score`."""
+
+    def scrape(self, fetcher):
+        """(records, failed urls) for the whole source."""
+        records, failed = [], []
+        for url, result in fetcher.fetch_many(self.urls()):
+            if isinstance(result, Exception):
+                failed.append(url)
+            else:
+                records.extend(self.parse(result))
+        return records, failed
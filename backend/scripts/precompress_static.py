@@ -0,0 +1,49 @@
+"""Write .gz and .br siblings for the built frontend assets so Flask can serve them
+without compressing per request.
+
+    python scripts/precompress_static.py [static_dir]
+"""
+import gzip
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, ".."))
+
+from app.utils.compression import MIN_COMPRESS_SIZE, brotli  # noqa: E402
+
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".svg", ".json", ".map", ".txt", ".xml", ".webmanifest"}
+
+
+def precompress(static_dir):
+    written = 0
+    for root, _, files in os.walk(static_dir):
+        for name in files:
+            if os.path.splitext(name)[1] not in COMPRESSIBLE:
+                continue
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                body = f.read()
+            if len(body) < MIN_COMPRESS_SIZE:
+                continue
+            variants = {".gz": gzip.compress(body, compresslevel=9, mtime=0)}
+            if brotli is not None:
+                variants[".br"] = brotli.compress(body, quality=11)
+            for suffix, data in variants.items():
+                if len(data) < len(body):
+                    with open(path + suffix, "wb") as f:
+                        f.write(data)
+                    written += 1
+    return written
+
+
+def main():
+    static_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(SCRIPT_DIR, "..", "static")
+    written = precompress(static_dir)
+    print(f"Wrote {written} precompressed files under {os.path.normpath(static_dir)}")
+    if brotli is None:
+        print("brotli is not installed; only .gz files were written")
+
+
+if __name__ == "__main__":
+    main()
@@ -107,10 +107,10 @@ function FitWorld({ trigger }: { trigger: number | null }) {
 function drinkingWindowText(dw: string): string {
   const map: Record<string, string> = {
     young:     "🟢 Drink Now: Still Young",
+    ready:     "🍇 Ready: Drink or Hold",
     at_peak:   "⭐ At Peak: Best Time to Drink",
     mature:    "🍂 Mature: Still Enjoyable",
     past_peak: "⚠️ Past Peak",
-    cellaring: "🕐 Needs More Cellaring",
   };
   return map[dw] || dw.replace(/_/g, " ");
 }